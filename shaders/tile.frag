@@ -1,19 +1,53 @@
 #version 150 core
 
-// Make sure you offset your texture coordinates with 1/2 pixel, because in OpenGL the texel origin are defined to be the bottom left corner of a texel.
-// That means that the exact center of a texel is located at [S'+0.5, T'+0.5] where S' and T' are the unnormalized texture coordinates.
-// https://www.reddit.com/r/opengl/comments/6h7rkl/comment/diwo35x/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button
+// Renders a whole tile layer on a single quad, by looking up the tile index of each fragment in an index texture
+// and then the tile texel in a tile sheet holding all tiles of the tileset.
 
-in vec4 vertex_colors;
-in vec3 texture_coords;
-uniform sampler2D tex;
+in vec2 world_position;
+in vec2 map_position;
 out vec4 final_color;
 
-void main(){
-    ivec2 texSize = textureSize(tex, 0);
-    float x_offset = (1.0 / (float(texSize.x))) * 0.5;
-    float y_offset = (1.0 / (float(texSize.y))) * 0.5;
-    vec2 tc_final = vec2(texture_coords.x + x_offset, texture_coords.y + y_offset);
-    // final_color = texture(tex, tc_final);
-    final_color = vec4(0xFF, 0x00, 0x00, 0xFF);
-}
\ No newline at end of file
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+// Tile indices of the layer, one texel per tile, with the top row of the map first.
+// Negative indices mark empty tiles.
+uniform isampler2D tile_indices;
+
+// All tiles of the tileset, laid out in rows of [sheet_columns] tiles starting from the bottom left corner.
+uniform sampler2D tile_sheet;
+uniform int sheet_columns;
+
+uniform ivec2 tile_size;
+
+// Vertical position of the layer in world space and depth offset of its tiles.
+uniform float origin_y;
+uniform float z_offset;
+
+void main() {
+    ivec2 map_size = textureSize(tile_indices, 0);
+
+    // Tile the fragment lies in, counting rows from the bottom.
+    ivec2 map_texel = ivec2(floor(map_position));
+    ivec2 tile = map_texel / tile_size;
+
+    int index = texelFetch(tile_indices, ivec2(tile.x, map_size.y - 1 - tile.y), 0).r;
+    if (index < 0) {
+        discard;
+    }
+
+    ivec2 sheet_tile = ivec2(index % sheet_columns, index / sheet_columns);
+    final_color = texelFetch(tile_sheet, sheet_tile * tile_size + map_texel - tile * tile_size, 0);
+
+    // No GL_ALPHA_TEST in core, use shader to discard.
+    if (final_color.a < 0.01) {
+        discard;
+    }
+
+    // Every tile is depth sorted by its bottom edge, just like tile sprites are.
+    float z = trunc(-(origin_y + float(tile.y * tile_size.y) + z_offset));
+    vec4 clip_position = window.projection * window.view * vec4(world_position, z, 1.0);
+    gl_FragDepth = (clip_position.z / clip_position.w) * 0.5 + 0.5;
+}
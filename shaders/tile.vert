@@ -0,0 +1,22 @@
+#version 150 core
+
+// Position in world space, as drawn.
+in vec2 position;
+
+// Position in map space, in unscaled pixels from the bottom left corner of the map.
+in vec2 map_coords;
+
+out vec2 world_position;
+out vec2 map_position;
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+void main() {
+    gl_Position = window.projection * window.view * vec4(position, 0.0, 1.0);
+
+    world_position = position;
+    map_position = map_coords;
+}
@@ -0,0 +1,61 @@
+import pyglet
+
+from amonite.animation import Animation
+
+from texture_atlas import TextureAtlas
+
+class AnimationLibrary:
+    """
+    Shared animations, loaded once per definition file.
+    Frames are swapped for the baked atlas ones when available, so that animations share as few textures as possible.
+    Only animation references are cached: textures are owned by the atlases and pyglet's resource loader, which keep them
+    alive regardless of this cache.
+    """
+
+    __animations: dict[str, Animation] = {}
+
+    @staticmethod
+    def get(source: str) -> Animation:
+        """
+        Returns the animation defined by the [source] json file, relative to the assets directory.
+        """
+
+        animation: Animation | None = AnimationLibrary.__animations.get(source)
+
+        if animation is None:
+            animation = AnimationLibrary.__load(source = source)
+            AnimationLibrary.__animations[source] = animation
+
+        return animation
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Drops all cached animations.
+        """
+
+        AnimationLibrary.__animations.clear()
+
+    @staticmethod
+    def __load(source: str) -> Animation:
+        # Let amonite read, check and anchor the animation first.
+        animation: Animation = Animation(source = source)
+
+        frames: pyglet.image.Animation | None = TextureAtlas.get_animation(
+            path = animation.source_data["path"],
+            rows = animation.source_data.get("rows"),
+            columns = animation.source_data.get("columns")
+        )
+
+        if frames is None or len(frames.frames) != len(animation.content.frames):
+            return animation
+
+        # Atlas frames take the anchors and durations amonite set on the source ones.
+        for frame, source_frame in zip(frames.frames, animation.content.frames):
+            frame.image.anchor_x = source_frame.image.anchor_x
+            frame.image.anchor_y = source_frame.image.anchor_y
+            frame.duration = source_frame.duration
+
+        animation.content = frames
+
+        return animation
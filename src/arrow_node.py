@@ -22,56 +22,74 @@ class ArrowStates(str, Enum):
 class ArrowNode(PositionNode):
     """
     Arrow projectile class.
+    Arrows are meant to be reused: they're created inactive (hidden and with no registered collider),
+    activated by [fire] and deactivated again as soon as they hit something or leave the scene.
+
+    Parameters
+    ----------
+    animations: list[Animation]
+        Animations to build the arrow sprites from, one sprite per animation. These can be shared across arrows.
+    batch: Optional[pyglet.graphics.Batch]
+        Batch to render the arrow in.
     """
 
     def __init__(
         self,
-        x: float = 0.0,
-        y: float = 0.0,
-        z: float = 0.0,
-        direction: float = 0.0,
-        speed: float = 0.0,
+        animations: list[Animation],
         batch: Optional[pyglet.graphics.Batch] = None
     ) -> None:
-        super().__init__(x, y, z)
+        super().__init__()
 
         self.batch: Optional[pyglet.graphics.Batch] = batch
 
-        self.direction: float = direction
-        self.speed: float = speed
+        self.direction: float = 0.0
+        self.speed: float = 0.0
+
+        # Tells whether the arrow is flying or waiting to be fired.
+        self.active: bool = False
 
         # Sprite distance, defines the distance at which the sprite floats.
         self.sprite_distance: float = 1.0
 
         # Animation handlers.
-        self.animations: list[Animation] = [
-            Animation(source = "sprites/scope/scope_load_0.json"),
-            Animation(source = "sprites/scope/scope_load_0.json"),
-            Animation(source = "sprites/scope/scope_load_1.json"),
-            Animation(source = "sprites/scope/scope_load_2.json"),
-            Animation(source = "sprites/scope/scope_load_3.json"),
-            Animation(source = "sprites/scope/scope_load_4.json")
-        ]
+        self.animations: list[Animation] = animations
 
         # Distance between each sprite.
         self.sprites_delta: float = 1.5
 
+        # Position before the last update, used to interpolate sprites.
+        self.__previous_position: tuple[float, float] = (0.0, 0.0)
+
         # Create sprites.
         self.sprites: list[SpriteNode] = []
         for animation in self.animations:
             self.sprites.append(
                 SpriteNode(
                     resource = animation.content,
-                    x = x,
-                    y = y,
                     batch = batch
                 )
             )
+            self.sprites[-1].sprite.visible = False
+
+        # Collider shape while flying.
+        self.__active_shape: CollisionRect = CollisionRect(
+            anchor_x = 2,
+            anchor_y = 2,
+            width = 4,
+            height = 4,
+            batch = batch
+        )
+
+        # Collider shape while inactive, out of the batch so that no debug shape is drawn for arrows waiting to be fired.
+        self.__inactive_shape: CollisionRect = CollisionRect(
+            anchor_x = 2,
+            anchor_y = 2,
+            width = 4,
+            height = 4
+        )
 
         # Collider.
         self.__collider = CollisionNode(
-            x = x,
-            y = y,
             sensor = True,
             collision_type = CollisionType.DYNAMIC,
             active_tags = [
@@ -79,17 +97,9 @@ class ArrowNode(PositionNode):
                 collision_tags.DAMAGE
             ],
             on_triggered = self.on_collision,
-            shape = CollisionRect(
-                x = x,
-                y = y,
-                anchor_x = 2,
-                anchor_y = 2,
-                width = 4,
-                height = 4,
-                batch = batch
-            )
+            shape = self.__active_shape
         )
-        controllers.COLLISION_CONTROLLER.add_collider(self.__collider)
+        self.__collider.shape = self.__inactive_shape
 
         # State machine.
         self.__state_machine = StateMachine(
@@ -100,15 +110,87 @@ class ArrowNode(PositionNode):
             }
         )
 
+    def fire(
+        self,
+        x: float,
+        y: float,
+        direction: float,
+        speed: float
+    ) -> None:
+        """
+        Activates the arrow, shooting it from the given position in [direction] at [speed].
+        """
+
+        if self.active:
+            self.release()
+
+        self.direction = direction
+        self.speed = speed
+        self.active = True
+
+        self.__collider.shape = self.__active_shape
+        self.__collider.set_position((x, y))
+        controllers.COLLISION_CONTROLLER.add_collider(self.__collider)
+
+        self.set_position((x, y))
+        self.__previous_position = (x, y)
+        for sprite in self.sprites:
+            sprite.sprite.visible = True
+
+        self.__state_machine.set_state(ArrowStates.FLY)
+
+    def release(self) -> None:
+        """
+        Deactivates the arrow, hiding it and removing its collider, so that it can be fired again.
+        """
+
+        if not self.active:
+            return
+
+        self.active = False
+
+        controllers.COLLISION_CONTROLLER.remove_collider(self.__collider)
+
+        # Forget any pending movement or collision.
+        self.__collider.set_velocity((0.0, 0.0))
+        self.__collider.collisions.clear()
+        self.__collider.in_collisions.clear()
+        self.__collider.out_collisions.clear()
+        self.__collider.shape = self.__inactive_shape
+
+        for sprite in self.sprites:
+            sprite.sprite.visible = False
+
     def update(self, dt: float) -> None:
+        if not self.active:
+            return
+
         super().update(dt)
 
         self.__state_machine.update(dt = dt)
 
+        # The arrow could have been released by the state machine.
+        if not self.active:
+            return
+
         collider_position: tuple[float, float] = self.__collider.get_position()
 
+        self.__previous_position = (self.x, self.y)
         self.set_position(collider_position)
 
+    def interpolate(self, alpha: float) -> None:
+        """
+        Places sprites at [alpha] (between 0 and 1) of the way from the previous position to the current one.
+        """
+
+        if not self.active or self.__previous_position == (self.x, self.y):
+            return
+
+        self.__place_sprites(position = (
+            self.__previous_position[0] + (self.x - self.__previous_position[0]) * alpha,
+            self.__previous_position[1] + (self.y - self.__previous_position[1]) * alpha
+        ))
+
     def set_velocity(self, velocity: tuple[float, float]) -> None:
         self.__collider.set_velocity(velocity = velocity)
 
@@ -119,6 +201,9 @@ class ArrowNode(PositionNode):
     ) -> None:
         super().set_position(position = position, z = z)
 
+        self.__place_sprites(position = position)
+
+    def __place_sprites(self, position: tuple[float, float]) -> None:
         aim_vec: pyglet.math.Vec2 = pyglet.math.Vec2.from_polar(self.sprite_distance, self.direction)
         for index, sprite in enumerate(self.sprites):
                 sprite.set_position(
@@ -133,17 +218,16 @@ class ArrowNode(PositionNode):
         self.__state_machine.on_collision(tags = tags, enter = enter)
 
     def delete(self) -> None:
-        controllers.COLLISION_CONTROLLER.remove_collider(self.__collider)
+        self.release()
+
+        # The collider only deletes the shape it's using.
         self.__collider.delete()
+        self.__active_shape.delete()
 
         for sprite in self.sprites:
             sprite.delete()
         self.sprites.clear()
 
-        # Remove from the current scene.
-        if uniques.ACTIVE_SCENE is not None:
-            uniques.ACTIVE_SCENE.remove_child(self)
-
 class ArrowState(State):
     def __init__(
         self,
@@ -190,8 +274,8 @@ class ArrowFlyState(ArrowState):
 
 class ArrowHitState(ArrowState):
     def start(self) -> None:
-        self.actor.delete()
+        self.actor.release()
 
 class ArrowOutState(ArrowState):
     def start(self) -> None:
-        self.actor.delete()
\ No newline at end of file
+        self.actor.release()
\ No newline at end of file
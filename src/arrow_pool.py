@@ -0,0 +1,96 @@
+from typing import Optional
+import pyglet
+
+from amonite.animation import Animation
+from amonite.node import Node
+
+from animation_library import AnimationLibrary
+from arrow_node import ArrowNode
+from constants import uniques
+
+# Number of arrows allocated by default for each scene.
+ARROW_POOL_SIZE: int = 16
+
+# Animation files used by each arrow, one sprite each.
+ARROW_ANIMATION_SOURCES: list[str] = [
+    "sprites/scope/scope_load_0.json",
+    "sprites/scope/scope_load_0.json",
+    "sprites/scope/scope_load_1.json",
+    "sprites/scope/scope_load_2.json",
+    "sprites/scope/scope_load_3.json",
+    "sprites/scope/scope_load_4.json"
+]
+
+class ArrowPool(Node):
+    """
+    Fixed set of arrows, allocated once per scene and reused for every shot.
+    Arrow animations are fetched from the animation library, so they're shared by all arrows of all pools.
+    When every arrow is flying, the oldest one is recycled.
+    """
+
+    def __init__(
+        self,
+        size: int = ARROW_POOL_SIZE,
+        batch: Optional[pyglet.graphics.Batch] = None
+    ) -> None:
+        super().__init__()
+
+        animations: list[Animation] = [AnimationLibrary.get(source = source) for source in ARROW_ANIMATION_SOURCES]
+        self.arrows: list[ArrowNode] = [
+            ArrowNode(
+                animations = animations,
+                batch = batch
+            ) for _ in range(size)
+        ]
+
+        # Index to start looking for an inactive arrow from. Arrows are fired in turns, so this is usually the oldest one.
+        self.__next: int = 0
+
+    def fire(
+        self,
+        x: float,
+        y: float,
+        direction: float,
+        speed: float
+    ) -> ArrowNode:
+        """
+        Shoots an arrow from the given position in [direction] at [speed], returning it.
+        """
+
+        arrows_num: int = len(self.arrows)
+
+        # Pick the first inactive arrow, falling back to the oldest one.
+        index: int = self.__next
+        for offset in range(arrows_num):
+            if not self.arrows[(self.__next + offset) % arrows_num].active:
+                index = (self.__next + offset) % arrows_num
+                break
+
+        self.__next = (index + 1) % arrows_num
+
+        arrow: ArrowNode = self.arrows[index]
+        arrow.fire(
+            x = x,
+            y = y,
+            direction = direction,
+            speed = speed
+        )
+
+        return arrow
+
+    def update(self, dt: float) -> None:
+        with uniques.PROFILER.scope("arrows"):
+            for arrow in self.arrows:
+                if arrow.active:
+                    arrow.update(dt = dt)
+
+    def interpolate(self, alpha: float) -> None:
+        for arrow in self.arrows:
+            if arrow.active:
+                arrow.interpolate(alpha = alpha)
+
+    def delete(self) -> None:
+        for arrow in self.arrows:
+            arrow.delete()
+
+        self.arrows.clear()
@@ -0,0 +1,236 @@
+import argparse
+import glob
+import json
+import os
+import time
+import pyglet
+
+# Images are only decoded and encoded, so no GL context is needed.
+if __name__ == "__main__":
+    pyglet.options["shadow_window"] = False
+
+from texture_atlas import ATLAS_INDEX_NAME, ATLAS_INDEX_VERSION, ATLASES_DIR
+
+# Default atlas side, in pixels.
+DEFAULT_ATLAS_SIZE: int = 1024
+
+# Default frame duration for spritesheets, same as the one used when loading animations.
+SPRITESHEET_FRAME_DURATION: float = 0.1
+
+# Empty space left around every frame, in pixels.
+FRAME_PADDING: int = 1
+
+class AtlasFrame:
+    """
+    Single decoded frame, waiting to be packed.
+    """
+
+    __slots__ = (
+        "width",
+        "height",
+        "data",
+        "atlas",
+        "x",
+        "y"
+    )
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        data: bytes
+    ) -> None:
+        self.width: int = width
+        self.height: int = height
+
+        # RGBA pixels, bottom row first.
+        self.data: bytes = data
+
+        # Packed location.
+        self.atlas: int = 0
+        self.x: int = 0
+        self.y: int = 0
+
+def collect_sources(assets_dir: str) -> dict[str, tuple[int | None, int | None]]:
+    """
+    Returns all images referenced by idle prop and animation definition files, along with the grid they should be split in.
+    """
+
+    sources: dict[str, tuple[int | None, int | None]] = {}
+
+    # Idle props animations are always gifs.
+    for definition_path in sorted(glob.glob(os.path.join(assets_dir, "idle_prop", "rughai", "*.json"))):
+        with open(file = definition_path, mode = "r", encoding = "UTF8") as definition_file:
+            definition: dict = json.load(definition_file)
+
+        for anim_spec in definition.get("animation_specs", []):
+            if "path" in anim_spec:
+                sources[anim_spec["path"]] = (None, None)
+
+    # Animation definitions, either gifs or spritesheets.
+    for definition_path in sorted(glob.glob(os.path.join(assets_dir, "sprites", "**", "*.json"), recursive = True)):
+        with open(file = definition_path, mode = "r", encoding = "UTF8") as definition_file:
+            definition: dict = json.load(definition_file)
+
+        if "path" not in definition:
+            continue
+
+        if definition["path"].endswith(".gif"):
+            sources[definition["path"]] = (None, None)
+        else:
+            sources[definition["path"]] = (definition.get("rows", 1), definition.get("columns", 1))
+
+    return sources
+
+def read_frames(
+    assets_dir: str,
+    path: str,
+    rows: int | None,
+    columns: int | None
+) -> list[tuple[pyglet.image.ImageData, float | None]]:
+    """
+    Decodes all frames of the image at [path], along with their durations.
+    """
+
+    source_path: str = os.path.join(assets_dir, path)
+
+    if path.endswith(".gif"):
+        animation: pyglet.image.Animation = pyglet.image.load_animation(source_path)
+        return [(frame.image.get_image_data(), frame.duration) for frame in animation.frames]
+
+    image_grid = pyglet.image.ImageGrid(pyglet.image.load(source_path), rows = rows or 1, columns = columns or 1)
+    return [(item.get_image_data(), SPRITESHEET_FRAME_DURATION) for item in image_grid]
+
+def pack_frames(
+    frames: list[AtlasFrame],
+    size: int
+) -> int:
+    """
+    Packs all [frames] in shelves in as few [size] x [size] atlases as possible, tallest frames first.
+    Returns the amount of atlases used.
+    """
+
+    atlases_num: int = 0
+    x: int = 0
+    y: int = 0
+    shelf_height: int = 0
+
+    for frame in sorted(frames, key = lambda frame: (frame.height, frame.width), reverse = True):
+        width: int = frame.width + FRAME_PADDING * 2
+        height: int = frame.height + FRAME_PADDING * 2
+
+        if width > size or height > size:
+            raise ValueError(f"Frame of size {frame.width}x{frame.height} does not fit in a {size}x{size} atlas")
+
+        # Start a new shelf if the current one is full.
+        if x + width > size:
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+
+        # Start a new atlas if there's no more room for shelves.
+        if atlases_num == 0 or y + height > size:
+            atlases_num += 1
+            x = 0
+            y = 0
+            shelf_height = 0
+
+        frame.atlas = atlases_num - 1
+        frame.x = x + FRAME_PADDING
+        frame.y = y + FRAME_PADDING
+
+        x += width
+        shelf_height = max(shelf_height, height)
+
+    return atlases_num
+
+def build_atlases(
+    assets_dir: str,
+    size: int = DEFAULT_ATLAS_SIZE
+) -> str:
+    """
+    Bakes all animation frames referenced in [assets_dir] into [size] x [size] atlases, then writes the frame index.
+    Returns the path to the frame index.
+    """
+
+    dest_dir: str = os.path.join(assets_dir, ATLASES_DIR)
+    os.makedirs(dest_dir, exist_ok = True)
+
+    # Identical frames are only packed once.
+    unique_frames: dict[tuple[int, int, bytes], AtlasFrame] = {}
+    images: dict[str, tuple[dict, list[tuple[AtlasFrame, float | None]]]] = {}
+
+    for path, (rows, columns) in collect_sources(assets_dir = assets_dir).items():
+        source_path: str = os.path.join(assets_dir, path)
+        if not os.path.exists(source_path):
+            print(f"Skipping missing image {path}")
+            continue
+
+        image_frames: list[tuple[AtlasFrame, float | None]] = []
+        for image_data, duration in read_frames(assets_dir = assets_dir, path = path, rows = rows, columns = columns):
+            data: bytes = image_data.get_data("RGBA", image_data.width * 4)
+            key: tuple[int, int, bytes] = (image_data.width, image_data.height, data)
+
+            if key not in unique_frames:
+                unique_frames[key] = AtlasFrame(width = image_data.width, height = image_data.height, data = data)
+
+            image_frames.append((unique_frames[key], duration))
+
+        images[path] = (
+            {
+                "mtime_ns": os.stat(source_path).st_mtime_ns,
+                "rows": rows,
+                "columns": columns
+            },
+            image_frames
+        )
+
+    atlases_num: int = pack_frames(frames = list(unique_frames.values()), size = size)
+
+    # Blit frames row by row.
+    pixels: list[bytearray] = [bytearray(size * size * 4) for _ in range(atlases_num)]
+    for frame in unique_frames.values():
+        row_size: int = frame.width * 4
+        for row in range(frame.height):
+            offset: int = ((frame.y + row) * size + frame.x) * 4
+            pixels[frame.atlas][offset:offset + row_size] = frame.data[row * row_size:(row + 1) * row_size]
+
+    # Remove atlases left from previous builds.
+    for file_name in os.listdir(dest_dir):
+        if file_name.startswith("atlas_") and file_name.endswith(".png"):
+            os.remove(os.path.join(dest_dir, file_name))
+
+    atlases: list[str] = []
+    for index, atlas_pixels in enumerate(pixels):
+        atlas_name: str = f"atlas_{index}.png"
+        pyglet.image.ImageData(size, size, "RGBA", bytes(atlas_pixels)).save(os.path.join(dest_dir, atlas_name))
+        atlases.append(atlas_name)
+
+    index_path: str = os.path.join(dest_dir, ATLAS_INDEX_NAME)
+    with open(file = index_path, mode = "w", encoding = "UTF8") as index_file:
+        json.dump(
+            {
+                "version": ATLAS_INDEX_VERSION,
+                "atlases": atlases,
+                "images": {
+                    path: {
+                        **image,
+                        "frames": [[frame.atlas, frame.x, frame.y, frame.width, frame.height, duration] for frame, duration in frames]
+                    } for path, (image, frames) in images.items()
+                }
+            },
+            index_file
+        )
+
+    print(f"Packed {len(unique_frames)} unique frames from {len(images)} images in {atlases_num} atlases")
+
+    return index_path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Bakes all idle prop and animation frames into a few texture atlases, plus a frame index.")
+    parser.add_argument("--size", type = int, default = DEFAULT_ATLAS_SIZE, help = f"atlas side in pixels, defaults to {DEFAULT_ATLAS_SIZE}")
+    args = parser.parse_args()
+
+    start_time: float = time.perf_counter()
+    index_path: str = build_atlases(assets_dir = f"{os.path.dirname(__file__)}/../assets", size = args.size)
+    print(f"Wrote {index_path} in {(time.perf_counter() - start_time) * 1000:.2f}ms")
@@ -125,6 +125,14 @@ class BatteryNode(PropNode):
             self.__in_transition = True
             self.sprite.set_image(self.__open_image if enable else self.__close_image)
 
+    def sleep(self) -> None:
+        super().sleep()
+        self.sprite.sprite.paused = True
+
+    def wake(self) -> None:
+        super().wake()
+        self.sprite.sprite.paused = False
+
     def update(self, dt: int) -> None:
         super().update(dt = dt)
 
@@ -1,51 +1,140 @@
 import random
 from typing import Optional
+import numpy as np
 import pyglet
 
 from amonite.node import Node
 from amonite.scene_node import Bounds
-from amonite.utils.utils import rect_rect_check
+from amonite.sprite_node import SpriteNode
+from amonite.settings import GLOBALS, SETTINGS, Keys
 
-from cloud_node import CloudNode
+from constants import uniques
+from shader_library import ShaderLibrary
+
+# Cloud transparency, shared by all clouds.
+CLOUD_ALPHA: float = 0.25
+
+# Horizontal cloud speed.
+CLOUD_SPEED: float = 5.0
+
+# Number of available cloud sprites.
+CLOUD_SPRITES_NUM: int = 8
 
 class CloudsNode(Node):
+    """
+    Set of clouds drifting over the scene, wrapping around [bounds].
+    Cloud positions and sizes are stored as arrays, so that all clouds are moved and respawned in a single vectorized step:
+    sprites are then only written back when their on-screen pixel changes.
+    """
+
     def __init__(
         self,
         bounds: Bounds,
-        batch: Optional[pyglet.graphics.Batch] = None
+        batch: Optional[pyglet.graphics.Batch] = None,
+        clouds_num: int = 25
     ) -> None:
         super().__init__()
 
-        self.clouds_num = 25
+        self.clouds_num: int = clouds_num
+
+        self.bounds: Bounds = bounds
+
+        # Seed from the global generator, so that seeded runs stay repeatable.
+        self.__rng: np.random.Generator = np.random.default_rng(random.getrandbits(64))
+
+        self.z: float = SETTINGS[Keys.LAYERS_Z_SPACING]
+
+        # Create cloud sprites.
+        self.sprites: list[SpriteNode] = [self.__create_sprite(batch = batch) for _ in range(self.clouds_num)]
+
+        # Cloud sizes, sprites are centered so positions are cloud centers.
+        self.widths: np.ndarray = np.array([sprite.sprite.image.width for sprite in self.sprites], dtype = np.float64)
+        self.heights: np.ndarray = np.array([sprite.sprite.image.height for sprite in self.sprites], dtype = np.float64)
+        self.__anchors_x: np.ndarray = np.array([sprite.sprite.image.anchor_x for sprite in self.sprites], dtype = np.float64)
+        self.__anchors_y: np.ndarray = np.array([sprite.sprite.image.anchor_y for sprite in self.sprites], dtype = np.float64)
+
+        # Cloud positions.
+        self.xs: np.ndarray = bounds.left + self.__rng.random(self.clouds_num) * (bounds.right - bounds.left)
+        self.ys: np.ndarray = bounds.bottom + self.__rng.random(self.clouds_num) * (bounds.top - bounds.bottom)
+
+        # Last on-screen pixel each sprite was written at.
+        self.__pixels_x: np.ndarray = np.full(self.clouds_num, np.iinfo(np.int64).min, dtype = np.int64)
+        self.__pixels_y: np.ndarray = np.full(self.clouds_num, np.iinfo(np.int64).min, dtype = np.int64)
 
-        self.bounds = bounds
+        self.__write_sprites()
 
-        # Create clouds.
-        self.clouds: list[CloudNode] = [
-            CloudNode(
-                x = bounds.left + random.random() * (bounds.right - bounds.left),
-                y = bounds.bottom + random.random() * (bounds.top - bounds.bottom),
-                batch = batch
-            ) for _ in range(self.clouds_num)
-        ]
+    def __create_sprite(self, batch: Optional[pyglet.graphics.Batch]) -> SpriteNode:
+        # Pick a random cloud sprite.
+        image = pyglet.resource.image(f"sprites/clouds/cloud_{random.randint(0, CLOUD_SPRITES_NUM - 1)}.png")
+        # Center sprite.
+        image.anchor_x = int(image.width / 2)
+        image.anchor_y = int(image.height / 2)
+
+        # Fetch the shared alpha blending program.
+        sprite = SpriteNode(
+            z = self.z,
+            y_sort = False,
+            resource = image,
+            shader = ShaderLibrary.get_program(fragment = "alpha_blend.frag"),
+            batch = batch
+        )
+
+        # Apply cloud alpha without touching the shared program.
+        sprite.sprite.group = ShaderLibrary.get_group(
+            fragment = "alpha_blend.frag",
+            uniforms = {"alpha": CLOUD_ALPHA}
+        )
+
+        return sprite
+
+    def __write_sprites(self) -> None:
+        """
+        Writes cloud positions back to the sprites whose on-screen pixel changed since the last write.
+        """
+
+        scaling: int = GLOBALS[Keys.SCALING]
+        screen_xs: np.ndarray = self.xs * scaling
+        screen_ys: np.ndarray = self.ys * scaling
+        pixels_x: np.ndarray = np.floor(screen_xs).astype(np.int64)
+        pixels_y: np.ndarray = np.floor(screen_ys).astype(np.int64)
+
+        changed: np.ndarray = np.flatnonzero((pixels_x != self.__pixels_x) | (pixels_y != self.__pixels_y))
+        if changed.size == 0:
+            return
+
+        self.__pixels_x[changed] = pixels_x[changed]
+        self.__pixels_y[changed] = pixels_y[changed]
+
+        for index, x, y in zip(changed.tolist(), screen_xs[changed].tolist(), screen_ys[changed].tolist()):
+            self.sprites[index].sprite.position = (x, y, self.z)
 
     def update(self, dt: int) -> None:
-        for cloud in self.clouds:
-            # Update the cloud.
-            cloud.update(dt)
+        with uniques.PROFILER.scope("clouds"):
+            # Move all clouds, vertical movement depends on the position before moving.
+            sways: np.ndarray = np.sin(self.xs / 10) * 2 * dt
+            self.xs += CLOUD_SPEED * dt
+            self.ys += sways
+
+            # Bounding boxes of all clouds.
+            lefts: np.ndarray = self.xs - self.__anchors_x
+            bottoms: np.ndarray = self.ys - self.__anchors_y
 
             # If a cloud is out of bounds, then move it to the other side of the scene.
-            cloud_bb = cloud.get_bounding_box()
-            if not rect_rect_check(*cloud_bb, *self.bounds.get_bounding_box()):
-                cloud.set_position(
-                    (
-                        self.bounds.left - (cloud_bb[2] / 2),
-                        self.bounds.bottom + random.random() * (self.bounds.top - self.bounds.bottom),
-                    )
-                )
+            out: np.ndarray = ~(
+                (lefts < self.bounds.right) &
+                (lefts + self.widths > self.bounds.left) &
+                (bottoms < self.bounds.top) &
+                (bottoms + self.heights > self.bounds.bottom)
+            )
+            respawns: int = int(np.count_nonzero(out))
+            if respawns > 0:
+                self.xs[out] = self.bounds.left - self.widths[out] / 2
+                self.ys[out] = self.bounds.bottom + self.__rng.random(respawns) * (self.bounds.top - self.bounds.bottom)
+
+            self.__write_sprites()
 
     def delete(self) -> None:
-        for cloud in self.clouds:
-            cloud.delete()
+        for sprite in self.sprites:
+            sprite.delete()
 
-        self.clouds.clear()
\ No newline at end of file
+        self.sprites.clear()
@@ -0,0 +1,5 @@
+# Simulation updates per second, independent of the rendering rate so that physics always behave the same.
+SIMULATION_RATE: float = 120.0
+
+# Fixed simulation timestep (in seconds).
+SIMULATION_DT: float = 1.0 / SIMULATION_RATE
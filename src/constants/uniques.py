@@ -1,4 +1,21 @@
+import random
+from typing import TYPE_CHECKING
+
 from amonite.scene_node import SceneNode
 
+from frame_profiler import FrameProfiler
+
+if TYPE_CHECKING:
+    from arrow_pool import ArrowPool
+
 # Global active scene accessor.
-ACTIVE_SCENE: SceneNode | None = None
\ No newline at end of file
+ACTIVE_SCENE: SceneNode | None = None
+
+# Random stream of the active scene, seeded from the global generator on scene creation so that seeded runs are repeatable.
+SCENE_RNG: random.Random = random.Random()
+
+# Arrows of the active scene.
+ARROW_POOL: "ArrowPool | None" = None
+
+# Global frame profiler, enabled on debug.
+PROFILER: FrameProfiler = FrameProfiler()
\ No newline at end of file
@@ -26,8 +26,6 @@ class DoorsLoader:
         Reads and returns the list of doors from the file provided in [source].
         """
 
-        doors_list: list[DoorNode] = []
-
         abs_path: str = os.path.join(pyglet.resource.path[0], source)
 
         # Return an empty list if the source file is not found.
@@ -42,6 +40,28 @@ class DoorsLoader:
         with open(file = abs_path, mode = "r", encoding = "UTF8") as source_file:
             data = json.load(source_file)
 
+        return DoorsLoader.from_data(
+            data = data,
+            tile_size = tile_size,
+            on_triggered = on_triggered,
+            batch = batch
+        )
+
+    @staticmethod
+    def from_data(
+        data: dict,
+        tile_size: tuple[float, float],
+        on_triggered: Callable[[bool, dict], None] | None = None,
+        dst_doormaps: dict[str, dict] | None = None,
+        batch: pyglet.graphics.Batch | None = None
+    ) -> list[DoorNode]:
+        """
+        Creates and returns the list of doors defined by the provided doormap [data].
+        [dst_doormaps] optionally provides already read doormaps of destination rooms, by room name.
+        """
+
+        doors_list: list[DoorNode] = []
+
         # Just return if no data is read.
         if len(data) <= 0:
             return []
@@ -52,6 +72,7 @@ class DoorsLoader:
                 data = element,
                 tile_size = tile_size,
                 on_triggered = on_triggered,
+                dst_doormaps = dst_doormaps,
                 batch = batch
             )
 
@@ -65,6 +86,7 @@ class DoorsLoader:
         data: dict,
         tile_size: tuple[float, float],
         on_triggered: Callable[[bool, dict], None] | None = None,
+        dst_doormaps: dict[str, dict] | None = None,
         batch: pyglet.graphics.Batch | None = None
     ) -> DoorNode:
 
@@ -94,7 +116,8 @@ class DoorsLoader:
             dst_location = DoorsLoader.dst_location_from_door(
                 dst_room = dst_room,
                 dst_door = data["dst_door"],
-                direction = direction
+                direction = direction,
+                dst_data = dst_doormaps[dst_room] if dst_doormaps is not None and dst_room in dst_doormaps else None
             )
         else:
             dst_loc_string: str = data["dst_location"]
@@ -127,17 +150,30 @@ class DoorsLoader:
         return door
 
     @staticmethod
-    def dst_location_from_door(dst_room: str, dst_door: str, direction: str) -> tuple[float, float] | None:
-        abs_path: str = os.path.join(pyglet.resource.path[0], f"doormaps/{dst_room}.json")
-
-        # Return None if the source file is not found.
-        if not os.path.exists(abs_path):
-            return None
+    def dst_location_from_door(
+        dst_room: str,
+        dst_door: str,
+        direction: str,
+        dst_data: dict | None = None
+    ) -> tuple[float, float] | None:
+        """
+        Computes the location right outside [dst_door] in [dst_room].
+        The destination room doormap is read from file, unless already provided in [dst_data].
+        """
 
         data: dict
 
-        with open(file = abs_path, mode = "r", encoding = "UTF8") as source_file:
-            data = json.load(source_file)
+        if dst_data is not None:
+            data = dst_data
+        else:
+            abs_path: str = os.path.join(pyglet.resource.path[0], f"doormaps/{dst_room}.json")
+
+            # Return None if the source file is not found.
+            if not os.path.exists(abs_path):
+                return None
+
+            with open(file = abs_path, mode = "r", encoding = "UTF8") as source_file:
+                data = json.load(source_file)
 
         # Just return if no data is read.
         if len(data) <= 0:
@@ -6,6 +6,8 @@ from amonite.node import PositionNode
 from amonite.sprite_node import SpriteNode
 from amonite.utils import utils
 
+from shader_library import ShaderLibrary
+
 class DukNode(PositionNode):
     def __init__(
         self,
@@ -22,35 +24,30 @@ class DukNode(PositionNode):
             y = 0
         )
 
-        # Load fragment source from file.
-        fragment_source: str
-        with open(file = os.path.join(pyglet.resource.path[0], "../shaders/color_swap.frag"), mode = "r", encoding = "UTF8") as file:
-            fragment_source = file.read()
-
-        # Create shader program from vector and fragment.
-        vert_shader = pyglet.graphics.shader.Shader(pyglet.sprite.vertex_source, "vertex")
-        frag_shader = pyglet.graphics.shader.Shader(fragment_source, "fragment")
-        shader_program = pyglet.graphics.shader.ShaderProgram(vert_shader, frag_shader)
-
         # Load palette texture.
         palette = pyglet.image.load(os.path.join(pyglet.resource.path[0], "sprites/rughai/wilds/duk/duk_palette.png"))
 
-        # Pass non uniform.
-        shader_program["mixer"] = 0.5
-        shader_program["hit"] = False
-        shader_program["dead"] = False
-
         self.sprite: SpriteNode = SpriteNode(
             resource = self.__idle_animation,
             x = x,
             y = y,
             on_animation_end = lambda : None,
-            shader = shader_program,
+            shader = ShaderLibrary.get_program(fragment = "color_swap.frag"),
             samplers_2d = {
                 "palette": palette
             },
             batch = batch
         )
 
+        # Pass uniforms through a group, so that the shared program is left untouched.
+        self.sprite.sprite.group = ShaderLibrary.get_group(
+            fragment = "color_swap.frag",
+            uniforms = {
+                "mixer": 0.5,
+                "hit": False,
+                "dead": False
+            }
+        )
+
     def draw(self) -> None:
         self.sprite.draw()
\ No newline at end of file
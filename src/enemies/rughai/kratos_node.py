@@ -1,12 +1,13 @@
 from enum import Enum
 from typing import Optional
 import pyglet
-from amonite.animation import Animation
 
 from amonite.node import PositionNode
 from amonite.sprite_node import SpriteNode
 from amonite.state_machine import State, StateMachine
 
+from animation_library import AnimationLibrary
+
 class KratosStates(str, Enum):
     IDLE = "idle"
 
@@ -24,7 +25,7 @@ class KratosNode(PositionNode):
 
         # Animations.
         self.__sprite = SpriteNode(
-            resource = Animation(source = "sprites/iryo/iryo_idle.json").content,
+            resource = AnimationLibrary.get(source = "sprites/iryo/iryo_idle.json").content,
             on_animation_end = self.on_sprite_animation_end,
             x = x,
             y = y,
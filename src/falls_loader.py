@@ -4,6 +4,9 @@ import pyglet
 
 from amonite.fall_node import FallNode
 
+from map_persistence import write_map
+from map_utils import read_pair
+
 
 class FallsLoader:
     @staticmethod
@@ -15,8 +18,6 @@ class FallsLoader:
         Reads and returns the list of falls from the file provided in [source].
         """
 
-        falls_list: list[FallNode] = []
-
         abs_path: str = os.path.join(pyglet.resource.path[0], source)
 
         # Return an empty list if the source file is not found.
@@ -31,26 +32,37 @@ class FallsLoader:
         with open(file = abs_path, mode = "r", encoding = "UTF8") as source_file:
             data = json.load(source_file)
 
+        return FallsLoader.from_data(
+            data = data,
+            batch = batch
+        )
+
+    @staticmethod
+    def from_data(
+        data: dict,
+        batch: pyglet.graphics.Batch | None = None
+    ) -> list[FallNode]:
+        """
+        Creates and returns the list of falls defined by the provided fallmap [data].
+        """
+
+        falls_list: list[FallNode] = []
+
         # Just return if no data is read.
         if len(data) <= 0:
             return []
 
         # Loop through defined fall types.
         for element in data["elements"]:
-            positions: list[str] = element["positions"]
-            sizes: list[str] = element["sizes"]
+            positions: list[str | tuple[float, float]] = element["positions"]
+            sizes: list[str | tuple[float, float]] = element["sizes"]
 
             assert len(positions) == len(sizes)
 
             # Loop through single falls.
             for i in range(len(positions)):
-                position_string: str = positions[i]
-                size_string: str = sizes[i]
-
-                position: list[float] = list(map(lambda item: float(item), position_string.split(",")))
-                size: list[float] = list(map(lambda item: float(item), size_string.split(",")))
-
-                assert len(position) == 2 and len(size) == 2
+                position: tuple[float, float] = read_pair(positions[i])
+                size: tuple[float, float] = read_pair(sizes[i])
 
                 # Create a new fall node and add it to the result.
                 falls_list.append(FallNode(
@@ -65,13 +77,9 @@ class FallsLoader:
         return falls_list
 
     @staticmethod
-    def store(
-        dest: str,
-        falls: list[FallNode]
-    ) -> None:
+    def to_data(falls: list[FallNode]) -> dict:
         """
-        Saves a fallmap file to store all provided falls.
-        Falls are internally sorted by tags.
+        Returns the map data storing all provided [falls], ready to be serialized.
         """
 
         # Group falls by tags.
@@ -93,11 +101,17 @@ class FallsLoader:
             }
             result.append(element)
 
-        # Write to dest file.
-        with open(file = dest, mode = "w", encoding = "UTF8") as dest_file:
-            dest_file.write(json.dumps(
-                {
-                    "elements": result
-                },
-                indent = 4
-            ))
\ No newline at end of file
+        return {
+            "elements": result
+        }
+
+    @staticmethod
+    def store(
+        dest: str,
+        falls: list[FallNode]
+    ) -> None:
+        """
+        Saves a map file to store all provided [falls].
+        """
+
+        write_map(dest = dest, data = FallsLoader.to_data(falls = falls))
\ No newline at end of file
@@ -0,0 +1,247 @@
+import contextlib
+import time
+from collections import deque
+from typing import ContextManager, TextIO
+import pyglet
+
+# Percentiles shown by the overlay.
+PERCENTILES: tuple[int, ...] = (50, 95, 99)
+
+# Path separator for nested scopes.
+SCOPE_SEPARATOR: str = "/"
+
+class ProfilerScope:
+    """
+    Named timing scope, accumulating the time spent in it during the current frame.
+    Scopes are reused across frames, so entering one allocates nothing.
+    """
+
+    __slots__ = (
+        "profiler",
+        "path",
+        "depth",
+        "children",
+        "frame_time",
+        "samples",
+        "self_samples",
+        "__start_time"
+    )
+
+    def __init__(
+        self,
+        profiler: "FrameProfiler",
+        path: str,
+        depth: int,
+        samples: int
+    ) -> None:
+        self.profiler: FrameProfiler = profiler
+        self.path: str = path
+        self.depth: int = depth
+
+        # Nested scopes by name.
+        self.children: dict[str, ProfilerScope] = {}
+
+        # Time spent in the scope during the current frame.
+        self.frame_time: float = 0.0
+
+        # Time spent in the scope during the last frames.
+        self.samples: deque[float] = deque(maxlen = samples)
+
+        # Time spent in the scope but outside of any of its children during the last frames.
+        self.self_samples: deque[float] = deque(maxlen = samples)
+
+        self.__start_time: float = 0.0
+
+    def __enter__(self) -> None:
+        self.profiler.stack.append(self)
+        self.__start_time = time.perf_counter()
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.frame_time += time.perf_counter() - self.__start_time
+        self.profiler.stack.pop()
+
+    def percentile(
+        self,
+        value: int,
+        exclusive: bool = False
+    ) -> float:
+        """
+        Returns the [value] percentile (nearest rank) of the time spent in the scope over the last frames.
+        If [exclusive] is True, then time spent in children scopes is not taken into account.
+        """
+
+        samples: deque[float] = self.self_samples if exclusive else self.samples
+
+        if len(samples) <= 0:
+            return 0.0
+
+        ordered: list[float] = sorted(samples)
+
+        return ordered[min(len(ordered) - 1, (len(ordered) * value) // 100)]
+
+class FrameProfiler:
+    """
+    Hierarchical frame profiler.
+    Code is measured by entering named scopes, which nest into each other:
+    time is accumulated for each scope along each frame, and rolling percentiles are kept over the last [samples] frames.
+    Entering scopes costs nothing but a shared no-op context manager while disabled.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        samples: int = 240,
+        update_period: float = 0.5
+    ) -> None:
+        self.enabled: bool = enabled
+
+        self.__samples: int = samples
+        self.__update_period: float = update_period
+        self.__elapsed: float = 0.0
+
+        # Root scope, measuring whole frames.
+        self.root: ProfilerScope = ProfilerScope(
+            profiler = self,
+            path = "frame",
+            depth = 0,
+            samples = samples
+        )
+
+        # Stack of currently entered scopes.
+        self.stack: list[ProfilerScope] = [self.root]
+
+        self.__frame_count: int = 0
+        self.__frame_start: float = time.perf_counter()
+
+        # Optional csv output, receiving every frame.
+        self.__csv_file: TextIO | None = None
+
+        self.__null_scope: ContextManager = contextlib.nullcontext()
+        self.__label: pyglet.text.Label | None = None
+
+    def scope(self, name: str) -> ContextManager:
+        """
+        Returns the scope [name], nested into the currently entered one.
+        """
+
+        if not self.enabled:
+            return self.__null_scope
+
+        parent: ProfilerScope = self.stack[-1]
+        scope: ProfilerScope | None = parent.children.get(name)
+
+        if scope is None:
+            scope = ProfilerScope(
+                profiler = self,
+                path = f"{parent.path}{SCOPE_SEPARATOR}{name}",
+                depth = parent.depth + 1,
+                samples = self.__samples
+            )
+            parent.children[name] = scope
+
+        return scope
+
+    def end_frame(self) -> None:
+        """
+        Closes the current frame, storing the time spent in each scope along it.
+        """
+
+        end_time: float = time.perf_counter()
+        frame_time: float = end_time - self.__frame_start
+        self.__frame_start = end_time
+
+        if not self.enabled:
+            return
+
+        self.root.frame_time = frame_time
+
+        # Scopes come parents first, so children times are still available when computing parents exclusive time.
+        for scope in self.scopes():
+            scope.samples.append(scope.frame_time)
+            scope.self_samples.append(scope.frame_time - sum(child.frame_time for child in scope.children.values()))
+
+            if self.__csv_file is not None:
+                self.__csv_file.write(f"{self.__frame_count},{scope.path},{scope.frame_time * 1000:.4f}\n")
+
+            scope.frame_time = 0.0
+
+        self.__frame_count += 1
+
+        # Refresh the overlay.
+        self.__elapsed += frame_time
+        if self.__label is not None and self.__elapsed >= self.__update_period:
+            self.__elapsed = 0.0
+            self.__label.text = self.report()
+
+    def scopes(self) -> list[ProfilerScope]:
+        """
+        Returns all scopes, depth first.
+        """
+
+        result: list[ProfilerScope] = []
+        pending: list[ProfilerScope] = [self.root]
+
+        while len(pending) > 0:
+            scope: ProfilerScope = pending.pop()
+            result.append(scope)
+            pending.extend(reversed(scope.children.values()))
+
+        return result
+
+    def report(self) -> str:
+        """
+        Returns a text table of all scopes percentiles, in milliseconds.
+        Scopes with children are followed by their exclusive time.
+        """
+
+        lines: list[str] = [f"{'':<24}" + "".join(f"{f'p{value}':>8}" for value in PERCENTILES)]
+
+        for scope in self.scopes():
+            name: str = "  " * scope.depth + scope.path.split(SCOPE_SEPARATOR)[-1]
+            lines.append(f"{name:<24}" + "".join(f"{scope.percentile(value) * 1000:>8.3f}" for value in PERCENTILES))
+
+            # Also show time not covered by any child.
+            if len(scope.children) > 0:
+                name = "  " * (scope.depth + 1) + "(self)"
+                lines.append(f"{name:<24}" + "".join(f"{scope.percentile(value, exclusive = True) * 1000:>8.3f}" for value in PERCENTILES))
+
+        return "\n".join(lines)
+
+    def open_csv(self, dest: str) -> None:
+        """
+        Starts writing every frame to the [dest] csv file, one row per scope, as frame, scope path and time in milliseconds.
+        """
+
+        self.close_csv()
+
+        self.__csv_file = open(file = dest, mode = "w", encoding = "UTF8")
+        self.__csv_file.write("frame,scope,ms\n")
+
+    def close_csv(self) -> None:
+        if self.__csv_file is not None:
+            self.__csv_file.close()
+            self.__csv_file = None
+
+    def draw(
+        self,
+        x: int = 10,
+        y: int = 110
+    ) -> None:
+        """
+        Draws the percentiles overlay at [x], [y].
+        """
+
+        if self.__label is None:
+            self.__label = pyglet.text.Label(
+                text = self.report(),
+                font_name = "monospace",
+                font_size = 8,
+                anchor_x = "left",
+                anchor_y = "bottom",
+                x = x,
+                y = y,
+                width = 400,
+                multiline = True
+            )
+
+        self.__label.draw()
@@ -0,0 +1,154 @@
+import cProfile
+from enum import Enum
+import os
+import time
+
+from amonite.settings import SETTINGS, Keys
+
+# Snapshots file extension.
+SNAPSHOT_EXTENSION: str = "pyprof"
+
+class ProfileTrigger(str, Enum):
+    """
+    Available gameplay profiling triggers.
+    """
+
+    # Profile for [duration] seconds every [interval] seconds.
+    INTERVAL = "interval"
+
+    # Profile every frame, but only keep frames exceeding their time budget.
+    SLOW_FRAME = "slow_frame"
+
+class GameplayProfiler:
+    """
+    Captures cProfile snapshots of gameplay in sampling windows, writing them to rotating .pyprof files tagged by room.
+    Snapshots are named "<room>_<sequence>.pyprof", so that they can later be aggregated by room.
+    """
+
+    def __init__(
+        self,
+        dest_dir: str,
+        trigger: ProfileTrigger = ProfileTrigger.INTERVAL,
+        interval: float = 10.0,
+        duration: float = 1.0,
+        frame_budget: float = 1.0 / 60.0,
+        cooldown: float = 1.0,
+        max_snapshots: int = 20
+    ) -> None:
+        self.dest_dir: str = dest_dir
+        self.trigger: ProfileTrigger = ProfileTrigger(trigger)
+        self.interval: float = interval
+        self.duration: float = duration
+        self.frame_budget: float = frame_budget
+
+        # Minimum time between two slow frame snapshots.
+        self.cooldown: float = cooldown
+
+        # Maximum number of snapshot files kept, oldest ones are removed first.
+        self.max_snapshots: int = max_snapshots
+
+        self.__profile: cProfile.Profile = cProfile.Profile()
+        self.__capturing: bool = False
+        self.__capture_room: str | None = None
+        self.__capture_start: float = 0.0
+        self.__last_capture: float = time.perf_counter()
+        self.__frame_start: float = time.perf_counter()
+
+        # Keep numbering from any existing snapshot.
+        os.makedirs(self.dest_dir, exist_ok = True)
+        self.__sequence: int = max([GameplayProfiler.__snapshot_sequence(file_name) for file_name in self.__snapshots()], default = -1) + 1
+
+    @staticmethod
+    def from_settings(dest_dir: str) -> "GameplayProfiler | None":
+        """
+        Creates a gameplay profiler as configured in settings, writing to [dest_dir].
+        Returns None if gameplay profiling is disabled.
+        """
+
+        if not SETTINGS.get("profile_gameplay", False):
+            return None
+
+        return GameplayProfiler(
+            dest_dir = dest_dir,
+            trigger = SETTINGS.get("profile_trigger", ProfileTrigger.INTERVAL),
+            interval = SETTINGS.get("profile_interval", 10.0),
+            duration = SETTINGS.get("profile_duration", 1.0),
+            frame_budget = SETTINGS.get("profile_frame_budget", 1.0 / SETTINGS[Keys.TARGET_FPS]),
+            max_snapshots = SETTINGS.get("profile_max_snapshots", 20)
+        )
+
+    def end_frame(self, room: str) -> None:
+        """
+        Closes the current frame, played in [room], starting, stopping or storing captures accordingly.
+        """
+
+        end_time: float = time.perf_counter()
+        frame_time: float = end_time - self.__frame_start
+
+        if self.trigger == ProfileTrigger.INTERVAL:
+            if self.__capturing:
+                # Stop capturing after duration or when the room changes.
+                if end_time - self.__capture_start >= self.duration or room != self.__capture_room:
+                    self.__profile.disable()
+                    self.__capturing = False
+                    self.__store()
+                    self.__last_capture = end_time
+            elif end_time - self.__last_capture >= self.interval:
+                self.__start_capture(room = room)
+        else:
+            if self.__capturing:
+                self.__profile.disable()
+                self.__capturing = False
+
+                # Only keep slow frames.
+                if frame_time > self.frame_budget and end_time - self.__last_capture >= self.cooldown and room == self.__capture_room:
+                    self.__store()
+                    self.__last_capture = end_time
+
+            self.__start_capture(room = room)
+
+        # Do not account for snapshot writes in the next frame.
+        self.__frame_start = time.perf_counter()
+
+    def stop(self) -> None:
+        """
+        Stops any running capture, discarding it.
+        """
+
+        if self.__capturing:
+            self.__profile.disable()
+            self.__capturing = False
+
+    def __start_capture(self, room: str) -> None:
+        self.__profile.clear()
+        self.__capture_room = room
+        self.__capture_start = time.perf_counter()
+        self.__capturing = True
+        self.__profile.enable()
+
+    def __store(self) -> None:
+        assert self.__capture_room is not None
+
+        self.__profile.dump_stats(os.path.join(self.dest_dir, f"{self.__capture_room}_{self.__sequence:05d}.{SNAPSHOT_EXTENSION}"))
+        self.__sequence += 1
+
+        # Rotate snapshots.
+        snapshots: list[str] = sorted(self.__snapshots(), key = GameplayProfiler.__snapshot_sequence)
+        for file_name in snapshots[:max(0, len(snapshots) - self.max_snapshots)]:
+            os.remove(os.path.join(self.dest_dir, file_name))
+
+    def __snapshots(self) -> list[str]:
+        return [file_name for file_name in os.listdir(self.dest_dir) if file_name.endswith(f".{SNAPSHOT_EXTENSION}")]
+
+    @staticmethod
+    def __snapshot_sequence(file_name: str) -> int:
+        sequence: str = file_name.rsplit(".", 1)[0].rsplit("_", 1)[-1]
+
+        return int(sequence) if sequence.isdigit() else -1
+
+def snapshot_room(file_name: str) -> str:
+    """
+    Returns the room the snapshot named [file_name] was captured in.
+    """
+
+    return file_name.rsplit(".", 1)[0].rsplit("_", 1)[0]
@@ -0,0 +1,209 @@
+from typing import NamedTuple
+
+from amonite.collision.collision_controller import VELOCITY_TOLERANCE, CollisionController
+from amonite.collision.collision_node import CollisionNode, CollisionType
+from amonite.collision.collision_shape import CollisionRect
+from amonite.utils.utils import CollisionHit
+
+from rect_grid import RectGrid
+
+# Size of grid cells, matching the rooms' tile size.
+CELL_SIZE: float = 8.0
+
+class ColliderSet(NamedTuple):
+    """
+    All colliders detached from a controller, along with their index, ready to be attached back as they are.
+    """
+
+    colliders: dict[CollisionType, list[CollisionNode]]
+    grid: RectGrid[CollisionNode]
+    unindexed: list[CollisionNode]
+    order: dict[CollisionNode, int]
+
+class GridCollisionController(CollisionController):
+    """
+    Collision controller indexing static colliders in a uniform grid, so that each dynamic collider is only tested
+    against the static colliders lying in the cells its movement sweeps over, rather than against all of them.
+    Collisions are solved exactly like the base controller does, with triggers, sliding and ties resolved the same way.
+
+    Static colliders are indexed at their position when added, so moving one afterwards requires removing and adding it again.
+    """
+
+    def __init__(self, cell_size: float = CELL_SIZE) -> None:
+        super().__init__()
+
+        self.__colliders: dict[CollisionType, list[CollisionNode]] = {
+            CollisionType.DYNAMIC: [],
+            CollisionType.STATIC: []
+        }
+
+        # Rect static colliders by the cells they overlap.
+        self.__grid: RectGrid[CollisionNode] = RectGrid(cell_size = cell_size)
+
+        # Static colliders that cannot be indexed, which are always tested.
+        self.__unindexed: list[CollisionNode] = []
+
+        # Registration order of static colliders, used to test them in the same order as the base controller.
+        self.__order: dict[CollisionNode, int] = {}
+        self.__next_order: int = 0
+
+    def add_collider(
+        self,
+        collider: CollisionNode
+    ) -> None:
+        if collider.type in self.__colliders:
+            self.__colliders[collider.type].append(collider)
+        else:
+            self.__colliders[collider.type] = [collider]
+
+        if collider.type == CollisionType.STATIC:
+            self.__order[collider] = self.__next_order
+            self.__next_order += 1
+
+            if isinstance(collider.shape, CollisionRect):
+                self.__grid.insert(collider, collider.shape.get_collision_bounds())
+            else:
+                self.__unindexed.append(collider)
+
+    def remove_collider(self, collider: CollisionNode):
+        """
+        Removes the given collider, effectively preventing it from triggering collisions.
+        """
+
+        self.__colliders[collider.type].remove(collider)
+
+        if collider.type == CollisionType.STATIC:
+            self.__order.pop(collider, None)
+            self.__grid.remove(collider)
+            if collider in self.__unindexed:
+                self.__unindexed.remove(collider)
+
+    def clear(self) -> None:
+        self.__colliders.clear()
+        self.__grid.clear()
+        self.__unindexed.clear()
+        self.__order.clear()
+
+    def detach(self) -> ColliderSet:
+        """
+        Removes all colliders at once, without destroying them, and returns them so that they can be attached back later.
+        """
+
+        detached: ColliderSet = ColliderSet(
+            colliders = self.__colliders,
+            grid = self.__grid,
+            unindexed = self.__unindexed,
+            order = self.__order
+        )
+
+        self.__colliders = {
+            CollisionType.DYNAMIC: [],
+            CollisionType.STATIC: []
+        }
+        self.__grid = RectGrid(cell_size = detached.grid.cell_size)
+        self.__unindexed = []
+        self.__order = {}
+
+        return detached
+
+    def attach(self, colliders: ColliderSet) -> None:
+        """
+        Replaces all colliders with the provided previously detached ones.
+        """
+
+        self.__colliders = colliders.colliders
+        self.__grid = colliders.grid
+        self.__unindexed = colliders.unindexed
+        self.__order = colliders.order
+
+    def update(self, dt: float) -> None:
+        self.__scale_velocity(dt = dt)
+        self.__handle_collisions()
+
+    def __scale_velocity(self, dt: float) -> None:
+        if CollisionType.DYNAMIC in self.__colliders:
+            for collider in self.__colliders[CollisionType.DYNAMIC]:
+                collider_velocity: tuple[float, float] = collider.get_velocity()
+                collider.set_velocity((collider_velocity[0] * dt, collider_velocity[1] * dt))
+
+    def __get_candidates(self, actor: CollisionNode) -> list[CollisionNode]:
+        """
+        Returns all static colliders [actor] could hit with its current velocity, in registration order.
+        """
+
+        # Actors with shapes other than rects cannot sweep collide, so just test them against everything.
+        if not isinstance(actor.shape, CollisionRect):
+            return self.__colliders[CollisionType.STATIC]
+
+        # Bounds swept by the actor along its velocity.
+        bounds: tuple[float, float, float, float] = actor.shape.get_collision_bounds()
+        candidates: set[CollisionNode] = self.__grid.query_rect((
+            min(bounds[0], bounds[0] + actor.velocity_x),
+            min(bounds[1], bounds[1] + actor.velocity_y),
+            bounds[2] + abs(actor.velocity_x),
+            bounds[3] + abs(actor.velocity_y)
+        ))
+
+        candidates.update(self.__unindexed)
+
+        # Colliders the actor is currently in must be tested as well, so that leaving them is detected wherever the actor goes.
+        candidates.update(other for other in actor.collisions if other in self.__order)
+
+        return sorted(candidates, key = self.__order.__getitem__)
+
+    def __handle_collisions(self) -> None:
+        # Only check collision from dynamic to static, since dynamic/dynamic collisions are not needed for now.
+        if CollisionType.DYNAMIC in self.__colliders and CollisionType.STATIC in self.__colliders:
+            # Loop through dynamic colliders.
+            for actor in self.__colliders[CollisionType.DYNAMIC]:
+                # Trigger all collisions from the previous step.
+                for other in actor.in_collisions:
+                    if actor.on_triggered is not None:
+                        actor.on_triggered(other.passive_tags, True)
+                    if other.on_triggered is not None:
+                        other.on_triggered(actor.active_tags, True)
+                for other in actor.out_collisions:
+                    if actor.on_triggered is not None:
+                        actor.on_triggered(other.passive_tags, False)
+                    if other.on_triggered is not None:
+                        other.on_triggered(actor.active_tags, False)
+                actor.in_collisions.clear()
+                actor.out_collisions.clear()
+
+                # Solve collision and iterate until velocity is exhausted.
+                while abs(actor.velocity_x) > VELOCITY_TOLERANCE or abs(actor.velocity_y) > VELOCITY_TOLERANCE:
+                    nearest_collision: CollisionHit | None = None
+
+                    # Only loop through static colliders along the way.
+                    for other in self.__get_candidates(actor = actor):
+                        # Avoid calculating self-collision.
+                        if actor == other:
+                            continue
+
+                        collision_hit: CollisionHit | None = actor.collide(other)
+
+                        # Only save collision if it actually happened.
+                        if not other.sensor and collision_hit is not None and collision_hit.time < 1.0:
+                            if nearest_collision is None or collision_hit.time < nearest_collision.time:
+                                nearest_collision = collision_hit
+
+                    actor_position: tuple[float, float] = actor.get_position()
+
+                    if nearest_collision is not None:
+                        # Move to the collision point.
+                        actor.set_position((
+                            actor_position[0] + actor.velocity_x * nearest_collision.time,
+                            actor_position[1] + actor.velocity_y * nearest_collision.time
+                        ))
+
+                        # Slide along the hit surface with the remaining velocity.
+                        actor.set_velocity((
+                            (actor.velocity_x * abs(nearest_collision.normal.y)) * (1.0 - nearest_collision.time),
+                            (actor.velocity_y * abs(nearest_collision.normal.x)) * (1.0 - nearest_collision.time)
+                        ))
+                    else:
+                        actor.set_position((
+                            actor_position[0] + actor.velocity_x,
+                            actor_position[1] + actor.velocity_y
+                        ))
+                        actor.set_velocity((0.0, 0.0))
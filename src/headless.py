@@ -0,0 +1,256 @@
+import argparse
+import hashlib
+import json
+import os.path
+import random
+import sys
+import time
+import types
+import pyglet
+
+class NoControllerManager(pyglet.event.EventDispatcher):
+    """
+    Controller manager reporting no controllers at all.
+    """
+
+    def get_controllers(self) -> list:
+        return []
+
+NoControllerManager.register_event_type("on_connect")
+NoControllerManager.register_event_type("on_disconnect")
+
+# Headless mode needs to be set before any window module is imported.
+if __name__ == "__main__" and "--headless" in sys.argv:
+    pyglet.options["headless"] = True
+
+# Input devices cannot be listed without a window system, and only recorded inputs are fed anyway,
+# so provide an input module with no controllers before amonite's input controller looks for them.
+if pyglet.options["headless"]:
+    headless_input: types.ModuleType = types.ModuleType("pyglet.input")
+    headless_input.ControllerManager = NoControllerManager
+    headless_input.get_controllers = lambda: []
+    sys.modules["pyglet.input"] = headless_input
+
+from constants import uniques
+from constants.simulation import SIMULATION_DT
+import amonite.controllers as controllers
+from amonite.settings import GLOBALS, SETTINGS, Keys, load_settings
+from grid_collision_controller import GridCollisionController
+from input_recording import InputReplay
+from playable_scene_node import PlayableSceneNode
+from scene_cache import DEFAULT_BUDGET, DEFAULT_MAX_SCENES, SceneCache
+
+DEFAULT_ROOM: str = "r_0_0"
+DEFAULT_SEED: int = 0
+
+class HeadlessRughai:
+    """
+    Runs the game logic on a fixed timestep, with no visible window and no rendering.
+    Time only advances when stepping, so that runs fed with the same inputs always end in the same state.
+    """
+
+    def __init__(
+        self,
+        room: str = DEFAULT_ROOM,
+        seed: int = DEFAULT_SEED,
+        dt: float | None = None
+    ) -> None:
+        # Set resources path.
+        pyglet.resource.path = [f"{os.path.dirname(__file__)}/../assets"]
+        pyglet.resource.reindex()
+
+        # Load settings from file.
+        load_settings(f"{pyglet.resource.path[0]}/settings.json")
+
+        # Fixed timestep, defaults to the same simulation rate used by the game.
+        self.dt: float = dt if dt is not None else SIMULATION_DT
+
+        # Simulated time, used by the clock every sprite animation is scheduled on.
+        self.__time: float = 0.0
+        pyglet.clock.set_default(pyglet.clock.Clock(time_function = lambda: self.__time))
+
+        # Make all random choices (clouds, idle prop animations, stats variations) repeatable.
+        random.seed(seed)
+
+        # A window is still needed to create GL resources and receive inputs, but it's never shown.
+        self.__window: pyglet.window.BaseWindow = pyglet.window.Window(
+            width = SETTINGS[Keys.VIEW_WIDTH],
+            height = SETTINGS[Keys.VIEW_HEIGHT],
+            visible = False
+        )
+
+        # Controllers.
+        controllers.create_controllers(window = self.__window)
+        controllers.COLLISION_CONTROLLER = GridCollisionController()
+        controllers.INVENTORY_CONTROLLER.load_file("inventory_mock.json")
+        controllers.MENU_CONTROLLER.load_file(src = "inventory.json")
+
+        # Nothing is rendered, so just use pixel-perfect scaling.
+        GLOBALS[Keys.SCALING] = 1
+
+        # Current tick.
+        self.tick_count: int = 0
+
+        # Recently left rooms are kept suspended, just like the game does.
+        self.scene_cache: SceneCache = SceneCache(
+            max_scenes = SETTINGS.get("scene_cache_size", DEFAULT_MAX_SCENES),
+            budget = SETTINGS.get("scene_cache_budget", DEFAULT_BUDGET)
+        )
+
+        # Create a scene.
+        self.__active_scene: PlayableSceneNode = self.__create_scene(name = room)
+
+    def __create_scene(
+        self,
+        name: str,
+        bundle: dict | None = None
+    ) -> PlayableSceneNode:
+        return PlayableSceneNode(
+            name = name,
+            window = self.__window,
+            view_width = SETTINGS[Keys.VIEW_WIDTH],
+            view_height = SETTINGS[Keys.VIEW_HEIGHT],
+            bundle = bundle,
+            on_ended = self.__on_scene_end
+        )
+
+    def __on_scene_end(self, bundle: dict):
+        if bundle["next_scene"]:
+            # Suspend the current scene, detaching it from controllers.
+            self.scene_cache.store(self.__active_scene)
+
+            # Resume the next scene if recently left, otherwise build it.
+            scene: PlayableSceneNode | None = self.scene_cache.take(bundle["next_scene"])
+            if scene is not None:
+                scene.resume(bundle = bundle)
+            else:
+                scene = self.__create_scene(
+                    name = bundle["next_scene"],
+                    bundle = bundle
+                )
+
+            self.__active_scene = scene
+
+        # Make sure the active scene was set globally.
+        assert uniques.ACTIVE_SCENE is not None
+
+    def step(self, replay: InputReplay | None = None) -> None:
+        """
+        Performs a single fixed timestep update, feeding any input recorded for the current tick in [replay].
+        """
+
+        if replay is not None:
+            replay.apply(tick = self.tick_count, input_controller = controllers.INPUT_CONTROLLER)
+
+        # Advance simulated time and run any elapsed scheduled function (sprite animations).
+        self.__time += self.dt
+        pyglet.clock.tick()
+
+        with uniques.PROFILER.scope("update"):
+            # Compute collisions through collision manager.
+            with uniques.PROFILER.scope("collisions"):
+                controllers.COLLISION_CONTROLLER.update(dt = self.dt)
+
+            # InputController makes sure every input is handled correctly.
+            with controllers.INPUT_CONTROLLER:
+                with uniques.PROFILER.scope("scene"):
+                    self.__active_scene.update(dt = self.dt)
+
+        # Every tick is a frame, since nothing is rendered.
+        uniques.PROFILER.end_frame()
+
+        self.tick_count += 1
+
+    def run(
+        self,
+        ticks: int,
+        replay: InputReplay | None = None
+    ) -> float:
+        """
+        Performs [ticks] updates as fast as possible.
+        Returns the elapsed real time.
+        """
+
+        start_time: float = time.perf_counter()
+
+        for _ in range(ticks):
+            self.step(replay = replay)
+
+        return time.perf_counter() - start_time
+
+    def get_state(self) -> dict:
+        """
+        Returns a serializable snapshot of the simulation state.
+        """
+
+        return {
+            "tick": self.tick_count,
+            "scene": self.__active_scene.get_state()
+        }
+
+    def delete(self) -> None:
+        self.__active_scene.delete()
+        self.scene_cache.clear()
+        self.__window.close()
+
+def state_digest(state: dict) -> str:
+    """
+    Returns a short digest of the provided [state], useful to compare runs.
+    """
+
+    return hashlib.sha1(json.dumps(state, sort_keys = True).encode("UTF8")).hexdigest()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Runs the game logic headless on a fixed timestep, optionally replaying recorded inputs.")
+    parser.add_argument("--replay", help = "recorded input file to replay")
+    parser.add_argument("--ticks", type = int, help = "number of updates to run, defaults to the recording length or 1000")
+    parser.add_argument("--dt", type = float, help = "fixed timestep, defaults to the recording one or the game simulation rate")
+    parser.add_argument("--seed", type = int, help = f"random seed, defaults to the recording one or {DEFAULT_SEED}")
+    parser.add_argument("--room", help = f"starting room, defaults to the recording one or {DEFAULT_ROOM}")
+    parser.add_argument("--headless", action = "store_true", help = "use a headless (EGL) GL context instead of a hidden window")
+    parser.add_argument("--profile", action = "store_true", help = "print per-subsystem update time percentiles")
+    parser.add_argument("--profile-csv", help = "file to write per-tick profiler timings to, as csv")
+    parser.add_argument("--save-state", help = "file to write the final state to")
+    parser.add_argument("--expect-state", help = "state file the final state is compared to, exits with an error if different")
+    args = parser.parse_args()
+
+    replay: InputReplay | None = InputReplay(source = args.replay) if args.replay is not None else None
+
+    simulation: HeadlessRughai = HeadlessRughai(
+        room = args.room or (replay.room if replay is not None else DEFAULT_ROOM),
+        seed = args.seed if args.seed is not None else (replay.seed if replay is not None and replay.seed is not None else DEFAULT_SEED),
+        dt = args.dt if args.dt is not None else (replay.dt if replay is not None else None)
+    )
+
+    uniques.PROFILER.enabled = args.profile or args.profile_csv is not None
+    if args.profile_csv is not None:
+        uniques.PROFILER.open_csv(dest = args.profile_csv)
+
+    ticks: int = args.ticks if args.ticks is not None else (replay.ticks if replay is not None else 1000)
+    elapsed: float = simulation.run(ticks = ticks, replay = replay)
+
+    state: dict = simulation.get_state()
+    simulation.delete()
+
+    print(f"Ran {ticks} ticks (dt {simulation.dt:.5f}) in {elapsed:.3f}s: {ticks / elapsed if elapsed > 0.0 else 0.0:.1f} ticks/s")
+    print(f"Final state {state_digest(state)}: {json.dumps(state)}")
+
+    if uniques.PROFILER.enabled:
+        uniques.PROFILER.close_csv()
+        print(uniques.PROFILER.report())
+        print(f"Scene cache {simulation.scene_cache.stats}")
+
+    if args.save_state is not None:
+        with open(file = args.save_state, mode = "w", encoding = "UTF8") as state_file:
+            state_file.write(json.dumps(state, indent = 4))
+
+    if args.expect_state is not None:
+        expected_state: dict
+        with open(file = args.expect_state, mode = "r", encoding = "UTF8") as state_file:
+            expected_state = json.load(state_file)
+
+        if state_digest(expected_state) != state_digest(state):
+            print(f"State mismatch, expected {state_digest(expected_state)}: {json.dumps(expected_state)}")
+            sys.exit(1)
+
+        print("State matches")
@@ -2,7 +2,12 @@ import json
 import os
 import pyglet
 
+from amonite.settings import SETTINGS, Keys
+
 from props.idle_prop_node import IdlePropNode
+from props.idle_prop_registry import IdlePropRegistry
+from map_persistence import write_map
+from map_utils import read_pair
 
 class IdlePropLoader:
     @staticmethod
@@ -14,8 +19,6 @@ class IdlePropLoader:
         Reads and returns the list of props from the file provided in [source].
         """
 
-        props_list: list[IdlePropNode] = []
-
         abs_path: str = os.path.join(pyglet.resource.path[0], source)
 
         # Return an empty list if the source file is not found.
@@ -30,20 +33,37 @@ class IdlePropLoader:
         with open(file = abs_path, mode = "r", encoding = "UTF8") as source_file:
             data = json.load(source_file)
 
+        return IdlePropLoader.from_data(
+            data = data,
+            batch = batch
+        )
+
+    @staticmethod
+    def from_data(
+        data: dict,
+        batch: pyglet.graphics.Batch | None = None,
+    ) -> list[IdlePropNode]:
+        """
+        Creates and returns the list of props defined by the provided idle propmap [data].
+        """
+
+        props_list: list[IdlePropNode] = []
+
         # Just return if no data is read.
         if len(data) <= 0:
             return []
 
+        # Keep track of definitions cache usage for this fetch only.
+        hits, misses = IdlePropRegistry.get_stats()
+
         # Loop through defined prop types.
         for element in data["elements"]:
             id: str = element["id"]
-            positions: list[str] = element["positions"]
+            positions: list[str | tuple[float, float]] = element["positions"]
 
             # Loop through single props.
             for i in range(len(positions)):
-                position_string: str = positions[i]
-
-                position: list[float] = list(map(lambda item: float(item), position_string.split(",")))
+                position: tuple[float, float] = read_pair(positions[i])
 
                 # Create a new wall node and add it to the result.
                 # if not id in props_list:
@@ -56,13 +76,16 @@ class IdlePropLoader:
                     batch = batch
                 ))
 
+        if SETTINGS[Keys.DEBUG]:
+            print(f"Idle prop definitions: {IdlePropRegistry.hits - hits} hits, {IdlePropRegistry.misses - misses} misses")
+
         return props_list
 
     @staticmethod
-    def store(
-        dest: str,
-        props: list[IdlePropNode]
-    ) -> None:
+    def to_data(props: list[IdlePropNode]) -> dict:
+        """
+        Returns the map data storing all provided [props], ready to be serialized.
+        """
 
         # Group props by type.
         props_data: dict[str, list[IdlePropNode]] = {}
@@ -82,14 +105,20 @@ class IdlePropLoader:
             }
             result.append(element)
 
-        # Write to dest file.
-        with open(file = dest, mode = "w", encoding = "UTF8") as dest_file:
-            dest_file.write(json.dumps(
-                {
-                    "elements": result
-                },
-                indent = 4
-            ))
+        return {
+            "elements": result
+        }
+
+    @staticmethod
+    def store(
+        dest: str,
+        props: list[IdlePropNode]
+    ) -> None:
+        """
+        Saves a map file to store all provided [props].
+        """
+
+        write_map(dest = dest, data = IdlePropLoader.to_data(props = props))
 
     @staticmethod
     def fetch_positions(source: str) -> dict[str, set[tuple[int, int]]]:
@@ -142,9 +171,21 @@ class IdlePropLoader:
         y: float,
         batch: pyglet.graphics.Batch | None = None
     ) -> IdlePropNode:
+        """
+        Creates a new idle prop from the shared definition of [prop_name].
+        """
+
         return IdlePropNode(
-            source = f"idle_prop/rughai/{prop_name}.json",
+            definition = IdlePropRegistry.fetch(source = IdlePropLoader.definition_source(prop_name)),
             x = x,
             y = y,
             batch = batch
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def definition_source(prop_name: str) -> str:
+        """
+        Returns the path to the definition file of [prop_name].
+        """
+
+        return f"idle_prop/rughai/{prop_name}.json"
\ No newline at end of file
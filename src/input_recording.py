@@ -0,0 +1,136 @@
+import json
+from typing import Any
+
+from amonite.input_controller import InputController
+
+# Recorded input files format version.
+RECORDING_VERSION: int = 1
+
+class InputRecorder:
+    """
+    Records all keyboard and controller events, along with the update tick they happened on.
+    Should be pushed as event handler on the window and controllers the input controller listens to,
+    and ticked once per update.
+    """
+
+    def __init__(
+        self,
+        room: str,
+        seed: int | None = None,
+        dt: float | None = None
+    ) -> None:
+        self.room: str = room
+        self.seed: int | None = seed
+        self.dt: float | None = dt
+
+        # Current update tick.
+        self.tick_count: int = 0
+
+        # List of recorded events, each one being [tick, event name, event args...].
+        self.events: list[list[Any]] = []
+
+    def tick(self) -> None:
+        """
+        Signals the end of an update.
+        """
+
+        self.tick_count += 1
+
+    def save(self, dest: str) -> None:
+        """
+        Writes all recorded events to the [dest] file.
+        """
+
+        with open(file = dest, mode = "w", encoding = "UTF8") as dest_file:
+            dest_file.write(json.dumps(
+                {
+                    "version": RECORDING_VERSION,
+                    "room": self.room,
+                    "seed": self.seed,
+                    "dt": self.dt,
+                    "ticks": self.tick_count,
+                    "events": self.events
+                },
+                indent = 4
+            ))
+
+    def __record(self, *event: Any) -> None:
+        self.events.append([self.tick_count, *event])
+
+    # ----------------------------------------------------------------------
+    # Keyboard events.
+    # ----------------------------------------------------------------------
+    def on_key_press(self, symbol: int, modifiers) -> None:
+        self.__record("key_press", symbol)
+
+    def on_key_release(self, symbol: int, modifiers) -> None:
+        self.__record("key_release", symbol)
+
+    # ----------------------------------------------------------------------
+    # Controller events.
+    # ----------------------------------------------------------------------
+    def on_connect(self, controller) -> None:
+        controller.push_handlers(self)
+
+    def on_button_press(self, controller, button_name: str) -> None:
+        self.__record("button_press", button_name)
+
+    def on_button_release(self, controller, button_name: str) -> None:
+        self.__record("button_release", button_name)
+
+    def on_stick_motion(self, controller, stick: str, xvalue: float, yvalue: float) -> None:
+        self.__record("stick_motion", stick, xvalue, yvalue)
+
+    def on_trigger_motion(self, controller, trigger: str, value: float) -> None:
+        self.__record("trigger_motion", trigger, value)
+
+class InputReplay:
+    """
+    Feeds recorded input events back to an input controller, tick by tick.
+    """
+
+    def __init__(
+        self,
+        source: str
+    ) -> None:
+        data: dict
+        with open(file = source, mode = "r", encoding = "UTF8") as source_file:
+            data = json.load(source_file)
+
+        if data.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported input recording version in {source}")
+
+        self.room: str = data["room"]
+        self.seed: int | None = data["seed"]
+        self.dt: float | None = data["dt"]
+        self.ticks: int = data["ticks"]
+        self.events: list[list[Any]] = data["events"]
+
+        # Index of the next event to feed.
+        self.__index: int = 0
+
+    def apply(
+        self,
+        tick: int,
+        input_controller: InputController
+    ) -> None:
+        """
+        Feeds all events recorded up to [tick] to [input_controller].
+        """
+
+        while self.__index < len(self.events) and self.events[self.__index][0] <= tick:
+            _, name, *args = self.events[self.__index]
+            self.__index += 1
+
+            if name == "key_press":
+                input_controller.on_key_press(args[0], 0)
+            elif name == "key_release":
+                input_controller.on_key_release(args[0], 0)
+            elif name == "button_press":
+                input_controller.on_button_press(None, args[0])
+            elif name == "button_release":
+                input_controller.on_button_release(None, args[0])
+            elif name == "stick_motion":
+                input_controller.on_stick_motion(None, args[0], args[1], args[2])
+            elif name == "trigger_motion":
+                input_controller.on_trigger_motion(None, args[0], args[1])
@@ -10,6 +10,8 @@ from amonite.node import Node, PositionNode
 from amonite.sprite_node import SpriteNode
 from amonite.utils import utils
 
+from animation_library import AnimationLibrary
+
 class RealWorldItemNode(PositionNode):
     __slots__ = (
         "sprite"
@@ -112,7 +114,7 @@ class InventoryNode(Node):
         self.quiks_slots_sprites: list[SpriteNode] = []
 
         # Cursor sprite.
-        self.cursor_image: Animation = Animation(source = "sprites/menus/inventory/inventory_cursor.json")
+        self.cursor_image: Animation = AnimationLibrary.get(source = "sprites/menus/inventory/inventory_cursor.json")
         self.cursor: SpriteNode | None = None
 
         # Create all quiks' slots.
@@ -169,7 +171,7 @@ class InventoryNode(Node):
                 idx2d: tuple[int, int] = utils.idx1to2(consumable_position[1], controllers.INVENTORY_CONTROLLER.consumables_size[1])
 
                 self.consumables_sprites[consumable_position[0]] = SpriteNode(
-                    resource = Animation(source = CONSUMABLES_ANIMATION[consumable_position[0]]).content,
+                    resource = AnimationLibrary.get(source = CONSUMABLES_ANIMATION[consumable_position[0]]).content,
                     # TODO Scale and shift correctly.
                     x = idx2d[0] * self.step[0] + self.step[0] // 2,
                     # y = self.view_height - consumables_area_size[1] // 2 - (idx2d[1] * step[1] + step[1] // 2),
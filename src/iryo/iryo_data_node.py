@@ -17,7 +17,10 @@ from amonite.settings import GLOBALS
 from amonite.settings import SETTINGS
 from amonite.settings import Keys
 
+from animation_library import AnimationLibrary
 from player_stats import PlayerStats
+from sound_bank import SoundBank
+from redraw_tracker import RedrawTracker
 from scope_node import ScopeNode
 from constants import collision_tags
 
@@ -27,6 +30,10 @@ class IryoDataNode(PositionNode):
         "run_threshold",
         "stats",
         "__hor_facing",
+        "__sprites_state",
+        "__previous_position",
+        "__current_position",
+        "__draw_fill",
         "__shoot_mag",
         "draw_time",
         "draw_sound",
@@ -79,16 +86,26 @@ class IryoDataNode(PositionNode):
 
         self.__hor_facing: int = 1
 
+        # Position and facing the sprites were last placed with.
+        self.__sprites_state: tuple | None = None
+
+        # Last two simulated positions, sprites are rendered in between.
+        self.__previous_position: tuple[float, float] = (x, y)
+        self.__current_position: tuple[float, float] = (x, y)
+
+        # Draw indicator fill, as last shown.
+        self.__draw_fill: float = 0.0
+
         # Current draw time (in seconds).
         self.draw_time: float = 0.0
 
-        # Draw sound.
-        self.draw_sound: pyglet.media.StaticSource = pyglet.media.StaticSource(pyglet.resource.media(name = "sounds/iryo_draw_1.wav"))
-        self.shoot_sound: pyglet.media.StaticSource = pyglet.media.StaticSource(pyglet.resource.media(name = "sounds/iryo_shoot_1.wav"))
+        # Draw and shoot sounds, shared by all players.
+        self.draw_sound: pyglet.media.StaticSource | None = SoundBank.get_effect(name = "sounds/iryo_draw_1.wav")
+        self.shoot_sound: pyglet.media.StaticSource | None = SoundBank.get_effect(name = "sounds/iryo_shoot_1.wav")
 
         # Animations.
         self.__sprite = SpriteNode(
-            resource = Animation(source = "sprites/iryo/iryo_idle.json").content,
+            resource = AnimationLibrary.get(source = "sprites/iryo/iryo_idle.json").content,
             on_animation_end = on_sprite_animation_end,
             x = x,
             y = y,
@@ -203,6 +220,17 @@ class IryoDataNode(PositionNode):
         super().set_position(position = position, z = z)
         self.__collider.set_position(position = position)
 
+    def teleport(self, position: tuple[float, float]) -> None:
+        """
+        Moves straight to [position], without interpolating sprites from the current position.
+        """
+
+        self.set_position(position = position)
+
+        self.__previous_position = position
+        self.__current_position = position
+        self.__place_sprites(position = position)
+
     def get_input_movement(self) -> bool:
         return controllers.INPUT_CONTROLLER.get_movement()
 
@@ -250,6 +278,15 @@ class IryoDataNode(PositionNode):
 
         self.__set_velocity(velocity = velocity)
 
+    def stop(self) -> None:
+        """
+        Stops moving right away.
+        """
+
+        self.stats.speed = 0.0
+        self.stats.move_dir = 0.0
+        self.__set_velocity(velocity = pm.Vec2(0.0, 0.0))
+
     def __update_sprites(self, dt):
         # Only update facing if there's any horizontal movement.
         dir_cos = math.cos(self.stats.look_dir)
@@ -257,18 +294,15 @@ class IryoDataNode(PositionNode):
         if dir_len > 0.1:
             self.__hor_facing = int(math.copysign(1.0, dir_cos))
 
-        # Update sprite position.
-        self.__sprite.set_position(self.get_position())
+        # Keep track of the last two positions, in order to interpolate between them.
+        self.__previous_position = self.__current_position
+        self.__current_position = self.get_position()
 
-        # Flip sprite if moving to the left.
-        self.__sprite.set_scale(x_scale = self.__hor_facing)
+        self.__place_sprites(position = self.__current_position)
 
         # Update scope.
         self.__update_scope(dt)
 
-        # Update shadow sprite.
-        self.__update_shadow(dt)
-
         self.__update_draw_indicator(dt)
 
         # Update camera target.
@@ -286,13 +320,35 @@ class IryoDataNode(PositionNode):
         self.__scope.set_position(position = self.get_position())
         self.__scope.update(dt = dt)
 
-    def __update_shadow(self, dt):
+    def interpolate(self, alpha: float) -> None:
+        """
+        Places sprites at [alpha] (between 0 and 1) of the way from the previous position to the current one.
+        """
+
+        self.__place_sprites(position = (
+            self.__previous_position[0] + (self.__current_position[0] - self.__previous_position[0]) * alpha,
+            self.__previous_position[1] + (self.__current_position[1] - self.__previous_position[1]) * alpha
+        ))
+
+    def __place_sprites(self, position: tuple[float, float]) -> None:
+        # Only move sprites if needed, so that an idle player does not force frames to be redrawn.
+        sprites_state: tuple = (*position, self.__hor_facing)
+        if sprites_state == self.__sprites_state:
+            return
+        self.__sprites_state = sprites_state
+
+        # Update sprite position.
+        self.__sprite.set_position(position)
+
+        # Flip sprite if moving to the left.
+        self.__sprite.set_scale(x_scale = self.__hor_facing)
+
+        # Update shadow sprite.
         self.__shadow_sprite.set_position(
-            position = self.get_position(),
+            position = position,
             # z = 0
-            z = -(self.y + (SETTINGS[Keys.LAYERS_Z_SPACING] * 0.1))
+            z = -(position[1] + (SETTINGS[Keys.LAYERS_Z_SPACING] * 0.1))
         )
-        self.__shadow_sprite.update(dt)
 
     def __update_draw_indicator(self, dt):
         """
@@ -304,7 +360,13 @@ class IryoDataNode(PositionNode):
             min_val = 0.0,
             max_val = self.stats.min_draw_time
         )
-        self.draw_indicator.set_fill(fill = draw_indicator_value / self.stats.min_draw_time)
+        draw_fill: float = draw_indicator_value / self.stats.min_draw_time
+        self.draw_indicator.set_fill(fill = draw_fill)
+
+        # Fill is a shader uniform, so changes are not picked up with sprites.
+        if draw_fill != self.__draw_fill:
+            self.__draw_fill = draw_fill
+            RedrawTracker.mark_dirty()
         self.draw_indicator.set_position(position = self.get_position())
         self.draw_indicator.update(dt = dt)
 
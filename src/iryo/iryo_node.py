@@ -6,6 +6,8 @@ import pyglet
 
 from amonite.node import PositionNode
 
+from constants import uniques
+
 from iryo.iryo_data_node import IryoDataNode
 from iryo.states.iryo_aim_state import IryoAimState
 from iryo.states.iryo_aim_walk_state import IryoAimWalkState
@@ -79,12 +81,14 @@ class IryoNode(PositionNode):
         self.__data.delete()
 
     def update(self, dt) -> None:
-        super().update(dt = dt)
+        with uniques.PROFILER.scope("player"):
+            super().update(dt = dt)
 
-        self.__data.update(dt = dt)
+            self.__data.update(dt = dt)
 
-        # Update the state machine.
-        self.__state_machine.update(dt = dt)
+            # Update the state machine.
+            with uniques.PROFILER.scope("state_machine"):
+                self.__state_machine.update(dt = dt)
 
     def set_position(
         self,
@@ -94,6 +98,25 @@ class IryoNode(PositionNode):
         super().set_position(position = position, z = z)
         self.__data.set_position(position = position)
 
+    def teleport(self, position: tuple[float, float]) -> None:
+        """
+        Moves straight to [position], without interpolating sprites from the current position.
+        """
+
+        PositionNode.set_position(self, position = position)
+        self.__data.teleport(position = position)
+
+    def reset(self) -> None:
+        """
+        Stops the player and brings it back to idle, with controls enabled, as if just created.
+        """
+
+        self.__state_machine.reset()
+        self.__data.stop()
+
+    def interpolate(self, alpha: float) -> None:
+        self.__data.interpolate(alpha = alpha)
+
     def on_collision(self, tags: list[str], entered: bool) -> None:
         self.__state_machine.on_collision(tags = tags, enter = entered)
 
@@ -115,4 +138,17 @@ class IryoNode(PositionNode):
         self.__state_machine.enable_input()
 
     def get_bounding_box(self):
-        return self.__data.get_bounding_box()
\ No newline at end of file
+        return self.__data.get_bounding_box()
+
+    def get_state(self) -> dict:
+        """
+        Returns a serializable snapshot of the player state.
+        """
+
+        return {
+            "position": list(self.__data.get_position()),
+            "state": self.__state_machine.current_key,
+            "move_dir": self.__data.stats.move_dir,
+            "look_dir": self.__data.stats.look_dir,
+            "speed": self.__data.stats.speed
+        }
\ No newline at end of file
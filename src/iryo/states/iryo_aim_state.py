@@ -1,11 +1,12 @@
 import pyglet
 
 from amonite.animation import Animation
-import amonite.controllers as controllers
 
+from animation_library import AnimationLibrary
 from iryo.iryo_data_node import IryoDataNode
 from iryo.states.iryo_state import IryoState
 from iryo.states.iryo_state import IryoStates
+from sound_bank import SoundBank
 
 class IryoAimState(IryoState):
     """
@@ -30,7 +31,7 @@ class IryoAimState(IryoState):
         super().__init__(actor)
 
         # Animations.
-        self.__animation: Animation = Animation(source = "sprites/iryo/iryo_atk_hold_0.json")
+        self.__animation: Animation = AnimationLibrary.get(source = "sprites/iryo/iryo_atk_hold_0.json")
 
         # Input.
         self.__move: bool = False
@@ -72,7 +73,7 @@ class IryoAimState(IryoState):
             return IryoStates.IDLE
 
         if self.__draw:
-            controllers.SOUND_CONTROLLER.play_effect(self.actor.draw_sound)
+            SoundBank.play_effect(self.actor.draw_sound)
             return IryoStates.DRAW
 
         # Set aim direction.
@@ -2,11 +2,12 @@ import pyglet
 import pyglet.math as pm
 
 from amonite.animation import Animation
-import amonite.controllers as controllers
 
+from animation_library import AnimationLibrary
 from iryo.iryo_data_node import IryoDataNode
 from iryo.states.iryo_state import IryoState
 from iryo.states.iryo_state import IryoStates
+from sound_bank import SoundBank
 
 class IryoAimWalkState(IryoState):
     """
@@ -30,7 +31,7 @@ class IryoAimWalkState(IryoState):
         super().__init__(actor)
 
         # Animations.
-        self.__animation: Animation = Animation(source = "sprites/iryo/iryo_atk_hold_0_walk.json")
+        self.__animation: Animation = AnimationLibrary.get(source = "sprites/iryo/iryo_atk_hold_0_walk.json")
 
         # Input.
         self.__move_vec: pyglet.math.Vec2 = pyglet.math.Vec2()
@@ -81,7 +82,7 @@ class IryoAimWalkState(IryoState):
             return IryoStates.IDLE
 
         if self.__draw:
-            controllers.SOUND_CONTROLLER.play_effect(self.actor.draw_sound)
+            SoundBank.play_effect(self.actor.draw_sound)
             return IryoStates.DRAW
 
         # Set aim direction.
@@ -2,6 +2,7 @@ import pyglet
 
 from amonite.animation import Animation
 
+from animation_library import AnimationLibrary
 from iryo.iryo_data_node import IryoDataNode
 from iryo.states.iryo_state import IryoState
 from iryo.states.iryo_state import IryoStates
@@ -28,7 +29,7 @@ class IryoDrawState(IryoState):
         super().__init__(actor)
 
         # Animations.
-        self.__animation: Animation = Animation(source = "sprites/iryo/iryo_atk_hold_1.json")
+        self.__animation: Animation = AnimationLibrary.get(source = "sprites/iryo/iryo_atk_hold_1.json")
 
         # Input.
         self.__move: bool = False
@@ -3,6 +3,7 @@ import pyglet.math as pm
 
 from amonite.animation import Animation
 
+from animation_library import AnimationLibrary
 from iryo.iryo_data_node import IryoDataNode
 from iryo.states.iryo_state import IryoState
 from iryo.states.iryo_state import IryoStates
@@ -29,7 +30,7 @@ class IryoDrawWalkState(IryoState):
         super().__init__(actor)
 
         # Animations.
-        self.__animation: Animation = Animation(source = "sprites/iryo/iryo_atk_hold_1_walk.json")
+        self.__animation: Animation = AnimationLibrary.get(source = "sprites/iryo/iryo_atk_hold_1_walk.json")
 
         # Input.
         self.__move_vec: pyglet.math.Vec2 = pyglet.math.Vec2()
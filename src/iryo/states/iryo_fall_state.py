@@ -3,6 +3,7 @@ import pyglet
 
 from amonite.animation import Animation
 
+from animation_library import AnimationLibrary
 from iryo.iryo_data_node import IryoDataNode
 from iryo.states.iryo_state import IryoState
 from iryo.states.iryo_state import IryoStates
@@ -15,7 +16,7 @@ class IryoFallState(IryoState):
         super().__init__(actor)
 
         # Animations.
-        self.__animation: Animation = Animation(source = "sprites/iryo/iryo_fall.json")
+        self.__animation: Animation = AnimationLibrary.get(source = "sprites/iryo/iryo_fall.json")
         self.__animation_ended: bool = False
 
     def start(self) -> None:
@@ -1,6 +1,7 @@
 from amonite.animation import Animation
 import amonite.controllers as controllers
 
+from animation_library import AnimationLibrary
 from iryo.iryo_data_node import IryoDataNode
 from iryo.states.iryo_state import IryoState
 from iryo.states.iryo_state import IryoStates
@@ -28,7 +29,7 @@ class IryoIdleState(IryoState):
         super().__init__(actor)
 
         # Animations.
-        self.__animation: Animation = Animation(source = "sprites/iryo/iryo_idle.json")
+        self.__animation: Animation = AnimationLibrary.get(source = "sprites/iryo/iryo_idle.json")
 
         # Input.
         self.__move: bool = False
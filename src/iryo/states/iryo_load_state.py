@@ -3,6 +3,7 @@ import pyglet
 from amonite.animation import Animation
 import amonite.controllers as controllers
 
+from animation_library import AnimationLibrary
 from iryo.iryo_data_node import IryoDataNode
 from iryo.states.iryo_state import IryoState
 from iryo.states.iryo_state import IryoStates
@@ -25,7 +26,7 @@ class IryoLoadState(IryoState):
         super().__init__(actor)
 
         # Animations.
-        self.__animation: Animation = Animation(source = "sprites/iryo/iryo_atk_load.json")
+        self.__animation: Animation = AnimationLibrary.get(source = "sprites/iryo/iryo_atk_load.json")
         self.__animation_ended: bool = False
 
     def start(self) -> None:
@@ -1,5 +1,6 @@
 from amonite.animation import Animation
 
+from animation_library import AnimationLibrary
 from iryo.iryo_data_node import IryoDataNode
 from iryo.states.iryo_state import IryoState
 from iryo.states.iryo_state import IryoStates
@@ -23,7 +24,7 @@ class IryoRollState(IryoState):
         super().__init__(actor)
 
         # Animations.
-        self.__animation: Animation = Animation(source = "sprites/iryo/iryo_roll_1.json")
+        self.__animation: Animation = AnimationLibrary.get(source = "sprites/iryo/iryo_roll_1.json")
         self.__startup: bool = False
         self.__animation_ended: bool = True
 
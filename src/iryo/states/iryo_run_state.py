@@ -4,6 +4,7 @@ import pyglet.math as pm
 from amonite.animation import Animation
 import amonite.controllers as controllers
 
+from animation_library import AnimationLibrary
 from iryo.iryo_data_node import IryoDataNode
 from iryo.states.iryo_state import IryoState
 from iryo.states.iryo_state import IryoStates
@@ -32,7 +33,7 @@ class IryoRunState(IryoState):
         super().__init__(actor)
 
         # Animations.
-        self.__animation: Animation = Animation(source = "sprites/iryo/iryo_run_2.json")
+        self.__animation: Animation = AnimationLibrary.get(source = "sprites/iryo/iryo_run_2.json")
 
         # Input.
         self.__move_vec: pyglet.math.Vec2 = pyglet.math.Vec2()
@@ -3,11 +3,12 @@ import pyglet
 from amonite.animation import Animation
 import amonite.controllers as controllers
 
+from animation_library import AnimationLibrary
 from iryo.iryo_data_node import IryoDataNode
 from iryo.states.iryo_state import IryoState
 from iryo.states.iryo_state import IryoStates
+from sound_bank import SoundBank
 from constants import uniques
-from arrow_node import ArrowNode
 
 class IryoShootState(IryoState):
     """
@@ -30,7 +31,7 @@ class IryoShootState(IryoState):
         super().__init__(actor)
 
         # Animations.
-        self.__animation: Animation = Animation(source = "sprites/iryo/iryo_atk_shoot_1.json")
+        self.__animation: Animation = AnimationLibrary.get(source = "sprites/iryo/iryo_atk_shoot_1.json")
         self.__animation_ended: bool = False
 
         # Input.
@@ -44,16 +45,16 @@ class IryoShootState(IryoState):
         # Hide loading indicator.
         self.actor.draw_indicator.hide()
 
-        if uniques.ACTIVE_SCENE is not None:
-            # Create a projectile.
-            uniques.ACTIVE_SCENE.add_child(ArrowNode(
+        if uniques.ARROW_POOL is not None:
+            # Shoot a projectile.
+            uniques.ARROW_POOL.fire(
                 x = self.actor.x + self.actor.scope_offset[0],
                 y = self.actor.y + self.actor.scope_offset[1],
                 speed = 500.0,
-                direction = self.actor.stats.look_dir,
-                batch = self.actor.batch
-            ))
+                direction = self.actor.stats.look_dir
+            )
 
+        if uniques.ACTIVE_SCENE is not None:
             # Camera feedback.
             uniques.ACTIVE_SCENE.apply_cam_impulse(
                 impulse = pyglet.math.Vec2.from_polar(
@@ -62,7 +63,7 @@ class IryoShootState(IryoState):
                 )
             )
 
-        controllers.SOUND_CONTROLLER.play_effect(self.actor.shoot_sound)
+        SoundBank.play_effect(self.actor.shoot_sound)
 
         # Stop moving.
         self.actor.stats.speed = 0.0
@@ -41,6 +41,17 @@ class IryoStateMachine(StateMachine):
         if isinstance(current_state, IryoState):
             current_state.disable_input()
 
+    def reset(self) -> None:
+        """
+        Enables input handling on all states and goes back to IDLE, just like a newly created state machine.
+        """
+
+        for state in self.states.values():
+            if isinstance(state, IryoState):
+                state.enable_input()
+
+        self.set_state(IryoStates.IDLE)
+
     def on_collision(self, tags: list[str], enter: bool) -> None:
         # Transition to fall state if a fall collision is met.
         if enter and collision_tags.FALL in tags:
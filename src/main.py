@@ -1,15 +1,25 @@
+import argparse
 import os.path
+import random
 import time
 import asyncio
 import pyglet
 import pyglet.gl as gl
 
 from constants import uniques
+from constants.simulation import SIMULATION_DT
 import amonite.controllers as controllers
-from amonite.benchmark import Benchmark
 from amonite.dungen.dungen import random_walk
 from amonite.inventory_controller import MenuController
 from playable_scene_node import PlayableSceneNode
+from room_preloader import RoomPreloader
+from scene_cache import DEFAULT_BUDGET, DEFAULT_MAX_SCENES, SceneCache
+from sound_bank import SoundBank
+from voice_pool import VoicePoolStats
+from input_recording import InputRecorder
+from redraw_tracker import RedrawTracker
+from gameplay_profiler import GameplayProfiler
+from grid_collision_controller import GridCollisionController
 from amonite.upscaler import TrueUpscaler
 from amonite.settings import GLOBALS, SETTINGS, Keys, load_settings
 
@@ -50,12 +60,21 @@ vert_shader = pyglet.graphics.shader.Shader(pyglet.sprite.vertex_source, "vertex
 frag_shader = pyglet.graphics.shader.Shader(FRAGMENT_SOURCE, "fragment")
 upscaler_program = pyglet.graphics.shader.ShaderProgram(vert_shader, frag_shader)
 
+# Maximum amount of fixed updates run per frame, past which the game slows down instead.
+MAX_UPDATE_STEPS: int = 8
+
 class Rughai:
     """
     Main class: this is where scene changing happens and everything is set up.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        record: str | None = None,
+        seed: int | None = None,
+        profile: bool = False,
+        profile_csv: str | None = None
+    ) -> None:
         # Set resources path.
         pyglet.resource.path = [f"{os.path.dirname(__file__)}/../assets"]
         pyglet.resource.reindex()
@@ -77,6 +96,7 @@ class Rughai:
 
         # Controllers.
         controllers.create_controllers(window = self.__window)
+        controllers.COLLISION_CONTROLLER = GridCollisionController()
         controllers.INVENTORY_CONTROLLER.load_file("inventory_mock.json")
         print(controllers.INVENTORY_CONTROLLER)
         controllers.MENU_CONTROLLER.load_file(src = "inventory.json")
@@ -100,16 +120,51 @@ class Rughai:
             program = upscaler_program
         )
 
-        # Create benchmarks.
-        self.__update_bench = Benchmark(
-            window = self.__window,
-            text = "UT: ",
-            y = 80
+        # Set up the window matrix, which is then only updated on resize.
+        self.on_resize(width = self.__window.width, height = self.__window.height)
+
+        # Frame profiler measures each subsystem separately.
+        uniques.PROFILER.enabled = SETTINGS[Keys.DEBUG] or profile or profile_csv is not None
+        if profile_csv is not None:
+            uniques.PROFILER.open_csv(dest = profile_csv)
+
+        # Gameplay profiling snapshots, enabled through settings.
+        self.__gameplay_profiler: GameplayProfiler | None = GameplayProfiler.from_settings(
+            dest_dir = f"{os.path.dirname(__file__)}/../profiles"
         )
-        self.__render_bench = Benchmark(
-            window = self.__window,
-            text = "RT: ",
-            y = 50
+
+        # Simulation runs on a fixed timestep, decoupled from rendering and from the target FPS.
+        self.__step_dt: float = SIMULATION_DT
+
+        # Time yet to be simulated.
+        self.__accumulator: float = 0.0
+
+        # Input recording, replayable by the headless runner.
+        self.__record_dest: str | None = record
+        self.__recorder: InputRecorder | None = None
+        if record is not None:
+            # Recordings need a known seed in order to be replayed deterministically.
+            seed = seed if seed is not None else 0
+            random.seed(seed)
+
+            self.__recorder = InputRecorder(
+                room = "r_0_0",
+                seed = seed,
+                dt = self.__step_dt
+            )
+            self.__window.push_handlers(self.__recorder)
+            for controller in pyglet.input.get_controllers():
+                controller.push_handlers(self.__recorder)
+        elif seed is not None:
+            random.seed(seed)
+
+        # Neighbouring rooms are preloaded in the background, so that traversing doors does not stall.
+        self.__room_preloader: RoomPreloader = RoomPreloader()
+
+        # Recently left rooms are kept suspended, so that walking back through a door does not rebuild them.
+        self.__scene_cache: SceneCache = SceneCache(
+            max_scenes = SETTINGS.get("scene_cache_size", DEFAULT_MAX_SCENES),
+            budget = SETTINGS.get("scene_cache_budget", DEFAULT_BUDGET)
         )
 
         # Create a scene.
@@ -148,21 +203,36 @@ class Rughai:
     def __on_scene_end(self, bundle: dict):
         print("scene_ended", bundle)
         if bundle["next_scene"]:
-            # First delete the current scene then clear controllers.
-            self.__active_scene.delete()
-            controllers.COLLISION_CONTROLLER.clear()
-            controllers.INTERACTION_CONTROLLER.clear()
-
-            self.set_active_scene(
+            # Suspend the current scene, detaching it from controllers.
+            self.__scene_cache.store(self.__active_scene)
+
+            # Resume the next scene if recently left, otherwise build it.
+            scene: PlayableSceneNode | None = self.__scene_cache.take(bundle["next_scene"])
+            if scene is not None:
+                scene.resume(bundle = bundle)
+            else:
                 scene = PlayableSceneNode(
                     name = bundle["next_scene"],
                     window = self.__window,
                     view_width = SETTINGS[Keys.VIEW_WIDTH],
                     view_height = SETTINGS[Keys.VIEW_HEIGHT],
                     bundle = bundle,
-                    on_ended = self.__on_scene_end
+                    on_ended = self.__on_scene_end,
+                    room = self.__room_preloader.take(bundle["next_scene"])
                 )
-            )
+
+            self.set_active_scene(scene = scene)
+
+            # Caches usage is only reported while debugging or profiling.
+            if self.__reports_stats():
+                print("scene_cache", self.__scene_cache.stats)
+
+                voice_stats: VoicePoolStats | None = SoundBank.get_voice_stats()
+                if voice_stats is not None:
+                    print("sound_voices", voice_stats)
+
+    def __reports_stats(self) -> bool:
+        return SETTINGS[Keys.DEBUG] or uniques.PROFILER.enabled or self.__gameplay_profiler is not None
 
     def set_active_scene(self, scene: PlayableSceneNode) -> None:
         """
@@ -170,52 +240,129 @@ class Rughai:
         """
 
         self.__active_scene = scene
+        RedrawTracker.mark_dirty()
 
         # Make sure the active scene was set globally.
         assert uniques.ACTIVE_SCENE is not None
 
-    def on_draw(self) -> None:
+        # Start preloading all rooms reachable from the new one, unless already cached.
+        self.__room_preloader.preload([name for name in scene.neighbours if name not in self.__scene_cache])
+
+    def on_resize(self, width: int, height: int) -> bool:
         """
-        Draws everything to the screen.
+        Updates the viewport and window matrix, which only change along with the window size.
         """
 
-        # Update window matrix.
+        gl.glViewport(0, 0, *self.__window.get_framebuffer_size())
+
         self.__window.projection = pyglet.math.Mat4.orthogonal_projection(
             left = 0,
-            right = self.__window.width,
+            right = width,
             bottom = 0,
-            top = self.__window.height,
+            top = height,
             # For some reason near and far planes are inverted in sign, so that -500 means 500 and 1024 means -1024.
             z_near = -3000,
             z_far = 3000
         )
 
-        # Benchmark measures render time.
-        with self.__render_bench:
-            self.__window.clear()
+        RedrawTracker.mark_dirty()
+
+        # Skip the window's default handler, which would reset the projection.
+        return pyglet.event.EVENT_HANDLED
+
+    def on_expose(self) -> None:
+        RedrawTracker.mark_dirty()
+
+    def on_draw(self) -> None:
+        """
+        Draws everything to the screen.
+        """
 
-            # Upscaler handles maintaining the wanted output resolution.
-            with self.__upscaler:
-                self.__active_scene.draw()
+        with uniques.PROFILER.scope("draw"):
+            self.__window.clear()
 
-                if SETTINGS[Keys.DEBUG]:
-                    self.__render_bench.draw()
-                    self.__update_bench.draw()
-                    self.__fps_display.draw()
+            # Debug overlays change on every frame.
+            if uniques.PROFILER.enabled or SETTINGS[Keys.DEBUG]:
+                RedrawTracker.mark_dirty()
+
+            if RedrawTracker.needs_redraw(
+                batches = self.__active_scene.get_batches(),
+                view = self.__active_scene.get_view_state()
+            ):
+                # Upscaler handles maintaining the wanted output resolution.
+                with self.__upscaler:
+                    with uniques.PROFILER.scope("scene"):
+                        self.__active_scene.draw()
+
+                    if uniques.PROFILER.enabled:
+                        uniques.PROFILER.draw()
+
+                    if SETTINGS[Keys.DEBUG]:
+                        self.__fps_display.draw()
+            else:
+                # Nothing changed since the last frame, so just present the last upscaled frame again.
+                self.__upscaler.sprite.draw()
+
+        # A frame ends with its rendering.
+        uniques.PROFILER.end_frame()
+        if self.__gameplay_profiler is not None:
+            self.__gameplay_profiler.end_frame(room = self.__active_scene.name)
 
     def update(self, dt: float) -> None:
         # upscaler_program["dt"] = dt
-        # Benchmark measures update time.
-        with self.__update_bench:
-            # Compute collisions through collision manager.
-            controllers.COLLISION_CONTROLLER.update(dt = dt)
+        with uniques.PROFILER.scope("update"):
+            # Simulate in fixed steps, no matter the actual frame time.
+            self.__accumulator += dt
+            steps: int = 0
+            while self.__accumulator >= self.__step_dt:
+                # Drop any time left after too many steps, so that slow steps do not lead to more and more steps.
+                if steps >= MAX_UPDATE_STEPS:
+                    self.__accumulator %= self.__step_dt
+                    break
+
+                self.__step()
+                self.__accumulator -= self.__step_dt
+                steps += 1
+
+            # Render sprites in between the last two steps, according to the time left to simulate.
+            with uniques.PROFILER.scope("scene"):
+                self.__active_scene.interpolate(alpha = self.__accumulator / self.__step_dt)
+
+            # Spend what's left of a small time budget building preloaded rooms.
+            with uniques.PROFILER.scope("room_preloader"):
+                self.__room_preloader.update()
+
+    def __step(self) -> None:
+        """
+        Performs a single fixed timestep update.
+        """
+
+        # Compute collisions through collision manager.
+        with uniques.PROFILER.scope("collisions"):
+            controllers.COLLISION_CONTROLLER.update(dt = self.__step_dt)
+
+        # InputController makes sure every input is handled correctly.
+        # Camera and curtain are updated by the scene itself, so they're measured as the scene's own time.
+        with controllers.INPUT_CONTROLLER:
+            with uniques.PROFILER.scope("scene"):
+                self.__active_scene.update(dt = self.__step_dt)
+
+        if self.__recorder is not None:
+            self.__recorder.tick()
+
+    def on_close(self) -> None:
+        uniques.PROFILER.close_csv()
+
+        if self.__gameplay_profiler is not None:
+            self.__gameplay_profiler.stop()
 
-            # InputController makes sure every input is handled correctly.
-            with controllers.INPUT_CONTROLLER:
-                self.__active_scene.update(dt = dt)
+        # Store recorded inputs before leaving.
+        if self.__recorder is not None and self.__record_dest is not None:
+            self.__recorder.save(dest = self.__record_dest)
+            print(f"Inputs recorded to {self.__record_dest}")
 
     def run(self) -> None:
-        pyglet.clock.schedule_interval(self.update, 1.0 / (2.0 * SETTINGS[Keys.TARGET_FPS]))
+        pyglet.clock.schedule_interval(self.update, 1.0 / SETTINGS[Keys.TARGET_FPS])
         pyglet.app.run(interval =  1.0 / SETTINGS[Keys.TARGET_FPS])
 
 # map_res = random_walk(
@@ -231,4 +378,16 @@ class Rughai:
 
 # print(map_res_trans)
 
-Rughai().run()
\ No newline at end of file
+parser = argparse.ArgumentParser(description = "Rughai")
+parser.add_argument("--record", help = "file to record inputs to, replayable through headless.py")
+parser.add_argument("--seed", type = int, help = "random seed")
+parser.add_argument("--profile", action = "store_true", help = "enable the frame profiler overlay, also enabled on debug")
+parser.add_argument("--profile-csv", help = "file to write per-frame profiler timings to, as csv")
+args = parser.parse_args()
+
+Rughai(
+    record = args.record,
+    seed = args.seed,
+    profile = args.profile,
+    profile_csv = args.profile_csv
+).run()
\ No newline at end of file
@@ -0,0 +1,115 @@
+import json
+import os
+import threading
+import time
+
+# Default time without any new snapshot after which pending maps are written, in seconds.
+DEFAULT_QUIET_TIME: float = 1.0
+
+def write_map(
+    dest: str,
+    data: dict
+) -> None:
+    """
+    Writes the provided map [data] to [dest] atomically: the file is first written to a temporary file in the same
+    directory, then renamed over [dest], so that readers never see a partially written map.
+    """
+
+    tmp_path: str = f"{dest}.tmp"
+
+    with open(file = tmp_path, mode = "w", encoding = "UTF8") as tmp_file:
+        tmp_file.write(json.dumps(data, indent = 4))
+        tmp_file.flush()
+        os.fsync(tmp_file.fileno())
+
+    os.replace(tmp_path, dest)
+
+class MapPersistence:
+    """
+    Writes map changes to disk on a background thread.
+    Map snapshots are queued by destination file, so that only the latest snapshot of every file is ever written,
+    then serialized and written on a single background thread once no new snapshot came in for the quiet time.
+    Snapshots should only contain plain data (as returned by loaders' to_data), since they're serialized away from the main thread.
+    """
+
+    quiet_time: float = DEFAULT_QUIET_TIME
+
+    __condition: threading.Condition = threading.Condition()
+    __pending: dict[str, dict] = {}
+    __last_submit: float = 0.0
+    __writing: int = 0
+    __worker: threading.Thread | None = None
+
+    @staticmethod
+    def submit(
+        dest: str,
+        data: dict
+    ) -> None:
+        """
+        Queues map [data] to be written to [dest], replacing any snapshot still pending for the same file.
+        """
+
+        with MapPersistence.__condition:
+            MapPersistence.__pending[dest] = data
+            MapPersistence.__last_submit = time.perf_counter()
+
+            if MapPersistence.__worker is None:
+                MapPersistence.__worker = threading.Thread(target = MapPersistence.__work, daemon = True)
+                MapPersistence.__worker.start()
+
+            MapPersistence.__condition.notify_all()
+
+    @staticmethod
+    def is_dirty() -> bool:
+        """
+        Tells whether any map is still waiting to be written.
+        """
+
+        with MapPersistence.__condition:
+            return len(MapPersistence.__pending) > 0 or MapPersistence.__writing > 0
+
+    @staticmethod
+    def flush() -> None:
+        """
+        Writes all pending maps right away, waiting for any write in progress to complete.
+        """
+
+        with MapPersistence.__condition:
+            # Wait for the worker to write whatever it already took.
+            while MapPersistence.__writing > 0:
+                MapPersistence.__condition.wait()
+
+            pending: dict[str, dict] = MapPersistence.__pending
+            MapPersistence.__pending = {}
+
+        for dest, data in pending.items():
+            write_map(dest = dest, data = data)
+
+    @staticmethod
+    def __work() -> None:
+        while True:
+            with MapPersistence.__condition:
+                # Wait for a snapshot.
+                while len(MapPersistence.__pending) <= 0:
+                    MapPersistence.__condition.wait()
+
+                # Wait for the quiet time to elapse, restarting whenever a new snapshot comes in.
+                remaining: float = MapPersistence.__last_submit + MapPersistence.quiet_time - time.perf_counter()
+                if remaining > 0.0:
+                    MapPersistence.__condition.wait(timeout = remaining)
+                    continue
+
+                pending: dict[str, dict] = MapPersistence.__pending
+                MapPersistence.__pending = {}
+                MapPersistence.__writing += 1
+
+            try:
+                for dest, data in pending.items():
+                    try:
+                        write_map(dest = dest, data = data)
+                    except OSError as error:
+                        print(f"Could not write map {dest}: {error}")
+            finally:
+                with MapPersistence.__condition:
+                    MapPersistence.__writing -= 1
+                    MapPersistence.__condition.notify_all()
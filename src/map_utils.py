@@ -0,0 +1,75 @@
+from typing import Sequence
+
+def read_pair(value: str | Sequence[float]) -> tuple[float, float]:
+    """
+    Reads a pair of floats from [value], which can either be a comma separated string, as stored in json maps,
+    or an already parsed pair, as read from room bundles.
+    """
+
+    if isinstance(value, str):
+        items: list[str] = value.split(",")
+
+        assert len(items) == 2
+
+        return (float(items[0]), float(items[1]))
+
+    assert len(value) == 2
+
+    return (float(value[0]), float(value[1]))
+
+def merge_rects(rects: Sequence[tuple[float, float, float, float]]) -> list[tuple[float, float, float, float]]:
+    """
+    Merges all provided [rects] (x, y, width, height) into as few rects as possible covering the exact same area.
+    Rects are rasterized on the grid of all their distinct edges, then covered greedily row by row, each rect growing
+    right and then up as far as the covered area allows. Resulting rects can overlap, but are never more than the provided ones.
+    Degenerate rects (zero width or height) are kept as they are, since they cover no area.
+    """
+
+    degenerate: list[tuple[float, float, float, float]] = [rect for rect in rects if rect[2] <= 0.0 or rect[3] <= 0.0]
+    solid: list[tuple[float, float, float, float]] = [rect for rect in rects if rect[2] > 0.0 and rect[3] > 0.0]
+
+    if len(solid) <= 1:
+        return list(rects)
+
+    # Distinct edges along each axis, delimiting grid columns and rows.
+    xs: list[float] = sorted({edge for rect in solid for edge in (rect[0], rect[0] + rect[2])})
+    ys: list[float] = sorted({edge for rect in solid for edge in (rect[1], rect[1] + rect[3])})
+    x_indices: dict[float, int] = {x: i for i, x in enumerate(xs)}
+    y_indices: dict[float, int] = {y: i for i, y in enumerate(ys)}
+
+    # Rasterize rects.
+    occupied: list[list[bool]] = [[False] * (len(xs) - 1) for _ in range(len(ys) - 1)]
+    for rect in solid:
+        for row in range(y_indices[rect[1]], y_indices[rect[1] + rect[3]]):
+            for column in range(x_indices[rect[0]], x_indices[rect[0] + rect[2]]):
+                occupied[row][column] = True
+
+    # Cover all occupied cells, starting a new rect from each cell not covered yet.
+    covered: list[list[bool]] = [[False] * (len(xs) - 1) for _ in range(len(ys) - 1)]
+    merged: list[tuple[float, float, float, float]] = []
+    for row in range(len(occupied)):
+        for column in range(len(occupied[row])):
+            if not occupied[row][column] or covered[row][column]:
+                continue
+
+            # Grow right as far as possible.
+            right: int = column
+            while right + 1 < len(occupied[row]) and occupied[row][right + 1]:
+                right += 1
+
+            # Then grow up as long as the whole span is occupied.
+            top: int = row
+            while top + 1 < len(occupied) and all(occupied[top + 1][column:right + 1]):
+                top += 1
+
+            for covered_row in range(row, top + 1):
+                for covered_column in range(column, right + 1):
+                    covered[covered_row][covered_column] = True
+
+            merged.append((xs[column], ys[row], xs[right + 1] - xs[column], ys[top + 1] - ys[row]))
+
+    # Greedy covers are not optimal, so just keep the provided rects in the rare cases they're fewer.
+    if len(merged) >= len(solid):
+        return list(rects)
+
+    return degenerate + merged
@@ -1,25 +1,34 @@
+import random
 from typing import Callable
 import pyglet
 
 import amonite.controllers as controllers
 from amonite.door_node import DoorNode
 from amonite.fall_node import FallNode
+from amonite.interaction_node import InteractionNode
 from amonite.menu.menu_node import MenuNode
 from amonite.node import Node, PositionNode
-from amonite.scene_node import SceneNode
 from amonite.settings import SETTINGS, Keys
 from amonite.sprite_node import SpriteNode
 from amonite.tilemap_node import TilemapNode
 from amonite.wall_node import WallNode
 from amonite.utils import utils
-from amonite.utils.walls_loader import WallsLoader
 
+from arrow_pool import ArrowPool
 from doors_loader import DoorsLoader
 from falls_loader import FallsLoader
+from grid_collision_controller import ColliderSet, GridCollisionController
 from idle_prop_loader import IdlePropLoader
 from iryo.iryo_node import IryoNode
 from prop_loader import PropLoader
+from props.prop_activation_grid import PropActivationGrid
 from clouds_node import CloudsNode
+from redraw_tracker import RedrawTracker
+from resumable_scene_node import ResumableSceneNode
+from room_preloader import PreloadedRoom, RoomData
+from sound_bank import SoundBank
+from tile_layer_node import TileLayerNode
+from walls_loader import WallsLoader
 from constants import uniques
 
 class PlayableSceneNode(Node):
@@ -39,6 +48,8 @@ class PlayableSceneNode(Node):
     bundle: dict | None
         Starting bundle of the scene. The bundle is structured as follows:
         "destination"
+    room: PreloadedRoom | None
+        Already built room resources. The room is built on the spot if not provided.
     """
 
     def __init__(
@@ -48,17 +59,19 @@ class PlayableSceneNode(Node):
         view_width: int,
         view_height: int,
         bundle: dict | None = None,
-        on_ended: Callable[[dict], None] | None = None
+        on_ended: Callable[[dict], None] | None = None,
+        room: PreloadedRoom | None = None
     ) -> None:
         super().__init__()
 
+        self.name: str = name
         self.window = window
         self.on_ended = on_ended
 
         self.bundle: dict | None = bundle
 
         # Define the scene.
-        uniques.ACTIVE_SCENE = SceneNode(
+        uniques.ACTIVE_SCENE = ResumableSceneNode(
             window = window,
             view_width = view_width,
             view_height = view_height,
@@ -68,6 +81,29 @@ class PlayableSceneNode(Node):
             on_scene_end = self._on_scene_end
         )
 
+        # Give the scene its own random stream, derived from the global one so that seeded runs replay the same.
+        uniques.SCENE_RNG = random.Random(random.getrandbits(64))
+
+        # Scene globals, kept along with the scene so that they can be restored when resuming it after a suspension.
+        self.__scene: ResumableSceneNode = uniques.ACTIVE_SCENE
+        self.__scene_rng: random.Random = uniques.SCENE_RNG
+
+        # Colliders and interactions of the scene while suspended.
+        self.__colliders: ColliderSet | None = None
+        self.__interactions: list[InteractionNode] = []
+
+        # Build the room right away if not already preloaded.
+        if room is None:
+            room = PreloadedRoom(data = RoomData(name = name))
+            room.finish()
+
+        # Room graphics were already created in their own batch, so the scene just uses it.
+        uniques.ACTIVE_SCENE.world_batch = room.batch
+        self.__tilemaps: list[TilemapNode | TileLayerNode] = room.tilemaps
+
+        # Names of all rooms reachable from this one.
+        self.neighbours: list[str] = room.data.neighbours
+
         # Inventory.
         # inventory: InventoryNode = InventoryNode(
         #     view_width = view_width,
@@ -100,62 +136,49 @@ class PlayableSceneNode(Node):
         menu.set_section_slot_res("quik", ammo_slot_image)
 
         # Scene music.
-        self.scene_music: pyglet.media.Source = pyglet.resource.media(name = "sounds/rughai_myst.wav")
-        controllers.SOUND_CONTROLLER.set_music(self.scene_music)
+        self.scene_music: str = "sounds/rughai_myst.wav"
+        SoundBank.play_music(name = self.scene_music)
 
         # Define a tilemap.
-        tilemaps: list[TilemapNode] = TilemapNode.from_tmx_file(
-            source = f"tilemaps/{name}.tmx",
-            tilesets_path = "tilesets/rughai/",
-            batch = uniques.ACTIVE_SCENE.world_batch
-        )
+        tilemaps: list[TilemapNode | TileLayerNode] = room.tilemaps
         self.__tile_size = tilemaps[0].get_tile_size()[0]
-        tilemap_width = tilemaps[0].map_width
-        tilemap_height = tilemaps[0].map_height
         cam_bounds = tilemaps[0].bounds
 
         # Solid walls.
-        walls: list[WallNode] = WallsLoader.fetch(
-            source = f"wallmaps/{name}.json",
+        walls: list[WallNode] = WallsLoader.from_data(
+            data = room.data.walls,
             batch = uniques.ACTIVE_SCENE.world_batch
         )
 
         # Falls.
-        falls: list[FallNode] = FallsLoader.fetch(
-            source = f"fallmaps/{name}.json",
+        falls: list[FallNode] = FallsLoader.from_data(
+            data = room.data.falls,
             batch = uniques.ACTIVE_SCENE.world_batch
         )
 
         # Place doors.
-        doors: list[DoorNode] = DoorsLoader.fetch(
-            source = f"doormaps/{name}.json",
+        doors: list[DoorNode] = DoorsLoader.from_data(
+            data = room.data.doors,
             tile_size = (self.__tile_size, self.__tile_size),
             on_triggered = self.on_door_triggered,
+            dst_doormaps = room.data.dst_doormaps,
             batch = uniques.ACTIVE_SCENE.world_batch
         )
 
         # Props.
-        idle_props = IdlePropLoader.fetch(
-            source = f"idlepropmaps/{name}.json",
+        idle_props = IdlePropLoader.from_data(
+            data = room.data.idle_props,
             batch = uniques.ACTIVE_SCENE.world_batch
         )
-        props = PropLoader.fetch(
-            source = f"propmaps/{name}.json",
+        props = PropLoader.from_data(
+            data = room.data.props,
             world_batch = uniques.ACTIVE_SCENE.world_batch,
             ui_batch = uniques.ACTIVE_SCENE.ui_batch
         )
 
         # Define a background.
-        bg_image = pyglet.resource.image("bg.png")
-        utils.set_anchor(bg_image, center = True)
-        bg: SpriteNode = SpriteNode(
-            resource = bg_image,
-            x = (tilemap_width * self.__tile_size) // 2,
-            y = (tilemap_height * self.__tile_size) // 2,
-            y_sort = False,
-            z = -1500,
-            batch = uniques.ACTIVE_SCENE.world_batch
-        )
+        assert room.bg is not None
+        bg: SpriteNode = room.bg
 
         # Player.
         player_position: tuple[int, int] = (
@@ -163,6 +186,7 @@ class PlayableSceneNode(Node):
             bundle["player_position"][1] if bundle else 25 * self.__tile_size,
         )
         cam_target: PositionNode = PositionNode()
+        self.__cam_target: PositionNode = cam_target
         self._player: IryoNode = IryoNode(
             cam_target = cam_target,
             x = player_position[0],
@@ -170,6 +194,18 @@ class PlayableSceneNode(Node):
             batch = uniques.ACTIVE_SCENE.world_batch
         )
 
+        # Only props close to the camera target are updated.
+        props_grid: PropActivationGrid = PropActivationGrid(
+            props = [*idle_props, *props],
+            center = cam_target,
+            view_width = view_width,
+            view_height = view_height
+        )
+
+        # Projectiles, allocated once for the whole scene.
+        uniques.ARROW_POOL = ArrowPool(batch = uniques.ACTIVE_SCENE.world_batch)
+        self.__arrow_pool: ArrowPool = uniques.ARROW_POOL
+
         # Clouds.
         clouds = CloudsNode(
             bounds = cam_bounds,
@@ -186,11 +222,21 @@ class PlayableSceneNode(Node):
         uniques.ACTIVE_SCENE.add_children(falls)
         uniques.ACTIVE_SCENE.add_child(cam_target, cam_target = True)
         uniques.ACTIVE_SCENE.add_child(clouds)
-        uniques.ACTIVE_SCENE.add_children(idle_props)
-        uniques.ACTIVE_SCENE.add_children(props)
+        uniques.ACTIVE_SCENE.add_child(props_grid)
         uniques.ACTIVE_SCENE.add_child(self._player)
+        uniques.ACTIVE_SCENE.add_child(uniques.ARROW_POOL)
         uniques.ACTIVE_SCENE.add_children(doors)
 
+    def get_state(self) -> dict:
+        """
+        Returns a serializable snapshot of the scene state.
+        """
+
+        return {
+            "room": self.name,
+            "player": self._player.get_state() if self._player is not None else None
+        }
+
     def _on_scene_end(self) -> None:
         if self.on_ended:
             # Pass a package containing all useful information for the next room.
@@ -209,6 +255,37 @@ class PlayableSceneNode(Node):
             if self._player is not None:
                 self._player.disable_controls()
 
+    def get_batches(self) -> tuple[pyglet.graphics.Batch, ...]:
+        """
+        Returns all batches drawn by the scene.
+        """
+
+        if uniques.ACTIVE_SCENE is None:
+            return ()
+
+        return (uniques.ACTIVE_SCENE.world_batch, uniques.ACTIVE_SCENE.ui_batch)
+
+    def get_view_state(self) -> tuple:
+        """
+        Returns the scene state affecting rendering without touching any batch: camera offset and zoom, plus curtain opacity.
+        """
+
+        if uniques.ACTIVE_SCENE is None:
+            return ()
+
+        # Camera and curtain are private to amonite's scene, so redraw every frame if they cannot be found.
+        camera = getattr(uniques.ACTIVE_SCENE, "_SceneNode__camera", None)
+        curtain_fill: float | None = getattr(uniques.ACTIVE_SCENE, "_SceneNode__curtain_opacity_fill", None)
+        if camera is None or curtain_fill is None:
+            RedrawTracker.mark_dirty()
+            return ()
+
+        return (
+            # Sub pixel camera movements (e.g. while easing to a halt) are not visible.
+            (round(camera.offset_x, 2), round(camera.offset_y, 2), camera.zoom),
+            curtain_fill
+        )
+
     def draw(self) -> None:
         if uniques.ACTIVE_SCENE is not None:
             uniques.ACTIVE_SCENE.draw()
@@ -221,6 +298,109 @@ class PlayableSceneNode(Node):
         if uniques.ACTIVE_SCENE is not None:
             uniques.ACTIVE_SCENE.update(dt)
 
+    def interpolate(self, alpha: float) -> None:
+        """
+        Places moving sprites at [alpha] (between 0 and 1) of the way between their last two simulated positions.
+        """
+
+        if self._player is not None:
+            self._player.interpolate(alpha = alpha)
+
+        if uniques.ARROW_POOL is not None:
+            uniques.ARROW_POOL.interpolate(alpha = alpha)
+
+    def suspend(self) -> None:
+        """
+        Detaches the scene from all controllers and globals, without destroying anything, so that it can be resumed later on.
+        Must be called on the active scene.
+        """
+
+        assert isinstance(controllers.COLLISION_CONTROLLER, GridCollisionController)
+        assert uniques.ACTIVE_SCENE is self.__scene
+
+        # Scenes are suspended while updating, so stop children from updating right away with other scenes' globals.
+        self.__scene.freeze()
+
+        self.__colliders = controllers.COLLISION_CONTROLLER.detach()
+
+        self.__interactions = list(controllers.INTERACTION_CONTROLLER.interactions)
+        controllers.INTERACTION_CONTROLLER.clear()
+        controllers.INTERACTION_CONTROLLER.active_interaction = None
+
+        # Keep the scene random stream where it got to.
+        self.__scene_rng = uniques.SCENE_RNG
+
+        uniques.ACTIVE_SCENE = None
+        uniques.ARROW_POOL = None
+
+    def resume(self, bundle: dict) -> None:
+        """
+        Makes the suspended scene active again, placing the player as stated in [bundle], then opens its curtain again.
+        """
+
+        assert isinstance(controllers.COLLISION_CONTROLLER, GridCollisionController)
+        assert self.__colliders is not None
+
+        controllers.COLLISION_CONTROLLER.attach(self.__colliders)
+        self.__colliders = None
+
+        controllers.INTERACTION_CONTROLLER.interactions.extend(self.__interactions)
+        self.__interactions = []
+
+        uniques.ACTIVE_SCENE = self.__scene
+        uniques.SCENE_RNG = self.__scene_rng
+        uniques.ARROW_POOL = self.__arrow_pool
+
+        self.bundle = bundle
+
+        SoundBank.play_music(name = self.scene_music)
+
+        # Place the player and snap the camera to it, as if the scene was just created.
+        player_position: tuple[float, float] = (bundle["player_position"][0], bundle["player_position"][1])
+        self._player.reset()
+        self._player.teleport(position = player_position)
+        self.__cam_target.set_position(player_position)
+        self.__scene.remove_child(self.__cam_target)
+        self.__scene.add_child(self.__cam_target, cam_target = True)
+
+        self.__scene.melt()
+        self.__scene.reopen()
+
+    def get_memory_size(self) -> int:
+        """
+        Returns an estimate of the memory (in bytes) held by the scene's graphics: vertex and index buffers, plus tile index textures.
+        """
+
+        size: int = 0
+
+        for batch in (self.__scene.world_batch, self.__scene.ui_batch):
+            for domains in batch.group_map.values():
+                for domain in domains.values():
+                    size += sum(buffer.size for buffer, _ in domain.buffer_attributes)
+
+                    index_buffer = getattr(domain, "index_buffer", None)
+                    if index_buffer is not None:
+                        size += index_buffer.size
+
+        for tilemap in self.__tilemaps:
+            if isinstance(tilemap, TileLayerNode):
+                size += tilemap.get_memory_size()
+
+        return size
+
     def delete(self) -> None:
-        if uniques.ACTIVE_SCENE is not None:
-            uniques.ACTIVE_SCENE.delete()
\ No newline at end of file
+        if self.__colliders is not None:
+            assert isinstance(controllers.COLLISION_CONTROLLER, GridCollisionController)
+
+            # Colliders of suspended scenes are not in the controller, so attach them back while deleting in order for them to be removed.
+            active_colliders: ColliderSet = controllers.COLLISION_CONTROLLER.detach()
+            controllers.COLLISION_CONTROLLER.attach(self.__colliders)
+            self.__scene.delete()
+            controllers.COLLISION_CONTROLLER.attach(active_colliders)
+            self.__colliders = None
+        else:
+            self.__scene.delete()
+
+        # Arrows were deleted along with the scene.
+        if uniques.ARROW_POOL is self.__arrow_pool:
+            uniques.ARROW_POOL = None
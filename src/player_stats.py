@@ -1,11 +1,124 @@
 import math
 import random
-from typing import Callable
+from typing import Callable, NamedTuple
+import numpy as np
 
 DEFAULT_MIN: float = 5.0
 DEFAULT_MAX: float = 20.0
 LEVELS: int = 25
 
+# Modifier indices, as used in stat blocks.
+VITALITY: int = 0
+RESISTANCE: int = 1
+ODDS: int = 2
+MODIFIERS_NUM: int = 3
+
+class StatCurve(NamedTuple):
+    """
+    Definition of a single stat, growing logarithmically with the level of its modifier.
+    """
+
+    # Name of the stat attribute.
+    name: str
+
+    # Index of the modifier driving the stat.
+    modifier: int
+
+    # Stat values at level 0 and at the maximum level.
+    min_value: float
+    max_value: float
+
+# All stats, in stat block column order.
+STAT_CURVES: tuple[StatCurve, ...] = (
+    # Resistance.
+    StatCurve(name = "max_health", modifier = RESISTANCE, min_value = DEFAULT_MIN, max_value = DEFAULT_MAX),
+    StatCurve(name = "defense", modifier = RESISTANCE, min_value = DEFAULT_MIN, max_value = DEFAULT_MAX),
+    StatCurve(name = "max_energy", modifier = RESISTANCE, min_value = DEFAULT_MIN, max_value = DEFAULT_MAX),
+    StatCurve(name = "min_draw_time", modifier = RESISTANCE, min_value = 1, max_value = 0.1),
+    # Vitality.
+    StatCurve(name = "max_speed", modifier = VITALITY, min_value = 60.0, max_value = 100.0),
+    StatCurve(name = "accel", modifier = VITALITY, min_value = 100.0, max_value = 400.0),
+    StatCurve(name = "attack", modifier = VITALITY, min_value = DEFAULT_MIN, max_value = DEFAULT_MAX),
+    StatCurve(name = "crit_damage", modifier = VITALITY, min_value = DEFAULT_MIN, max_value = DEFAULT_MAX),
+    StatCurve(name = "fail_damage", modifier = VITALITY, min_value = DEFAULT_MIN, max_value = DEFAULT_MAX),
+    # Odds.
+    StatCurve(name = "_crit_rate", modifier = ODDS, min_value = DEFAULT_MIN, max_value = DEFAULT_MAX),
+    StatCurve(name = "_fail_rate", modifier = ODDS, min_value = DEFAULT_MIN, max_value = DEFAULT_MAX)
+)
+
+class StatTable:
+    """
+    Stat values by level, computed for all levels at once.
+    Stats are served by lookup, either one at a time or as stat blocks for many characters at once.
+    """
+
+    # Stat values by stat (in STAT_CURVES order) and level.
+    __values: np.ndarray | None = None
+
+    # Same as above, as nested lists for single lookups.
+    __rows: list[list[float]] = []
+
+    # Modifier driving each stat.
+    __modifiers: np.ndarray = np.array([curve.modifier for curve in STAT_CURVES], dtype = np.intp)
+
+    @staticmethod
+    def get_values() -> np.ndarray:
+        """
+        Returns the table of all stat values, indexed by stat and level.
+        """
+
+        if StatTable.__values is None:
+            StatTable.__values = np.array([
+                [
+                    PlayerStats.compute_stat(
+                        level = level,
+                        max_level = LEVELS,
+                        min_value = curve.min_value,
+                        max_value = curve.max_value,
+                        variation = 0.0
+                    ) for level in range(LEVELS + 1)
+                ] for curve in STAT_CURVES
+            ])
+            StatTable.__rows = StatTable.__values.tolist()
+
+        return StatTable.__values
+
+    @staticmethod
+    def compute_block(
+        levels: tuple[int, int, int],
+        variations: tuple[float, float, float]
+    ) -> list[float]:
+        """
+        Computes the stat block of a single character, given its modifier [levels] and [variations].
+        Returns all stats in STAT_CURVES order.
+        """
+
+        assert all(level >= 0 and level <= LEVELS for level in levels), "Modifier out of range"
+
+        StatTable.get_values()
+
+        return [
+            row[levels[curve.modifier]] + variations[curve.modifier] for row, curve in zip(StatTable.__rows, STAT_CURVES)
+        ]
+
+    @staticmethod
+    def compute_blocks(
+        levels: np.ndarray,
+        variations: np.ndarray
+    ) -> np.ndarray:
+        """
+        Computes stat blocks for many characters at once.
+        [levels] and [variations] are (characters, MODIFIERS_NUM) arrays holding each character's modifier levels and variations.
+        Returns a (characters, stats) array, with stats in STAT_CURVES order.
+        """
+
+        assert np.all((levels >= 0) & (levels <= LEVELS)), "Modifier out of range"
+
+        stat_levels: np.ndarray = levels[:, StatTable.__modifiers]
+        stat_variations: np.ndarray = variations[:, StatTable.__modifiers]
+
+        return StatTable.get_values()[np.arange(len(STAT_CURVES)), stat_levels] + stat_variations
+
 class PlayerStats():
     def __init__(
         self,
@@ -14,98 +127,73 @@ class PlayerStats():
         odds: int = 0,
         variation: float = 0.0
     ):
+        # Modifier variations.
+        vitality_variation: float = random.random() * variation
+        resistance_variation: float = random.random() * variation
+        odds_variation: float = random.random() * variation
+
+        self.__setup(
+            levels = (vitality, resistance, odds),
+            variation = variation,
+            variations = (vitality_variation, resistance_variation, odds_variation),
+            block = StatTable.compute_block(
+                levels = (vitality, resistance, odds),
+                variations = (vitality_variation, resistance_variation, odds_variation)
+            )
+        )
+
+    @staticmethod
+    def create_many(
+        count: int,
+        vitality: int = 0,
+        resistance: int = 0,
+        odds: int = 0,
+        variation: float = 0.0
+    ) -> list["PlayerStats"]:
+        """
+        Creates [count] stats sharing the same modifiers, each with its own random variations.
+        All stat blocks are computed in a single pass, which makes this the way to go when spawning many characters at once.
+        """
+
+        # Seed from the global generator, so that seeded runs stay repeatable.
+        rng: np.random.Generator = np.random.default_rng(random.getrandbits(64))
+        variations: np.ndarray = rng.random((count, MODIFIERS_NUM)) * variation
+
+        blocks: np.ndarray = StatTable.compute_blocks(
+            levels = np.broadcast_to(np.array([vitality, resistance, odds]), (count, MODIFIERS_NUM)),
+            variations = variations
+        )
+
+        result: list[PlayerStats] = []
+        for block, block_variations in zip(blocks.tolist(), variations.tolist()):
+            stats: PlayerStats = PlayerStats.__new__(PlayerStats)
+            stats.__setup(
+                levels = (vitality, resistance, odds),
+                variation = variation,
+                variations = tuple(block_variations),
+                block = block
+            )
+            result.append(stats)
+
+        return result
+
+    def __setup(
+        self,
+        levels: tuple[int, int, int],
+        variation: float,
+        variations: tuple[float, float, float],
+        block: list[float]
+    ) -> None:
         # Modifiers.
-        self.vitality = vitality
-        self.resistance = resistance
-        self.odds = odds
+        self.vitality, self.resistance, self.odds = levels
         self.variation = variation
 
         # Modifier variations.
-        self.vitality_variation = random.random() * self.variation
-        self.resistance_variation = random.random() * self.variation
-        self.odds_variation = random.random() * self.variation
+        self.vitality_variation, self.resistance_variation, self.odds_variation = variations
 
         # Stats.
-        # Resistance.
-        self.max_health = self.compute_stat(
-            level = self.resistance,
-            max_level = LEVELS,
-            min_value = DEFAULT_MIN,
-            max_value = DEFAULT_MAX,
-            variation = self.resistance_variation
-        )
-        self.defense = self.compute_stat(
-            level = self.resistance,
-            max_level = LEVELS,
-            min_value = DEFAULT_MIN,
-            max_value = DEFAULT_MAX,
-            variation = self.resistance_variation
-        )
-        self.max_energy = self.compute_stat(
-            level = self.resistance,
-            max_level = LEVELS,
-            min_value = DEFAULT_MIN,
-            max_value = DEFAULT_MAX,
-            variation = self.resistance_variation
-        )
-        self.min_draw_time = self.compute_stat(
-            level = self.resistance,
-            max_level = LEVELS,
-            min_value = 1,
-            max_value = 0.1,
-            variation = self.resistance_variation
-        )
-        # Vitality.
-        self.max_speed = self.compute_stat(
-            level = self.vitality,
-            max_level = LEVELS,
-            min_value = 60.0,
-            max_value = 100.0,
-            variation = self.vitality_variation
-        )
-        self.accel = self.compute_stat(
-            level = self.vitality,
-            max_level = LEVELS,
-            min_value = 100.0,
-            max_value = 400.0,
-            variation = self.vitality_variation
-        )
-        self.attack = self.compute_stat(
-            level = self.vitality,
-            max_level = LEVELS,
-            min_value = DEFAULT_MIN,
-            max_value = DEFAULT_MAX,
-            variation = self.vitality_variation
-        )
-        self.crit_damage = self.compute_stat(
-            level = self.vitality,
-            max_level = LEVELS,
-            min_value = DEFAULT_MIN,
-            max_value = DEFAULT_MAX,
-            variation = self.vitality_variation
-        )
-        self.fail_damage = self.compute_stat(
-            level = self.vitality,
-            max_level = LEVELS,
-            min_value = DEFAULT_MIN,
-            max_value = DEFAULT_MAX,
-            variation = self.vitality_variation
-        )
-        # Odds.
-        self._crit_rate = self.compute_stat(
-            level = self.odds,
-            max_level = LEVELS,
-            min_value = DEFAULT_MIN,
-            max_value = DEFAULT_MAX,
-            variation = self.odds_variation
-        )
-        self._fail_rate = self.compute_stat(
-            level = self.odds,
-            max_level = LEVELS,
-            min_value = DEFAULT_MIN,
-            max_value = DEFAULT_MAX,
-            variation = self.odds_variation
-        )
+        for curve, value in zip(STAT_CURVES, block):
+            setattr(self, curve.name, value)
 
         # Current values.
         self.health = self.max_health
@@ -150,4 +238,4 @@ class PlayerStats():
         Returns an overall value from all stats.
         """
 
-        return (self.vitality_variation / self.variation) * (self.resistance_variation / self.variation) * (self.odds_variation / self.variation)
\ No newline at end of file
+        return (self.vitality_variation * self.resistance_variation * self.odds_variation) / (self.variation ** 3)
@@ -0,0 +1,95 @@
+import argparse
+import os
+import pstats
+
+from gameplay_profiler import SNAPSHOT_EXTENSION, snapshot_room
+
+def load_rooms(source_dir: str) -> dict[str, pstats.Stats]:
+    """
+    Reads all snapshots in [source_dir] and aggregates them by room.
+    """
+
+    snapshots: dict[str, list[str]] = {}
+    for file_name in sorted(os.listdir(source_dir)):
+        if file_name.endswith(f".{SNAPSHOT_EXTENSION}"):
+            snapshots.setdefault(snapshot_room(file_name), []).append(os.path.join(source_dir, file_name))
+
+    return {room: pstats.Stats(*paths) for room, paths in snapshots.items()}
+
+def function_name(function: tuple[str, int, str]) -> str:
+    file_name, line, name = function
+
+    # Builtins have no file.
+    if file_name == "~":
+        return name
+
+    return f"{os.path.basename(file_name)}:{line}({name})"
+
+def report(
+    rooms: dict[str, pstats.Stats],
+    top: int,
+    sort: str,
+    filter: str | None
+) -> str:
+    """
+    Returns a table of the [top] functions by [sort] time (either "cumulative" or "total") across all [rooms],
+    along with their time in each room, in milliseconds.
+    Only functions whose name contains [filter] are listed, if provided.
+    """
+
+    # Index of the sorting time in pstats entries (call count, primitive call count, total time, cumulative time, callers).
+    time_index: int = 3 if sort == "cumulative" else 2
+
+    times: dict[tuple[str, int, str], dict[str, float]] = {}
+    calls: dict[tuple[str, int, str], int] = {}
+    for room, stats in rooms.items():
+        for function, entry in stats.stats.items():
+            times.setdefault(function, {})[room] = entry[time_index]
+            calls[function] = calls.get(function, 0) + entry[1]
+
+    functions: list[tuple[str, int, str]] = [
+        function for function in times.keys() if filter is None or filter in function_name(function)
+    ]
+    functions.sort(key = lambda function: sum(times[function].values()), reverse = True)
+
+    room_names: list[str] = sorted(rooms.keys())
+    lines: list[str] = [
+        f"{'calls':>10} {'all':>10} " + " ".join(f"{room:>10}" for room in room_names) + "  function",
+        f"{'':>10} {'':>10} " + " ".join(f"{f'({len(rooms[room].files)})':>10}" for room in room_names)
+    ]
+    for function in functions[:top]:
+        lines.append(
+            f"{calls[function]:>10} {sum(times[function].values()) * 1000:>10.2f} " +
+            " ".join(f"{times[function].get(room, 0.0) * 1000:>10.2f}" for room in room_names) +
+            f"  {function_name(function)}"
+        )
+
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Aggregates gameplay profiling snapshots and shows top functions across rooms.")
+    parser.add_argument(
+        "source",
+        nargs = "?",
+        default = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "profiles")),
+        help = "directory containing the .pyprof snapshots"
+    )
+    parser.add_argument("--top", type = int, default = 30, help = "number of functions to show")
+    parser.add_argument("--sort", choices = ("cumulative", "total"), default = "cumulative", help = "time functions are sorted by")
+    parser.add_argument("--filter", help = "only show functions whose name contains this text, e.g. IdlePropNode or iryo_")
+    parser.add_argument("--room", action = "append", help = "only include snapshots from this room, can be repeated")
+    args = parser.parse_args()
+
+    rooms: dict[str, pstats.Stats] = load_rooms(args.source)
+    if args.room is not None:
+        rooms = {room: stats for room, stats in rooms.items() if room in args.room}
+
+    if len(rooms) <= 0:
+        print(f"No snapshots found in {args.source}")
+    else:
+        print(report(
+            rooms = rooms,
+            top = args.top,
+            sort = args.sort,
+            filter = args.filter
+        ))
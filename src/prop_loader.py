@@ -5,6 +5,8 @@ import pyglet
 from battery_node import BatteryNode
 from props.prop_node import PropNode
 from stan_lee_node import StanLeeNode
+from map_persistence import write_map
+from map_utils import read_pair
 
 PROP_MAPPING: dict[str, type] = {
     # Other.
@@ -23,8 +25,6 @@ class PropLoader:
         Reads and returns the list of props from the file provided in [source].
         """
 
-        props_list: list[PropNode] = []
-
         abs_path: str = os.path.join(pyglet.resource.path[0], source)
 
         # Return an empty list if the source file is not found.
@@ -39,6 +39,24 @@ class PropLoader:
         with open(file = abs_path, mode = "r", encoding = "UTF8") as source_file:
             data = json.load(source_file)
 
+        return PropLoader.from_data(
+            data = data,
+            world_batch = world_batch,
+            ui_batch = ui_batch
+        )
+
+    @staticmethod
+    def from_data(
+        data: dict,
+        world_batch: pyglet.graphics.Batch | None = None,
+        ui_batch: pyglet.graphics.Batch | None = None
+    ) -> list[PropNode]:
+        """
+        Creates and returns the list of props defined by the provided propmap [data].
+        """
+
+        props_list: list[PropNode] = []
+
         # Just return if no data is read.
         if len(data) <= 0:
             return []
@@ -46,16 +64,14 @@ class PropLoader:
         # Loop through defined prop types.
         for element in data["elements"]:
             id: str = element["id"]
-            positions: list[str] = element["positions"]
+            positions: list[str | tuple[float, float]] = element["positions"]
 
             # Make sure the current prop id is in the registered mapping.
             assert id in PROP_MAPPING
 
             # Loop through single props.
             for i in range(len(positions)):
-                position_string: str = positions[i]
-
-                position: list[float] = list(map(lambda item: float(item), position_string.split(",")))
+                position: tuple[float, float] = read_pair(positions[i])
 
                 # Create a new wall node and add it to the result.
                 props_list.append(PropLoader.map_prop(
@@ -69,13 +85,9 @@ class PropLoader:
         return props_list
 
     @staticmethod
-    def store(
-        dest: str,
-        props: list[PropNode]
-    ) -> None:
+    def to_data(props: list[PropNode]) -> dict:
         """
-        Saves a wallmap file to store all provided walls.
-        Walls are internally sorted by tags.
+        Returns the map data storing all provided [props], ready to be serialized.
         """
 
         # Group props by type.
@@ -96,14 +108,20 @@ class PropLoader:
             }
             result.append(element)
 
-        # Write to dest file.
-        with open(file = dest, mode = "w", encoding = "UTF8") as dest_file:
-            dest_file.write(json.dumps(
-                {
-                    "elements": result
-                },
-                indent = 4
-            ))
+        return {
+            "elements": result
+        }
+
+    @staticmethod
+    def store(
+        dest: str,
+        props: list[PropNode]
+    ) -> None:
+        """
+        Saves a map file to store all provided [props].
+        """
+
+        write_map(dest = dest, data = PropLoader.to_data(props = props))
 
     @staticmethod
     def fetch_positions(source: str) -> dict[str, set[tuple[int, int]]]:
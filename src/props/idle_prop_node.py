@@ -1,7 +1,7 @@
 import os
 from enum import Enum
-import json
-import random
+from functools import partial
+from typing import Mapping
 import pyglet
 
 from amonite import controllers
@@ -11,9 +11,10 @@ from amonite.interaction_node import InteractionNode
 from amonite.settings import SETTINGS, Keys
 from amonite.sprite_node import SpriteNode
 from amonite.state_machine import State, StateMachine
-from amonite.utils.utils import set_animation_anchor_x, set_animation_anchor_y, x_center_animation, y_center_animation
 from constants import uniques
+from props.idle_prop_registry import SENSOR_HIT, SENSOR_INTERACT, SENSOR_MEET, IdlePropDefinition
 from props.prop_node import PropNode
+from weighted_sampler import WeightedSampler
 
 class IdlePropStates(str, Enum):
     IDLE = "idle"
@@ -28,7 +29,7 @@ class IdlePropStates(str, Enum):
 class IdlePropNode(PropNode):
     """
         Generic idle prop node.
-        Takes the path to a json definition file as input.
+        Takes a definition (parsed once per file by IdlePropRegistry) as input.
         The definition file is structured as follows:
 
         animation_specs[array]: array of all animation definitions. Every element is structured as follows:
@@ -71,13 +72,12 @@ class IdlePropNode(PropNode):
         "source",
 
         # Animation data.
-        "__animations_data",
         "animations",
+        "samplers",
 
         "__interactor",
         "__colliders",
         "__sensors",
-        "__sensors_tags",
 
         "max_health_points",
         "health_points",
@@ -90,7 +90,7 @@ class IdlePropNode(PropNode):
 
     def __init__(
         self,
-        source: str,
+        definition: IdlePropDefinition,
         # Animation duration.
         anim_duration: float = 1.0,
         x: float = 0.0,
@@ -99,7 +99,7 @@ class IdlePropNode(PropNode):
         batch: pyglet.graphics.Batch | None = None
     ) -> None:
         # Read id from source.
-        id: str = os.path.basename(source).split(".")[0]
+        id: str = os.path.basename(definition.source).split(".")[0]
         super().__init__(
             id = id,
             x = x,
@@ -107,151 +107,75 @@ class IdlePropNode(PropNode):
             world_batch = batch
         )
 
-        self.source = source
-        self.__animations_data: dict[str, pyglet.image.animation.Animation] = {}
-        self.animations = {
-            "idle": {},
-            "meet_in": {},
-            "meeting": {},
-            "meet_out": {},
-            "interact": {},
-            "hit": {},
-            "destroy": {},
-            "destroyed": {}
-        }
+        self.source = definition.source
+        self.animations = definition.animations
+        self.samplers = definition.samplers
 
         self.__interactor: InteractionNode | None = None
         self.__colliders: list[CollisionNode] = []
         self.__sensors: list[CollisionNode] = []
-        self.__sensors_tags: list[dict[str, list[str]]] = []
-
-        data: dict = {}
-        with open(file = f"{pyglet.resource.path[0]}/{source}", mode = "r", encoding = "UTF-8") as content:
-            data = json.load(content)
 
         # Read health points.
-        self.max_health_points: int | None = None
-        self.health_points = 0
-        if "health_points" in data:
-            self.max_health_points = data["health_points"]
-            self.health_points = self.max_health_points
-
-        # Read global anchor point.
-        anchor_x: int | None = None
-        anchor_y: int | None = None
-        if "anchor_x" in data and "anchor_y" in data:
-            anchor_x = data["anchor_x"]
-            anchor_y = data["anchor_y"]
-
-        # Load all animations.
-        if "animation_specs" in data.keys() and "animations" in data.keys():
-            for anim_spec in data["animation_specs"]:
-                # Every animation spec should at least include "name" and "path".
-                if not "name" in anim_spec and not "path" in anim_spec:
-                    continue
-
-                anim_ref = pyglet.resource.animation(anim_spec["path"])
-                self.__animations_data[anim_spec["name"]] = anim_ref
-
-                # Read animation-specific anchor point and fall to global if not defined.
-                anim_anchor_x: int | None = anim_spec["anchor_x"] if "anchor_x" in anim_spec else anchor_x
-                anim_anchor_y: int | None = anim_spec["anchor_y"] if "anchor_y" in anim_spec else anchor_y
-
-                # Read animation centering.
-                center_x: bool = anim_spec["center_x"] if "center_x" in anim_spec else False
-                center_y: bool = anim_spec["center_y"] if "center_y" in anim_spec else False
-
-                # Set x anchor.
-                if center_x:
-                    x_center_animation(animation = anim_ref)
-                elif anim_anchor_x is not None:
-                    set_animation_anchor_x(animation = anim_ref, anchor = anim_anchor_x)
-
-                # Set y anchor.
-                if center_y:
-                    y_center_animation(animation = anim_ref)
-                elif anim_anchor_y is not None:
-                    set_animation_anchor_y(animation = anim_ref, anchor = anim_anchor_y)
-
-                # Set not looping if so specified.
-                if "loop" in anim_spec and anim_spec["loop"] is False:
-                    anim_ref.frames[-1].duration = None
-
-            # Iterate over animation types.
-            for anim_key, anim_content in self.animations.items():
-                if anim_key in data["animations"]:
-                    # Read animation reference and store it accordingly.
-                    for anim_ref in data["animations"][anim_key]:
-                        if anim_ref["name"] in self.__animations_data:
-                            animation = self.__animations_data[anim_ref["name"]]
-                            anim_content[animation] = anim_ref["weight"]
+        self.max_health_points: int | None = definition.max_health_points
+        self.health_points = self.max_health_points if self.max_health_points is not None else 0
 
         # Colliders.
-        if "colliders" in data:
-            for collider_data in data["colliders"]:
-                collider = CollisionNode(
-                    x = x,
-                    y = y,
-                    collision_type = CollisionType.STATIC,
-                    passive_tags = collider_data["tags"],
-                    shape = CollisionRect(
-                        x = x + collider_data["offset_x"],
-                        y = y + collider_data["offset_y"],
-                        width = collider_data["width"],
-                        height = collider_data["height"],
-                        anchor_x = collider_data["anchor_x"],
-                        anchor_y = collider_data["anchor_y"],
-                        batch = batch
-                    ),
-                    on_triggered = self.__on_collider_triggered
-                )
-                self.__colliders.append(collider)
-                controllers.COLLISION_CONTROLLER.add_collider(collider)
+        for collider_spec in definition.colliders:
+            collider = CollisionNode(
+                x = x,
+                y = y,
+                collision_type = CollisionType.STATIC,
+                passive_tags = list(collider_spec.tags),
+                shape = CollisionRect(
+                    x = x + collider_spec.offset_x,
+                    y = y + collider_spec.offset_y,
+                    width = collider_spec.width,
+                    height = collider_spec.height,
+                    anchor_x = collider_spec.anchor_x,
+                    anchor_y = collider_spec.anchor_y,
+                    batch = batch
+                ),
+                on_triggered = self.__on_collider_triggered
+            )
+            self.__colliders.append(collider)
+            controllers.COLLISION_CONTROLLER.add_collider(collider)
 
         # Sensors.
-        if "sensors" in data:
-            # Create interactor if interact tags are declared.
-            if any("interact_tags" in sensor for sensor in data["sensors"]):
-                self.__interactor = InteractionNode(
-                    on_interaction = self.__on_interaction,
-                )
-                controllers.INTERACTION_CONTROLLER.add_interaction(self.__interactor)
-
-            for index, sensor_data in enumerate(data["sensors"]):
-                meet_tags: list[str] = sensor_data["meet_tags"] or [] if "meet_tags" in sensor_data else []
-                interact_tags: list[str] = sensor_data["interact_tags"] or [] if "interact_tags" in sensor_data else []
-                hit_tags: list[str] = sensor_data["hit_tags"] or [] if "hit_tags" in sensor_data else []
-
-                sensor = CollisionNode(
-                    x = x,
-                    y = y,
-                    collision_type = CollisionType.STATIC,
-                    passive_tags = [
-                        *meet_tags,
-                        *interact_tags,
-                        *hit_tags
-                    ],
-                    sensor = True,
-                    shape = CollisionRect(
-                        x = x + sensor_data["offset_x"],
-                        y = y + sensor_data["offset_y"],
-                        width = sensor_data["width"],
-                        height = sensor_data["height"],
-                        anchor_x = sensor_data["anchor_x"],
-                        anchor_y = sensor_data["anchor_y"],
-                        batch = batch
-                    ),
-                    on_triggered = lambda tags, entered: self.__on_sensor_triggered(tags = tags, entered = entered, index = index)
-                )
-                self.__sensors_tags.append({})
-                self.__sensors_tags[index]["meet"] = meet_tags
-                self.__sensors_tags[index]["interact"] = interact_tags
-                self.__sensors_tags[index]["hit"] = hit_tags
-                self.__sensors.append(sensor)
-
-                controllers.COLLISION_CONTROLLER.add_collider(sensor)
-
-        layer: str = data["layer"] if "layer" in data else "rat"
+        # Create interactor if interact tags are declared.
+        if definition.interactive:
+            self.__interactor = InteractionNode(
+                on_interaction = self.__on_interaction,
+            )
+            controllers.INTERACTION_CONTROLLER.add_interaction(self.__interactor)
+
+        for sensor_spec in definition.sensors:
+            sensor = CollisionNode(
+                x = x,
+                y = y,
+                collision_type = CollisionType.STATIC,
+                passive_tags = [
+                    *sensor_spec.meet_tags,
+                    *sensor_spec.interact_tags,
+                    *sensor_spec.hit_tags
+                ],
+                sensor = True,
+                shape = CollisionRect(
+                    x = x + sensor_spec.offset_x,
+                    y = y + sensor_spec.offset_y,
+                    width = sensor_spec.width,
+                    height = sensor_spec.height,
+                    anchor_x = sensor_spec.anchor_x,
+                    anchor_y = sensor_spec.anchor_y,
+                    batch = batch
+                ),
+                # Bind the sensor's precompiled tag routes, shared by all props with the same definition.
+                on_triggered = partial(self.__on_sensor_triggered, sensor_spec.actions)
+            )
+            self.__sensors.append(sensor)
+
+            controllers.COLLISION_CONTROLLER.add_collider(sensor)
+
+        layer: str = definition.layer
 
         self.sprite: SpriteNode | None = None
         self.anim_duration = anim_duration
@@ -302,17 +226,21 @@ class IdlePropNode(PropNode):
 
         self.__state_machine.on_collision(tags = tags, enter = entered)
 
-    def __on_sensor_triggered(self, tags: list[str], entered: bool, index: int) -> None:
+    def __on_sensor_triggered(self, actions: Mapping[str, int], tags: list[str], entered: bool) -> None:
         """
-        Handles all sensors' trigger events.
+        Handles all sensors' trigger events, routing [tags] through the sensor's [actions].
         """
 
-        if bool(set(tags) & set(self.__sensors_tags[index]["meet"])):
+        action: int = 0
+        for tag in tags:
+            action |= actions.get(tag, 0)
+
+        if action & SENSOR_MEET:
             self.__state_machine.meet(entered = entered)
-        elif bool(set(tags) & set(self.__sensors_tags[index]["interact"])):
+        elif action & SENSOR_INTERACT:
             if self.__interactor is not None:
                 controllers.INTERACTION_CONTROLLER.toggle(self.__interactor, enable = entered)
-        elif entered and bool(set(tags) & set(self.__sensors_tags[index]["hit"])):
+        elif entered and action & SENSOR_HIT:
             self.__state_machine.hit()
 
     def set_position(self, position: tuple[float, float], z: float | None = None):
@@ -328,19 +256,37 @@ class IdlePropNode(PropNode):
             sensor.set_position(position, z)
 
     def update(self, dt: float) -> None:
-        self.__state_machine.update(dt = dt)
+        with uniques.PROFILER.scope("idle_props"):
+            self.__state_machine.update(dt = dt)
+
+    def sleep(self) -> None:
+        super().sleep()
+
+        if self.sprite is not None:
+            self.sprite.sprite.paused = True
+
+    def wake(self) -> None:
+        super().wake()
+
+        if self.sprite is not None:
+            self.sprite.sprite.paused = False
+
+        # Restart from idle, unless destroyed.
+        if self.__state_machine.current_key not in (IdlePropStates.DESTROY, IdlePropStates.DESTROYED):
+            self.__state_machine.set_state(IdlePropStates.IDLE)
 
     def __on_animation_end(self) -> None:
         self.__state_machine.on_animation_end()
 
     def set_animation(self, key: str) -> None:
         """
-        Sets a random animation from the given array key.
+        Sets a random animation from the given array key, drawn from the active scene's random stream.
         """
 
         if self.sprite is not None:
-            if key in self.animations and len(self.animations[key]) > 0:
-                self.sprite.set_image(random.choices(list(self.animations[key].keys()), list(self.animations[key].values()))[0])
+            sampler: WeightedSampler[pyglet.image.animation.Animation] | None = self.samplers.get(key)
+            if sampler is not None and len(sampler) > 0:
+                self.sprite.set_image(sampler.sample(rng = uniques.SCENE_RNG))
             else:
                 self.__on_animation_end()
 
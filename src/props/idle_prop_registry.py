@@ -0,0 +1,247 @@
+import json
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+import pyglet
+
+from amonite.utils.utils import set_animation_anchor_x, set_animation_anchor_y, x_center_animation, y_center_animation
+
+from texture_atlas import TextureAtlas
+from weighted_sampler import WeightedSampler
+
+# All animation categories an idle prop can define.
+ANIMATION_CATEGORIES: tuple[str, ...] = (
+    "idle",
+    "meet_in",
+    "meeting",
+    "meet_out",
+    "interact",
+    "hit",
+    "destroy",
+    "destroyed"
+)
+
+# Sensor actions, combined as bit flags in sensor tag routes.
+SENSOR_MEET: int = 1 << 0
+SENSOR_INTERACT: int = 1 << 1
+SENSOR_HIT: int = 1 << 2
+
+class IdlePropColliderSpec(NamedTuple):
+    """
+    Blocking collider definition, as read from an idle prop definition file.
+    """
+
+    tags: tuple[str, ...]
+    offset_x: float
+    offset_y: float
+    width: int
+    height: int
+    anchor_x: int
+    anchor_y: int
+
+class IdlePropSensorSpec(NamedTuple):
+    """
+    Non blocking sensor definition, as read from an idle prop definition file.
+    """
+
+    meet_tags: tuple[str, ...]
+    interact_tags: tuple[str, ...]
+    hit_tags: tuple[str, ...]
+
+    # Sensor actions (as SENSOR_* flags) by collision tag, so that triggers are routed with a single lookup per tag.
+    actions: Mapping[str, int]
+
+    offset_x: float
+    offset_y: float
+    width: int
+    height: int
+    anchor_x: int
+    anchor_y: int
+
+class IdlePropDefinition(NamedTuple):
+    """
+    Parsed and pre-anchored idle prop definition.
+    Definitions are shared by all idle props built from the same source file, so they must never be modified.
+    """
+
+    source: str
+
+    # Animations by category, each mapping an animation to its selection weight.
+    animations: Mapping[str, Mapping[pyglet.image.animation.Animation, int]]
+
+    # Animation pickers by category, sharing precomputed cumulative weights among all props.
+    samplers: Mapping[str, WeightedSampler[pyglet.image.animation.Animation]]
+
+    max_health_points: int | None
+    layer: str
+    colliders: tuple[IdlePropColliderSpec, ...]
+    sensors: tuple[IdlePropSensorSpec, ...]
+
+    # Whether any sensor declares interact tags, in which case an interactor is needed.
+    interactive: bool
+
+class IdlePropRegistry:
+    """
+    Idle prop definitions, parsed once per definition file.
+    """
+
+    __definitions: dict[str, IdlePropDefinition] = {}
+
+    # Cache usage counters.
+    hits: int = 0
+    misses: int = 0
+
+    @staticmethod
+    def fetch(source: str) -> IdlePropDefinition:
+        """
+        Returns the definition read from the file provided in [source], parsing it only if not already cached.
+        """
+
+        definition: IdlePropDefinition | None = IdlePropRegistry.__definitions.get(source)
+
+        if definition is not None:
+            IdlePropRegistry.hits += 1
+            return definition
+
+        IdlePropRegistry.misses += 1
+        definition = IdlePropRegistry.__parse(source = source)
+        IdlePropRegistry.__definitions[source] = definition
+
+        return definition
+
+    @staticmethod
+    def get_stats() -> tuple[int, int]:
+        """
+        Returns the current cache hits and misses, respectively.
+        """
+
+        return (IdlePropRegistry.hits, IdlePropRegistry.misses)
+
+    @staticmethod
+    def reset_stats() -> None:
+        """
+        Resets cache usage counters.
+        """
+
+        IdlePropRegistry.hits = 0
+        IdlePropRegistry.misses = 0
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Drops all cached definitions, forcing them to be parsed again on next fetch.
+        """
+
+        IdlePropRegistry.__definitions.clear()
+        IdlePropRegistry.reset_stats()
+
+    @staticmethod
+    def __parse(source: str) -> IdlePropDefinition:
+        data: dict = {}
+        with open(file = f"{pyglet.resource.path[0]}/{source}", mode = "r", encoding = "UTF-8") as content:
+            data = json.load(content)
+
+        # Read global anchor point.
+        anchor_x: int | None = None
+        anchor_y: int | None = None
+        if "anchor_x" in data and "anchor_y" in data:
+            anchor_x = data["anchor_x"]
+            anchor_y = data["anchor_y"]
+
+        animations: dict[str, dict[pyglet.image.animation.Animation, int]] = {key: {} for key in ANIMATION_CATEGORIES}
+
+        # Load all animations.
+        if "animation_specs" in data.keys() and "animations" in data.keys():
+            animations_data: dict[str, pyglet.image.animation.Animation] = {}
+
+            for anim_spec in data["animation_specs"]:
+                # Every animation spec should at least include "name" and "path".
+                if not "name" in anim_spec and not "path" in anim_spec:
+                    continue
+
+                # Prefer baked atlas frames, falling back to the source animation.
+                anim_ref = TextureAtlas.get_animation(path = anim_spec["path"]) or pyglet.resource.animation(anim_spec["path"])
+                animations_data[anim_spec["name"]] = anim_ref
+
+                # Read animation-specific anchor point and fall to global if not defined.
+                anim_anchor_x: int | None = anim_spec["anchor_x"] if "anchor_x" in anim_spec else anchor_x
+                anim_anchor_y: int | None = anim_spec["anchor_y"] if "anchor_y" in anim_spec else anchor_y
+
+                # Read animation centering.
+                center_x: bool = anim_spec["center_x"] if "center_x" in anim_spec else False
+                center_y: bool = anim_spec["center_y"] if "center_y" in anim_spec else False
+
+                # Set x anchor.
+                if center_x:
+                    x_center_animation(animation = anim_ref)
+                elif anim_anchor_x is not None:
+                    set_animation_anchor_x(animation = anim_ref, anchor = anim_anchor_x)
+
+                # Set y anchor.
+                if center_y:
+                    y_center_animation(animation = anim_ref)
+                elif anim_anchor_y is not None:
+                    set_animation_anchor_y(animation = anim_ref, anchor = anim_anchor_y)
+
+                # Set not looping if so specified.
+                if "loop" in anim_spec and anim_spec["loop"] is False:
+                    anim_ref.frames[-1].duration = None
+
+            # Iterate over animation types.
+            for anim_key, anim_content in animations.items():
+                if anim_key in data["animations"]:
+                    # Read animation reference and store it accordingly.
+                    for anim_ref in data["animations"][anim_key]:
+                        if anim_ref["name"] in animations_data:
+                            anim_content[animations_data[anim_ref["name"]]] = anim_ref["weight"]
+
+        # Colliders.
+        colliders: list[IdlePropColliderSpec] = []
+        if "colliders" in data:
+            for collider_data in data["colliders"]:
+                colliders.append(IdlePropColliderSpec(
+                    tags = tuple(collider_data["tags"]),
+                    offset_x = collider_data["offset_x"],
+                    offset_y = collider_data["offset_y"],
+                    width = collider_data["width"],
+                    height = collider_data["height"],
+                    anchor_x = collider_data["anchor_x"],
+                    anchor_y = collider_data["anchor_y"]
+                ))
+
+        # Sensors.
+        sensors: list[IdlePropSensorSpec] = []
+        if "sensors" in data:
+            for sensor_data in data["sensors"]:
+                meet_tags: tuple[str, ...] = tuple(sensor_data["meet_tags"] or [] if "meet_tags" in sensor_data else [])
+                interact_tags: tuple[str, ...] = tuple(sensor_data["interact_tags"] or [] if "interact_tags" in sensor_data else [])
+                hit_tags: tuple[str, ...] = tuple(sensor_data["hit_tags"] or [] if "hit_tags" in sensor_data else [])
+
+                # Compile tag routes.
+                actions: dict[str, int] = {}
+                for tags, action in ((meet_tags, SENSOR_MEET), (interact_tags, SENSOR_INTERACT), (hit_tags, SENSOR_HIT)):
+                    for tag in tags:
+                        actions[tag] = actions.get(tag, 0) | action
+
+                sensors.append(IdlePropSensorSpec(
+                    meet_tags = meet_tags,
+                    interact_tags = interact_tags,
+                    hit_tags = hit_tags,
+                    actions = MappingProxyType(actions),
+                    offset_x = sensor_data["offset_x"],
+                    offset_y = sensor_data["offset_y"],
+                    width = sensor_data["width"],
+                    height = sensor_data["height"],
+                    anchor_x = sensor_data["anchor_x"],
+                    anchor_y = sensor_data["anchor_y"]
+                ))
+
+        return IdlePropDefinition(
+            source = source,
+            animations = MappingProxyType({key: MappingProxyType(value) for key, value in animations.items()}),
+            samplers = MappingProxyType({key: WeightedSampler(value.items()) for key, value in animations.items()}),
+            max_health_points = data["health_points"] if "health_points" in data else None,
+            layer = data["layer"] if "layer" in data else "rat",
+            colliders = tuple(colliders),
+            sensors = tuple(sensors),
+            interactive = any("interact_tags" in sensor for sensor in data["sensors"]) if "sensors" in data else False
+        )
@@ -0,0 +1,97 @@
+import math
+
+from amonite.node import Node, PositionNode
+
+from props.prop_node import PropNode
+
+class PropActivationGrid(Node):
+    """
+    Uniform grid of props, only updating the ones close to the camera.
+    Props are bucketed by position once, then on each update the cells overlapping the view area (plus a margin)
+    around [center] are computed: props in cells leaving the area are put to sleep and props in cells entering it are woken up.
+    """
+
+    __slots__ = (
+        "center",
+        "view_width",
+        "view_height",
+        "margin",
+        "cell_size",
+        "props",
+        "__cells",
+        "__active_cells"
+    )
+
+    def __init__(
+        self,
+        props: list[PropNode],
+        center: PositionNode,
+        view_width: int,
+        view_height: int,
+        margin: float = 32.0,
+        cell_size: float = 64.0
+    ) -> None:
+        super().__init__()
+
+        # Node the view area is centered on, usually the camera target.
+        self.center: PositionNode = center
+
+        self.view_width: int = view_width
+        self.view_height: int = view_height
+        self.margin: float = margin
+        self.cell_size: float = cell_size
+
+        self.props: list[PropNode] = props
+
+        # Props by cell coordinates.
+        self.__cells: dict[tuple[int, int], list[PropNode]] = {}
+        for prop in props:
+            self.__cells.setdefault(self.__cell(prop.x, prop.y), []).append(prop)
+
+        # Cells whose props are awake. All props start awake, so unneeded ones are put to sleep on the first update.
+        self.__active_cells: set[tuple[int, int]] = set(self.__cells.keys())
+
+    def __cell(self, x: float, y: float) -> tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def get_active_cells(self) -> set[tuple[int, int]]:
+        """
+        Returns all populated cells overlapping the active area.
+        """
+
+        half_width: float = self.view_width / 2 + self.margin
+        half_height: float = self.view_height / 2 + self.margin
+
+        left, bottom = self.__cell(self.center.x - half_width, self.center.y - half_height)
+        right, top = self.__cell(self.center.x + half_width, self.center.y + half_height)
+
+        return {
+            (x, y) for x in range(left, right + 1) for y in range(bottom, top + 1) if (x, y) in self.__cells
+        }
+
+    def update(self, dt: float) -> None:
+        active_cells: set[tuple[int, int]] = self.get_active_cells()
+
+        # Only touch cells whose activation changed.
+        if active_cells != self.__active_cells:
+            for cell in self.__active_cells - active_cells:
+                for prop in self.__cells[cell]:
+                    prop.sleep()
+
+            for cell in active_cells - self.__active_cells:
+                for prop in self.__cells[cell]:
+                    prop.wake()
+
+            self.__active_cells = active_cells
+
+        for cell in active_cells:
+            for prop in self.__cells[cell]:
+                prop.update(dt = dt)
+
+    def delete(self) -> None:
+        for prop in self.props:
+            prop.delete()
+
+        self.props.clear()
+        self.__cells.clear()
+        self.__active_cells.clear()
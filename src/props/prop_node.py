@@ -7,7 +7,8 @@ class PropNode(PositionNode):
     __slots__ = (
         "id",
         "world_batch",
-        "ui_batch"
+        "ui_batch",
+        "asleep"
     )
 
     def __init__(
@@ -22,4 +23,22 @@ class PropNode(PositionNode):
 
         self.id = id
         self.world_batch: pyglet.graphics.Batch | None = world_batch
-        self.ui_batch: pyglet.graphics.Batch | None = ui_batch
\ No newline at end of file
+        self.ui_batch: pyglet.graphics.Batch | None = ui_batch
+
+        # Tells whether the prop is too far from the camera to be updated.
+        self.asleep: bool = False
+
+    def sleep(self) -> None:
+        """
+        Puts the prop to sleep, called when it gets out of the active area.
+        Sleeping props are not updated, so subclasses should also stop any running animation here.
+        """
+
+        self.asleep = True
+
+    def wake(self) -> None:
+        """
+        Wakes the prop up, called when it gets back in the active area.
+        """
+
+        self.asleep = False
\ No newline at end of file
@@ -0,0 +1,124 @@
+import math
+from typing import Generic, Hashable, TypeVar
+
+T = TypeVar("T", bound = Hashable)
+
+class RectGrid(Generic[T]):
+    """
+    Uniform grid spatial index of axis aligned rects.
+    Every item is bucketed in all cells its rect overlaps, so that queries only test the items sharing the queried cells.
+    """
+
+    __slots__ = (
+        "cell_size",
+        "__cells",
+        "__rects"
+    )
+
+    def __init__(self, cell_size: float) -> None:
+        self.cell_size: float = cell_size
+
+        # Items by cell coordinates.
+        self.__cells: dict[tuple[int, int], set[T]] = {}
+
+        # Rects (x, y, width, height) by item.
+        self.__rects: dict[T, tuple[float, float, float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__rects)
+
+    def __cell_range(self, rect: tuple[float, float, float, float]) -> tuple[int, int, int, int]:
+        # Rects are half open, so an edge lying exactly on a cell border does not reach the next cell.
+        return (
+            math.floor(rect[0] / self.cell_size),
+            math.floor(rect[1] / self.cell_size),
+            max(math.floor(rect[0] / self.cell_size), math.ceil((rect[0] + rect[2]) / self.cell_size) - 1),
+            max(math.floor(rect[1] / self.cell_size), math.ceil((rect[1] + rect[3]) / self.cell_size) - 1)
+        )
+
+    def insert(
+        self,
+        item: T,
+        rect: tuple[float, float, float, float]
+    ) -> None:
+        """
+        Adds [item], covering [rect] (x, y, width, height), to the index. Items already in the index are moved.
+        """
+
+        if item in self.__rects:
+            self.remove(item)
+
+        self.__rects[item] = rect
+
+        left, bottom, right, top = self.__cell_range(rect)
+        for x in range(left, right + 1):
+            for y in range(bottom, top + 1):
+                self.__cells.setdefault((x, y), set()).add(item)
+
+    def remove(self, item: T) -> None:
+        """
+        Removes [item] from the index, if present.
+        """
+
+        rect: tuple[float, float, float, float] | None = self.__rects.pop(item, None)
+
+        if rect is None:
+            return
+
+        left, bottom, right, top = self.__cell_range(rect)
+        for x in range(left, right + 1):
+            for y in range(bottom, top + 1):
+                cell: set[T] | None = self.__cells.get((x, y))
+                if cell is None:
+                    continue
+
+                cell.discard(item)
+                if len(cell) <= 0:
+                    del self.__cells[(x, y)]
+
+    def query_point(self, x: float, y: float) -> list[T]:
+        """
+        Returns all items whose rect contains the point ([x], [y]).
+        """
+
+        cell: set[T] | None = self.__cells.get((math.floor(x / self.cell_size), math.floor(y / self.cell_size)))
+
+        if cell is None:
+            return []
+
+        result: list[T] = []
+        for item in cell:
+            rect: tuple[float, float, float, float] = self.__rects[item]
+            if rect[0] <= x < rect[0] + rect[2] and rect[1] <= y < rect[1] + rect[3]:
+                result.append(item)
+
+        return result
+
+    def query_rect(self, rect: tuple[float, float, float, float]) -> set[T]:
+        """
+        Returns all items whose rect touches [rect] (x, y, width, height), edges included.
+        """
+
+        result: set[T] = set()
+
+        # Widen the queried cells by one on each side, so that items only touching the rect from a cell border are found too.
+        left, bottom, right, top = self.__cell_range(rect)
+        for x in range(left - 1, right + 2):
+            for y in range(bottom - 1, top + 2):
+                cell: set[T] | None = self.__cells.get((x, y))
+                if cell is None:
+                    continue
+
+                for item in cell:
+                    item_rect: tuple[float, float, float, float] = self.__rects[item]
+                    if (
+                        item_rect[0] <= rect[0] + rect[2] and rect[0] <= item_rect[0] + item_rect[2] and
+                        item_rect[1] <= rect[1] + rect[3] and rect[1] <= item_rect[1] + item_rect[3]
+                    ):
+                        result.add(item)
+
+        return result
+
+    def clear(self) -> None:
+        self.__cells.clear()
+        self.__rects.clear()
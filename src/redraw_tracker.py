@@ -0,0 +1,85 @@
+from typing import Hashable, Sequence
+import pyglet
+
+class RedrawTracker:
+    """
+    Tells whether the last rendered frame is still up to date, so that unchanged frames can be skipped.
+    Changes to batched geometry (moving, animating, showing, hiding, creating or deleting sprites, shapes and labels)
+    are detected by inspecting the batches' vertex domains, so most nodes need no special care.
+    Anything else affecting the rendered frame (shader uniforms, window events, scene changes) must be reported through mark_dirty().
+    Batch internals are read directly, so every frame is drawn if they cannot be found.
+    """
+
+    __dirty: bool = True
+
+    # Vertex allocations of all tracked batches, as of the last check.
+    __allocations: tuple = ()
+
+    # View state (camera, curtain) as of the last check.
+    __view: Hashable = None
+
+    @staticmethod
+    def mark_dirty() -> None:
+        """
+        Forces the next frame to be rendered.
+        """
+
+        RedrawTracker.__dirty = True
+
+    @staticmethod
+    def needs_redraw(
+        batches: Sequence[pyglet.graphics.Batch],
+        view: Hashable = None
+    ) -> bool:
+        """
+        Tells whether the frame should be rendered again, either because it was marked dirty, because any of the provided
+        [batches] changed or because the provided [view] state differs from the last check.
+        Must be called right before drawing [batches], since drawing them commits (and clears) their pending changes.
+        """
+
+        allocations: tuple
+        changed: bool
+        try:
+            allocations = tuple(RedrawTracker.__get_allocations(batch = batch) for batch in batches)
+            changed = allocations != RedrawTracker.__allocations or any(RedrawTracker.__has_pending_data(batch = batch) for batch in batches)
+        except AttributeError:
+            # Batch internals are not part of pyglet's public API: if they ever change, just redraw every frame.
+            allocations = ()
+            changed = True
+
+        dirty: bool = (
+            RedrawTracker.__dirty or
+            view != RedrawTracker.__view or
+            changed
+        )
+
+        RedrawTracker.__dirty = False
+        RedrawTracker.__allocations = allocations
+        RedrawTracker.__view = view
+
+        return dirty
+
+    @staticmethod
+    def __get_allocations(batch: pyglet.graphics.Batch) -> tuple:
+        # Vertex lists being created or deleted change the allocated ranges of their domain, without touching buffers.
+        allocations: list[tuple[int, int, int]] = []
+        for domains in batch.group_map.values():
+            for domain in domains.values():
+                allocations.append((id(domain), len(domain.allocator.starts), sum(domain.allocator.sizes)))
+
+        return tuple(allocations)
+
+    @staticmethod
+    def __has_pending_data(batch: pyglet.graphics.Batch) -> bool:
+        # Groups being added or removed, e.g. when a sprite switches texture.
+        if batch._draw_list_dirty:
+            return True
+
+        # Vertex data written since the last draw, which uploads it and resets dirty flags.
+        for domains in batch.group_map.values():
+            for domain in domains.values():
+                for buffer, _ in domain.buffer_attributes:
+                    if buffer._dirty:
+                        return True
+
+        return False
@@ -0,0 +1,54 @@
+from typing import Callable
+import pyglet
+
+from amonite.scene_node import Bounds, SceneNode
+
+# Curtain state of amonite's scene, which has no public way of opening the curtain again.
+CURTAIN_ATTRIBUTES: tuple[str, str] = (
+    "_SceneNode__curtain_opening",
+    "_SceneNode__curtain_closing"
+)
+
+class ResumableSceneNode(SceneNode):
+    """
+    Scene node whose curtain can be opened again after closing, so that the scene can be resumed once left.
+    Curtain state is private to amonite's scene, so it's checked on creation: any upstream change fails right away
+    rather than leaving the curtain closed on resume.
+    """
+
+    def __init__(
+        self,
+        window: pyglet.window.BaseWindow,
+        view_width: int,
+        view_height: int,
+        title: str | None = None,
+        on_scene_start: Callable[[], None] | None = None,
+        on_scene_end: Callable[[], None] | None = None,
+        default_cam_speed: float = 10.0,
+        curtain_speed: float = 1.0,
+        cam_bounds: Bounds | None = None
+    ) -> None:
+        super().__init__(
+            window = window,
+            view_width = view_width,
+            view_height = view_height,
+            title = title,
+            on_scene_start = on_scene_start,
+            on_scene_end = on_scene_end,
+            default_cam_speed = default_cam_speed,
+            curtain_speed = curtain_speed,
+            cam_bounds = cam_bounds
+        )
+
+        for attribute in CURTAIN_ATTRIBUTES:
+            if not hasattr(self, attribute):
+                raise AttributeError(f"SceneNode has no {attribute}, so its curtain cannot be reopened")
+
+    def reopen(self) -> None:
+        """
+        Starts opening the curtain again, calling on_scene_start once it's open enough, just like when the scene was created.
+        """
+
+        opening, closing = CURTAIN_ATTRIBUTES
+        setattr(self, closing, False)
+        setattr(self, opening, True)
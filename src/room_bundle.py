@@ -0,0 +1,295 @@
+import array
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Callable, Iterable
+import pyglet
+
+from map_utils import read_pair
+
+# Bundle files header: magic, format version and index size.
+BUNDLE_MAGIC: bytes = b"RRB\x00"
+BUNDLE_VERSION: int = 2
+HEADER_FORMAT: str = "<4sII"
+
+# Binary data is aligned to this size, so that arrays can be read straight from the mapped file.
+DATA_ALIGNMENT: int = 8
+
+# Path (starting from the assets directory) where compiled bundles are stored.
+BUNDLES_PATH: str = "rooms"
+BUNDLE_EXTENSION: str = "room"
+
+def source_paths(name: str) -> list[str]:
+    """
+    Returns the paths (starting from the assets directory) of all source files room [name] is compiled from.
+    """
+
+    return [
+        f"tilemaps/{name}.tmx",
+        f"wallmaps/{name}.json",
+        f"fallmaps/{name}.json",
+        f"doormaps/{name}.json",
+        f"idlepropmaps/{name}.json",
+        f"propmaps/{name}.json"
+    ]
+
+def bundle_path(name: str) -> str:
+    """
+    Returns the absolute path of the compiled bundle of room [name].
+    """
+
+    return os.path.join(pyglet.resource.path[0], BUNDLES_PATH, f"{name}.{BUNDLE_EXTENSION}")
+
+def is_stale(name: str) -> bool:
+    """
+    Tells whether the compiled bundle of room [name] is missing or older than any of its sources.
+    Missing sources are ignored, so that builds can ship bundles only.
+    """
+
+    path: str = bundle_path(name)
+
+    if not os.path.exists(path):
+        return True
+
+    bundle_time: float = os.path.getmtime(path)
+    for source in source_paths(name):
+        source_path: str = os.path.join(pyglet.resource.path[0], source)
+
+        if os.path.exists(source_path) and os.path.getmtime(source_path) > bundle_time:
+            return True
+
+    return False
+
+class RoomBundle:
+    """
+    Compiled room, packing tile layers, walls, falls, doors and props of a room into a single binary file.
+
+    The file starts with a small json index (holding the string table, map info and arrays locations),
+    followed by tile layers as int16 (or int32 if needed) arrays, walls (already baked) and falls as float32 (x, y, width, height) records
+    and props as float32 (x, y) records.
+    Bundles are memory mapped when read, so tile layers are never copied.
+    Maps are exposed with the same structure as their json sources, except positions and sizes are already parsed pairs.
+    """
+
+    __slots__ = (
+        "map_width",
+        "map_height",
+        "tile_width",
+        "tile_height",
+        "tileset_sources",
+        "layers",
+        "walls",
+        "falls",
+        "doors",
+        "idle_props",
+        "props",
+        "__mmap"
+    )
+
+    def __init__(
+        self,
+        source_mmap: mmap.mmap
+    ) -> None:
+        self.__mmap: mmap.mmap = source_mmap
+
+        magic, version, index_size = struct.unpack_from(HEADER_FORMAT, source_mmap, 0)
+
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            raise ValueError("Unsupported room bundle")
+
+        index_start: int = struct.calcsize(HEADER_FORMAT)
+        index: dict = json.loads(source_mmap[index_start:index_start + index_size])
+        view: memoryview = memoryview(source_mmap)[RoomBundle.__align(index_start + index_size):]
+        strings: list[str] = index["strings"]
+
+        self.map_width: int
+        self.map_height: int
+        self.tile_width: int
+        self.tile_height: int
+        self.map_width, self.map_height, self.tile_width, self.tile_height = index["map"]
+        self.tileset_sources: list[str] = [strings[i] for i in index["tilesets"]]
+
+        # Tile layers are read straight from the mapped file.
+        self.layers: list[tuple[str, memoryview]] = [
+            (
+                strings[name],
+                view[offset:offset + count * array.array(typecode).itemsize].cast(typecode)
+            ) for name, typecode, offset, count in index["layers"]
+        ]
+
+        self.walls: dict = RoomBundle.__read_rects(view, strings, index["walls"])
+        self.falls: dict = RoomBundle.__read_rects(view, strings, index["falls"])
+        self.doors: dict = index["doors"]
+        self.idle_props: dict = RoomBundle.__read_points(view, strings, index["idle_props"])
+        self.props: dict = RoomBundle.__read_points(view, strings, index["props"])
+
+    @staticmethod
+    def load(name: str) -> "RoomBundle | None":
+        """
+        Reads and returns the compiled bundle of room [name].
+        Returns None if the bundle is stale or can't be read, in which case the room should be read from its sources.
+        """
+
+        # Arrays are stored little endian and mapped as they are.
+        if sys.byteorder != "little" or is_stale(name):
+            return None
+
+        try:
+            with open(file = bundle_path(name), mode = "rb") as bundle_file:
+                return RoomBundle(mmap.mmap(bundle_file.fileno(), 0, access = mmap.ACCESS_READ))
+        except (OSError, ValueError, KeyError, struct.error) as error:
+            print(f"Failed reading room bundle {name}: {error}")
+            return None
+
+    @staticmethod
+    def store(
+        name: str,
+        map_width: int,
+        map_height: int,
+        tile_width: int,
+        tile_height: int,
+        tileset_sources: list[str],
+        layers: list[tuple[str, Iterable[int]]],
+        walls: dict,
+        falls: dict,
+        doors: dict,
+        idle_props: dict,
+        props: dict
+    ) -> str:
+        """
+        Compiles all provided room data to the bundle file of room [name].
+        Maps are expected to be structured as their json sources.
+        Returns the path of the written bundle.
+        """
+
+        strings: list[str] = []
+        string_ids: dict[str, int] = {}
+
+        def string_id(value: str) -> int:
+            if value not in string_ids:
+                string_ids[value] = len(strings)
+                strings.append(value)
+
+            return string_ids[value]
+
+        data: bytearray = bytearray()
+
+        def append_array(values: array.array) -> tuple[int, int]:
+            offset: int = len(data)
+            if sys.byteorder != "little":
+                values.byteswap()
+            data.extend(values.tobytes())
+
+            # Pad to alignment.
+            data.extend(bytes(RoomBundle.__align(len(data)) - len(data)))
+
+            return (offset, len(values))
+
+        index: dict = {
+            "map": [map_width, map_height, tile_width, tile_height],
+            "tilesets": [string_id(source) for source in tileset_sources],
+            "layers": [
+                [string_id(layer_name), *RoomBundle.__layer_array(layer_data, append_array)] for layer_name, layer_data in layers
+            ],
+            "walls": [],
+            "falls": [],
+            "doors": doors,
+            "idle_props": [],
+            "props": []
+        }
+
+        # Walls and falls.
+        for key, source in (("walls", walls), ("falls", falls)):
+            for element in source["elements"] if "elements" in source else []:
+                rects: array.array = array.array("f")
+                for position, size in zip(element["positions"], element["sizes"]):
+                    rects.extend(read_pair(position))
+                    rects.extend(read_pair(size))
+
+                offset, count = append_array(rects)
+                index[key].append([[string_id(tag) for tag in element["tags"]], offset, count // 4])
+
+        # Props.
+        for key, source in (("idle_props", idle_props), ("props", props)):
+            for element in source["elements"] if "elements" in source else []:
+                points: array.array = array.array("f")
+                for position in element["positions"]:
+                    points.extend(read_pair(position))
+
+                offset, count = append_array(points)
+                index[key].append([string_id(element["id"]), offset, count // 2])
+
+        index["strings"] = strings
+        index_bytes: bytes = json.dumps(index, separators = (",", ":")).encode("UTF8")
+
+        header: bytes = struct.pack(HEADER_FORMAT, BUNDLE_MAGIC, BUNDLE_VERSION, len(index_bytes))
+        padding: bytes = bytes(RoomBundle.__align(len(header) + len(index_bytes)) - len(header) - len(index_bytes))
+
+        # Write to a temporary file first, so that a running game never reads a partial bundle.
+        path: str = bundle_path(name)
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        with open(file = f"{path}.tmp", mode = "wb") as dest_file:
+            dest_file.write(header)
+            dest_file.write(index_bytes)
+            dest_file.write(padding)
+            dest_file.write(data)
+        os.replace(f"{path}.tmp", path)
+
+        return path
+
+    @staticmethod
+    def __layer_array(
+        layer_data: Iterable[int],
+        append_array: Callable[[array.array], tuple[int, int]]
+    ) -> tuple[str, int, int]:
+        """
+        Appends the provided tile layer, using the smallest integer type able to hold all of its tile indices.
+        Returns the used typecode, offset and count.
+        """
+
+        values: array.array = array.array("i", layer_data)
+
+        # Tile indices are stored as int16 whenever possible, which halves the bundle size.
+        if len(values) <= 0 or (min(values) >= -0x8000 and max(values) < 0x8000):
+            values = array.array("h", values)
+
+        return (values.typecode, *append_array(values))
+
+    @staticmethod
+    def __align(size: int) -> int:
+        return (size + DATA_ALIGNMENT - 1) // DATA_ALIGNMENT * DATA_ALIGNMENT
+
+    @staticmethod
+    def __read_rects(
+        view: memoryview,
+        strings: list[str],
+        elements: list
+    ) -> dict:
+        result: list[dict] = []
+
+        for tags, offset, count in elements:
+            rects: list[tuple[float, float, float, float]] = list(struct.iter_unpack("<4f", view[offset:offset + count * 16]))
+            result.append({
+                "tags": [strings[tag] for tag in tags],
+                "positions": [(rect[0], rect[1]) for rect in rects],
+                "sizes": [(rect[2], rect[3]) for rect in rects]
+            })
+
+        return {"elements": result} if len(result) > 0 else {}
+
+    @staticmethod
+    def __read_points(
+        view: memoryview,
+        strings: list[str],
+        elements: list
+    ) -> dict:
+        result: list[dict] = [
+            {
+                "id": strings[id],
+                "positions": list(struct.iter_unpack("<2f", view[offset:offset + count * 8]))
+            } for id, offset, count in elements
+        ]
+
+        return {"elements": result} if len(result) > 0 else {}
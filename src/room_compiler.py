@@ -0,0 +1,35 @@
+import argparse
+import os.path
+import time
+import pyglet
+
+from room_preloader import RoomData
+
+def compile_rooms(names: list[str]) -> None:
+    """
+    Compiles all rooms in [names] to their binary bundles.
+    """
+
+    for name in names:
+        start_time: float = time.perf_counter()
+        path: str = RoomData(name = name, use_bundle = False).store()
+        print(f"Compiled {name} to {path} ({os.path.getsize(path)} bytes) in {(time.perf_counter() - start_time) * 1000:.2f}ms")
+
+if __name__ == "__main__":
+    # Set resources path.
+    pyglet.resource.path = [f"{os.path.dirname(__file__)}/../assets"]
+    pyglet.resource.reindex()
+
+    parser = argparse.ArgumentParser(description = "Compiles rooms to binary bundles, loaded in place of their tilemap and json map sources.")
+    parser.add_argument(
+        "rooms",
+        nargs = "*",
+        help = "names of the rooms to compile, all tilemaps are compiled if none is provided"
+    )
+    args = parser.parse_args()
+
+    rooms: list[str] = args.rooms or sorted(
+        file_name.split(".")[0] for file_name in os.listdir(f"{pyglet.resource.path[0]}/tilemaps") if file_name.endswith(".tmx")
+    )
+
+    compile_rooms(rooms)
@@ -0,0 +1,479 @@
+import json
+import os
+import queue
+import threading
+import time
+from typing import Generator, Sequence
+import xml.etree.ElementTree as xml
+import pyglet
+
+from amonite.settings import SETTINGS, Keys
+from amonite.sprite_node import SpriteNode
+from amonite.tilemap_node import TilemapNode, Tileset
+from amonite.utils import utils
+
+from idle_prop_loader import IdlePropLoader
+from props.idle_prop_registry import IdlePropRegistry
+from room_bundle import RoomBundle
+from tile_layer_node import TileLayerNode, TileSheet
+from walls_loader import WallsLoader
+
+# Tells whether tile layers are drawn as index textures (one quad per layer) by default, rather than one sprite per tile.
+DEFAULT_INDEX_TILE_LAYERS: bool = True
+
+# Maximum amount of time (in seconds) spent finishing preloaded rooms on each update.
+PRELOAD_TIME_BUDGET: float = 0.002
+
+TILESETS_PATH: str = "tilesets/rughai/"
+
+def read_map(source: str) -> dict:
+    """
+    Reads and returns the json map file provided in [source].
+    Returns an empty dictionary if the file is not found.
+    """
+
+    abs_path: str = os.path.join(pyglet.resource.path[0], source)
+
+    # Return empty data if the source file is not found.
+    if not os.path.exists(abs_path):
+        return {}
+
+    data: dict
+    with open(file = abs_path, mode = "r", encoding = "UTF8") as source_file:
+        data = json.load(source_file)
+
+    return data
+
+class RoomData:
+    """
+    All data needed to build a room, as read from its compiled bundle or from its tilemap and json map files.
+    No GL resource is involved in reading, so room data can be safely read from any thread.
+    """
+
+    __slots__ = (
+        "name",
+
+        # Tilemap data.
+        "map_width",
+        "map_height",
+        "tile_width",
+        "tile_height",
+        "tileset_sources",
+        "layers",
+
+        # Maps data.
+        "walls",
+        "falls",
+        "doors",
+        "dst_doormaps",
+        "idle_props",
+        "props",
+
+        # Names of all rooms reachable through doors.
+        "neighbours"
+    )
+
+    def __init__(
+        self,
+        name: str,
+        use_bundle: bool = True
+    ) -> None:
+        self.name: str = name
+
+        # Read the compiled room bundle if up to date, otherwise fall back to sources.
+        bundle: RoomBundle | None = RoomBundle.load(name) if use_bundle else None
+
+        self.map_width: int
+        self.map_height: int
+        self.tile_width: int
+        self.tile_height: int
+        self.tileset_sources: list[str]
+        self.layers: list[tuple[str, Sequence[int]]]
+        self.walls: dict
+        self.falls: dict
+        self.doors: dict
+        self.idle_props: dict
+        self.props: dict
+
+        if bundle is not None:
+            self.map_width = bundle.map_width
+            self.map_height = bundle.map_height
+            self.tile_width = bundle.tile_width
+            self.tile_height = bundle.tile_height
+            self.tileset_sources = bundle.tileset_sources
+            self.layers = bundle.layers
+            self.walls = bundle.walls
+            self.falls = bundle.falls
+            self.doors = bundle.doors
+            self.idle_props = bundle.idle_props
+            self.props = bundle.props
+        else:
+            self.__read_sources()
+
+        # Read destination doormaps, which are needed in order to place the player when traversing doors.
+        self.neighbours: list[str] = []
+        self.dst_doormaps: dict[str, dict] = {}
+        for element in self.doors["elements"] if "elements" in self.doors else []:
+            dst_room: str = element["dst_room"]
+
+            if dst_room not in self.neighbours:
+                self.neighbours.append(dst_room)
+
+            if "dst_door" in element and dst_room not in self.dst_doormaps:
+                self.dst_doormaps[dst_room] = RoomData.read_doors(dst_room, use_bundle = use_bundle)
+
+    @staticmethod
+    def read_doors(
+        name: str,
+        use_bundle: bool = True
+    ) -> dict:
+        """
+        Reads and returns the doormap of room [name], from its bundle if up to date or from its source otherwise.
+        """
+
+        bundle: RoomBundle | None = RoomBundle.load(name) if use_bundle else None
+
+        return bundle.doors if bundle is not None else read_map(f"doormaps/{name}.json")
+
+    def store(self) -> str:
+        """
+        Compiles the room data to its bundle file.
+        Returns the path of the written bundle.
+        """
+
+        return RoomBundle.store(
+            name = self.name,
+            map_width = self.map_width,
+            map_height = self.map_height,
+            tile_width = self.tile_width,
+            tile_height = self.tile_height,
+            tileset_sources = self.tileset_sources,
+            layers = self.layers,
+            walls = self.walls,
+            falls = self.falls,
+            doors = self.doors,
+            idle_props = self.idle_props,
+            props = self.props
+        )
+
+    def __read_sources(self) -> None:
+        # Read tilemap.
+        root = xml.parse(f"{pyglet.resource.path[0]}/tilemaps/{self.name}.tmx").getroot()
+
+        self.map_width = int(root.attrib["width"])
+        self.map_height = int(root.attrib["height"])
+        self.tile_width = int(root.attrib["tilewidth"])
+        self.tile_height = int(root.attrib["tileheight"])
+        self.tileset_sources = [
+            f"{TILESETS_PATH}{ts.attrib['source'].split('/')[-1].split('.')[0]}.png" for ts in root.findall("tileset")
+        ]
+
+        self.layers = []
+        for layer in root.findall("layer"):
+            layer_data = layer.find("data")
+
+            if layer_data is None or layer_data.text is None:
+                # The provided file does not contain valid information.
+                raise ValueError("TMX layer data not found")
+
+            # Remove all newline characters and split by comma.
+            self.layers.append((
+                layer.attrib["name"],
+                [int(i) - 1 for i in layer_data.text.replace("\n", "").split(",")]
+            ))
+
+        # Read maps.
+        # Walls are baked right away, so that compiled bundles store them already baked.
+        self.walls = WallsLoader.bake(read_map(f"wallmaps/{self.name}.json"))
+        self.falls = read_map(f"fallmaps/{self.name}.json")
+        self.doors = read_map(f"doormaps/{self.name}.json")
+        self.idle_props = read_map(f"idlepropmaps/{self.name}.json")
+        self.props = read_map(f"propmaps/{self.name}.json")
+
+class PreloadedRoom:
+    """
+    Room built from its data, holding all GL resources needed to render it.
+    Resources are created step by step, so that building can be spread across multiple updates.
+    """
+
+    __slots__ = (
+        "data",
+        "batch",
+        "tilemaps",
+        "bg",
+        "ready",
+        "__steps"
+    )
+
+    def __init__(
+        self,
+        data: RoomData
+    ) -> None:
+        self.data: RoomData = data
+
+        # All room graphics are created in a dedicated batch, which is then handed to the scene.
+        self.batch: pyglet.graphics.Batch = pyglet.graphics.Batch()
+        self.tilemaps: list[TilemapNode | TileLayerNode] = []
+        self.bg: SpriteNode | None = None
+
+        # Tells whether all building steps were performed.
+        self.ready: bool = False
+
+        self.__steps: Generator[None, None, None] = self.__build()
+
+    def step(self) -> bool:
+        """
+        Performs the next building step.
+        Returns whether the room is ready.
+        """
+
+        if not self.ready:
+            next(self.__steps, None)
+
+        return self.ready
+
+    def finish(self) -> None:
+        """
+        Performs all remaining building steps.
+        """
+
+        while not self.step():
+            pass
+
+    def delete(self) -> None:
+        for tilemap in self.tilemaps:
+            tilemap.delete()
+        self.tilemaps.clear()
+
+        if self.bg is not None:
+            self.bg.delete()
+            self.bg = None
+
+    def __build(self) -> Generator[None, None, None]:
+        # Tile grid lines are only drawn by tile sprites.
+        index_tile_layers: bool = (
+            SETTINGS.get("index_tile_layers", DEFAULT_INDEX_TILE_LAYERS) and
+            not (SETTINGS[Keys.DEBUG] and SETTINGS[Keys.SHOW_TILES_GRID])
+        )
+
+        if index_tile_layers:
+            yield from self.__build_tile_layers()
+        else:
+            yield from self.__build_tilemaps()
+
+        # Background.
+        bg_image = pyglet.resource.image("bg.png")
+        utils.set_anchor(bg_image, center = True)
+        self.bg = SpriteNode(
+            resource = bg_image,
+            x = (self.data.map_width * self.data.tile_width) // 2,
+            y = (self.data.map_height * self.data.tile_height) // 2,
+            y_sort = False,
+            z = -1500,
+            batch = self.batch
+        )
+        yield
+
+        # Idle prop definitions, one per step.
+        # Definitions cache usage is reported here, since scenes only find preloaded definitions later on.
+        # Other rooms may be built in between steps, so only count this room's own fetches.
+        hits: int = 0
+        misses: int = 0
+        for element in self.data.idle_props["elements"] if "elements" in self.data.idle_props else []:
+            previous_misses: int = IdlePropRegistry.misses
+            IdlePropRegistry.fetch(source = IdlePropLoader.definition_source(element["id"]))
+            if IdlePropRegistry.misses > previous_misses:
+                misses += 1
+            else:
+                hits += 1
+            yield
+
+        if SETTINGS[Keys.DEBUG]:
+            print(f"Idle prop definitions ({self.data.name}): {hits} hits, {misses} misses")
+
+        self.ready = True
+
+    def __build_tilemaps(self) -> Generator[None, None, None]:
+        # Tileset.
+        tileset: Tileset = Tileset(
+            sources = self.data.tileset_sources,
+            tile_width = self.data.tile_width,
+            tile_height = self.data.tile_height
+        )
+        yield
+
+        # Tilemap layers, one per step.
+        spacing: int = SETTINGS[Keys.LAYERS_Z_SPACING]
+        for layer_index, layer in enumerate(self.data.layers):
+            self.tilemaps.append(TilemapNode(
+                tileset = tileset,
+                data = layer[1],
+                map_width = self.data.map_width,
+                map_height = self.data.map_height,
+                # Only apply layers offset if not a rat layer.
+                z_offset = 0 if "rat" in layer[0] else spacing * (len(self.data.layers) - layer_index),
+                batch = self.batch
+            ))
+            yield
+
+    def __build_tile_layers(self) -> Generator[None, None, None]:
+        # Tile sheet.
+        sheet: TileSheet = TileSheet.fetch(
+            sources = self.data.tileset_sources,
+            tile_width = self.data.tile_width,
+            tile_height = self.data.tile_height
+        )
+        yield
+
+        # Tile layers, one per step.
+        spacing: int = SETTINGS[Keys.LAYERS_Z_SPACING]
+        for layer_index, layer in enumerate(self.data.layers):
+            self.tilemaps.append(TileLayerNode(
+                sheet = sheet,
+                data = layer[1],
+                map_width = self.data.map_width,
+                map_height = self.data.map_height,
+                # Only apply layers offset if not a rat layer.
+                z_offset = 0 if "rat" in layer[0] else spacing * (len(self.data.layers) - layer_index),
+                batch = self.batch
+            ))
+            yield
+
+class RoomPreloader:
+    """
+    Reads rooms data on a worker thread and builds their GL resources on the main thread,
+    a little on each update, so that entering a preloaded room only takes swapping in already built data.
+    """
+
+    def __init__(self) -> None:
+        # Rooms waiting to be read by the worker thread.
+        self.__requests: queue.Queue[str] = queue.Queue()
+
+        # Rooms handled by the worker thread, along with their data if successfully read.
+        self.__results: queue.Queue[tuple[str, RoomData | None]] = queue.Queue()
+
+        # Rooms currently wanted, either pending or preloaded.
+        self.__wanted: set[str] = set()
+        self.__wanted_lock: threading.Lock = threading.Lock()
+
+        # Rooms requested to the worker and not yet received.
+        self.__pending: set[str] = set()
+
+        # Pending rooms no longer wanted, which the worker may skip.
+        self.__dropped: set[str] = set()
+
+        self.__rooms: dict[str, PreloadedRoom] = {}
+
+        self.__worker: threading.Thread = threading.Thread(
+            target = self.__work,
+            name = "room_preloader",
+            daemon = True
+        )
+        self.__worker.start()
+
+    def preload(self, names: list[str]) -> None:
+        """
+        Starts preloading all rooms in [names].
+        Any previously preloaded room not in [names] is discarded.
+        """
+
+        with self.__wanted_lock:
+            self.__wanted = set(names)
+
+        # Discard unwanted rooms.
+        for name in list(self.__rooms.keys()):
+            if name not in names:
+                self.__rooms.pop(name).delete()
+
+        for name in self.__pending:
+            if name not in names:
+                self.__dropped.add(name)
+
+        # Request all new rooms, along with any dropped while pending, since the worker may have skipped them already.
+        for name in names:
+            if name in self.__rooms:
+                continue
+
+            if name not in self.__pending:
+                self.__pending.add(name)
+                self.__requests.put(name)
+            elif name in self.__dropped:
+                self.__dropped.discard(name)
+                self.__requests.put(name)
+
+    def take(self, name: str) -> PreloadedRoom | None:
+        """
+        Returns the preloaded room [name], finishing it if needed.
+        Returns None if the room was not read yet.
+        """
+
+        # Collect any room read in the meantime.
+        self.__collect()
+
+        room: PreloadedRoom | None = self.__rooms.pop(name, None)
+
+        if room is not None:
+            room.finish()
+
+        return room
+
+    def update(self) -> None:
+        """
+        Builds preloaded rooms for at most PRELOAD_TIME_BUDGET seconds.
+        Must be called from the main thread.
+        """
+
+        self.__collect()
+
+        start_time: float = time.perf_counter()
+        for room in self.__rooms.values():
+            while not room.ready:
+                room.step()
+
+                if time.perf_counter() - start_time > PRELOAD_TIME_BUDGET:
+                    return
+
+    def clear(self) -> None:
+        """
+        Discards all preloaded rooms.
+        """
+
+        self.preload([])
+
+    def __collect(self) -> None:
+        """
+        Moves all rooms read by the worker thread to the preloaded ones.
+        """
+
+        while not self.__results.empty():
+            name, data = self.__results.get()
+            self.__pending.discard(name)
+            self.__dropped.discard(name)
+
+            # Rooms requested again after being dropped may be received twice.
+            if data is None or name in self.__rooms:
+                continue
+
+            with self.__wanted_lock:
+                wanted: bool = name in self.__wanted
+
+            if wanted:
+                self.__rooms[name] = PreloadedRoom(data = data)
+
+    def __work(self) -> None:
+        while True:
+            name: str = self.__requests.get()
+
+            # Skip rooms no longer wanted.
+            with self.__wanted_lock:
+                wanted: bool = name in self.__wanted
+
+            if not wanted:
+                self.__results.put((name, None))
+                continue
+
+            try:
+                self.__results.put((name, RoomData(name = name)))
+            except (OSError, ValueError, xml.ParseError) as error:
+                print(f"Failed preloading room {name}: {error}")
+                self.__results.put((name, None))
@@ -0,0 +1,130 @@
+from collections import OrderedDict
+
+from playable_scene_node import PlayableSceneNode
+
+# Default maximum number of suspended scenes.
+DEFAULT_MAX_SCENES: int = 4
+
+# Default memory budget of all suspended scenes, in megabytes.
+DEFAULT_BUDGET: float = 32.0
+
+class SceneCacheStats:
+    """
+    Running counters of a scene cache.
+    """
+
+    __slots__ = (
+        "hits",
+        "misses",
+        "evictions",
+        "evicted_size",
+        "scenes",
+        "size"
+    )
+
+    def __init__(self) -> None:
+        # Rooms found (or not) when entered.
+        self.hits: int = 0
+        self.misses: int = 0
+
+        # Scenes evicted to make room, along with their total estimated size (in bytes).
+        self.evictions: int = 0
+        self.evicted_size: int = 0
+
+        # Currently suspended scenes, along with their total estimated size (in bytes).
+        self.scenes: int = 0
+        self.size: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"hits: {self.hits}, misses: {self.misses}, evictions: {self.evictions} ({self.evicted_size / 1024:.1f}KB), "
+            f"cached: {self.scenes} ({self.size / 1024:.1f}KB)"
+        )
+
+class SceneCache:
+    """
+    Least recently used cache of suspended playable scenes, by room name.
+    Scenes are suspended as they're left rather than deleted, so that entering a recently visited room is just a matter of resuming it.
+    Least recently left scenes are deleted whenever there are more than [max_scenes] or their estimated size exceeds [budget] megabytes.
+    """
+
+    def __init__(
+        self,
+        max_scenes: int = DEFAULT_MAX_SCENES,
+        budget: float = DEFAULT_BUDGET
+    ) -> None:
+        self.max_scenes: int = max_scenes
+        self.budget: int = int(budget * 1024 * 1024)
+
+        self.stats: SceneCacheStats = SceneCacheStats()
+
+        # Suspended scenes by room name, along with their estimated size, least recently left first.
+        self.__scenes: OrderedDict[str, tuple[PlayableSceneNode, int]] = OrderedDict()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__scenes
+
+    def store(self, scene: PlayableSceneNode) -> None:
+        """
+        Suspends the active [scene] and keeps it, evicting least recently left scenes if needed.
+        Scenes exceeding the whole budget on their own are just deleted.
+        """
+
+        size: int = scene.get_memory_size()
+
+        # Any scene previously stored for the same room is replaced.
+        if scene.name in self.__scenes:
+            self.__evict(name = scene.name)
+
+        # Scenes not kept are still suspended first, so that their colliders and interactions leave controllers along with them.
+        if self.max_scenes <= 0 or size > self.budget:
+            scene.suspend()
+            scene.delete()
+            return
+
+        scene.suspend()
+        self.__scenes[scene.name] = (scene, size)
+        self.stats.scenes += 1
+        self.stats.size += size
+
+        while len(self.__scenes) > self.max_scenes or self.stats.size > self.budget:
+            self.__evict(name = next(iter(self.__scenes)))
+
+    def take(self, name: str) -> PlayableSceneNode | None:
+        """
+        Removes and returns the suspended scene of room [name], which should then be resumed.
+        Returns None if not cached.
+        """
+
+        entry: tuple[PlayableSceneNode, int] | None = self.__scenes.pop(name, None)
+
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        self.stats.scenes -= 1
+        self.stats.size -= entry[1]
+
+        return entry[0]
+
+    def clear(self) -> None:
+        """
+        Deletes all suspended scenes.
+        """
+
+        for scene, _ in self.__scenes.values():
+            scene.delete()
+
+        self.__scenes.clear()
+        self.stats.scenes = 0
+        self.stats.size = 0
+
+    def __evict(self, name: str) -> None:
+        scene, size = self.__scenes.pop(name)
+        scene.delete()
+
+        self.stats.evictions += 1
+        self.stats.evicted_size += size
+        self.stats.scenes -= 1
+        self.stats.size -= size
@@ -11,6 +11,8 @@ class EditorTool(Node):
         self,
         on_icon_changed: Optional[Callable] = None
     ) -> None:
+        super().__init__()
+
         self.on_icon_changed: Optional[Callable] = on_icon_changed
 
         # Menu opening flag.
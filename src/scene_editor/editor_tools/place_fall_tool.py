@@ -1,19 +1,23 @@
 from typing import Callable
 import pyglet
 
-from constants import collision_tags, scenes
+from constants import collision_tags, scenes, uniques
 from amonite import controllers
 from amonite.fall_node import FALL_COLOR, FallNode
 from amonite.node import Node, PositionNode
 from amonite.shapes.rect_node import RectNode
 from editor_tools.editor_tool import EditorTool
 from amonite.text_node import TextNode
-from amonite.utils.utils import point_in_rect
 from falls_loader import FallsLoader
+from map_persistence import MapPersistence
+from rect_grid import RectGrid
 
 TOOL_COLOR: tuple[int, int, int, int] = FALL_COLOR
 ALT_COLOR: tuple[int, int, int, int] = (0x00, 0x44, 0xFF, 0x7F)
 
+# Side of the hit test index cells, in tiles.
+INDEX_CELL_TILES: int = 8
+
 class FallEditorMenuNode(Node):
     def __init__(
         self,
@@ -118,6 +122,10 @@ class PlaceFallTool(EditorTool):
 
         # list of all inserted nodes.
         self.__falls: list[FallNode] = []
+
+        # Spatial index of all inserted nodes, used for hit tests.
+        self.__falls_index: RectGrid[FallNode] = RectGrid(cell_size = tile_size[0] * INDEX_CELL_TILES)
+
         self.__load_falls()
 
         # Starting position of the fall currently being placed.
@@ -202,6 +210,7 @@ class PlaceFallTool(EditorTool):
 
                 # Save the newly created fall
                 self.__falls.append(fall)
+                self.__falls_index.insert(fall, (fall.x, fall.y, fall.width, fall.height))
 
                 uniques.ACTIVE_SCENE.add_child(fall)
 
@@ -213,11 +222,8 @@ class PlaceFallTool(EditorTool):
                     self.__current_fall.delete()
                     self.__current_fall = None
 
-        # Store the updated falls.
-        FallsLoader.store(
-            dest = f"{pyglet.resource.path[0]}/fallmaps/{self.__scene_name}.json",
-            falls = self.__falls
-        )
+                # Store the updated falls.
+                self.__save()
 
     def clear(self, map_position: tuple[int, int]) -> None:
         """
@@ -236,30 +242,37 @@ class PlaceFallTool(EditorTool):
                 map_position[1] * self.__tile_size[1] + self.__tile_size[1] / 2
             )
 
-            # Filter overlapping falls.
-            hit_falls: list[FallNode] = filter(
-                lambda fall: point_in_rect(
-                    test = test_position,
-                    rect_position = (fall.x, fall.y),
-                    rect_size = (fall.width, fall.height)
-                ),
-                self.__falls
-            )
-
             # Delete any fall overlapping the current map_position.
+            hit_falls: list[FallNode] = self.__falls_index.query_point(*test_position)
             for fall in hit_falls:
                 self.__falls.remove(fall)
+                self.__falls_index.remove(fall)
                 fall.delete()
 
+            # Only store falls if any was actually deleted.
+            if len(hit_falls) > 0:
+                self.__save()
+
+    def __save(self) -> None:
+        # Only take a snapshot here, since the file is serialized and written in the background.
+        MapPersistence.submit(
+            dest = f"{pyglet.resource.path[0]}/fallmaps/{self.__scene_name}.json",
+            data = FallsLoader.to_data(falls = self.__falls)
+        )
+
     def __load_falls(self) -> None:
         # Delete all existing falls.
         for fall in self.__falls:
             if fall is not None:
                 fall.delete()
         self.__falls.clear()
+        self.__falls_index.clear()
 
         # Recreate all of them from fallmap files.
         self.__falls = FallsLoader.fetch(
             source = f"fallmaps/{self.__scene_name}.json",
             batch = self.__world_batch
-        )
\ No newline at end of file
+        )
+
+        for fall in self.__falls:
+            self.__falls_index.insert(fall, (fall.x, fall.y, fall.width, fall.height))
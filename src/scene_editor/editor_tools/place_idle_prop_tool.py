@@ -1,8 +1,7 @@
-import copy
 import sys
 import os
 import json
-from typing import Callable
+from typing import Callable, NamedTuple
 import pyglet
 
 from amonite.cursor_input_handler import CursorInputHandler
@@ -13,6 +12,7 @@ sys.path.append(os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__
 from amonite import controllers
 from amonite.node import Node, PositionNode
 from idle_prop_loader import IdlePropLoader
+from map_persistence import MapPersistence
 from amonite.shapes.rect_node import RectNode
 from amonite.sprite_node import SpriteNode
 from amonite.text_node import TextNode
@@ -21,6 +21,14 @@ from editor_tool import EditorTool
 TOOL_COLOR: tuple[int, int, int, int] = (0x22, 0x44, 0x66, 0xAA)
 ALT_COLOR: tuple[int, int, int, int] = (0xFF, 0x00, 0x00, 0x7F)
 
+class IdlePropEdit(NamedTuple):
+    """
+    Single undoable edit, as the (prop name, position) pairs it added and removed.
+    """
+
+    added: tuple[tuple[str, tuple[int, int]], ...]
+    removed: tuple[tuple[str, tuple[int, int]], ...]
+
 class EditorMenuTitleNode(PositionNode):
     def __init__(
         self,
@@ -256,13 +264,19 @@ class PlaceIdlePropTool(EditorTool):
         self.__tilemap_width: int = tilemap_width
         self.__tilemap_height: int = tilemap_height
 
-        self.__prop_sets: list[dict[str, set[tuple[int, int]]]] = [
-            IdlePropLoader.fetch_positions(source = f"idlepropmaps/{scene_name}.json")
-        ]
-        self.__current_props_index: int = 0
+        # Live props by (prop name, position).
+        self.__props: dict[tuple[str, tuple[int, int]], IdlePropNode] = {}
 
-        self.__props: list[IdlePropNode] = []
-        self.__refresh_props()
+        # Names of the props in each position.
+        self.__positions: dict[tuple[int, int], set[str]] = {}
+
+        for prop_name, positions in IdlePropLoader.fetch_positions(source = f"idlepropmaps/{scene_name}.json").items():
+            for position in positions:
+                self.__add_prop(prop_name = prop_name, position = position)
+
+        # Edits history, only the first [__history_index] edits are currently applied.
+        self.__history: list[IdlePropEdit] = []
+        self.__history_index: int = 0
 
         self.__menu: IdlePropEditorMenuNode = IdlePropEditorMenuNode(
             prop_names = self.__prop_names,
@@ -332,58 +346,109 @@ class PlaceIdlePropTool(EditorTool):
                 )
             )
 
-        IdlePropLoader.store(
-            dest = f"{pyglet.resource.path[0]}/idlepropmaps/{self.__scene_name}.json",
-            props = self.__props
-        )
-
     def place_prop(self, position: tuple[int, int]) -> None:
-        # Clear history until the current index is reached.
-        self.__prop_sets = self.__prop_sets[0:self.__current_props_index + 1]
-
-        # Add an entry in the prop sets history.
-        self.__prop_sets.append(copy.deepcopy(self.__prop_sets[self.__current_props_index]))
-
-        prop_sets_size = len(self.__prop_sets)
-        if prop_sets_size > 20:
-            self.__prop_sets = self.__prop_sets[prop_sets_size - 20:prop_sets_size]
-        else:
-            self.__current_props_index += 1
+        prop_name: str = self.__menu.get_current_prop()
 
-        # Add the currently selected prop if the interaction button was pressed.
-        if self.__menu.get_current_prop() not in list(self.__prop_sets[self.__current_props_index].keys()):
-            self.__prop_sets[self.__current_props_index][self.__menu.get_current_prop()] = set()
-        self.__prop_sets[self.__current_props_index][self.__menu.get_current_prop()].add(position)
+        # Nothing to do if the same prop is already there.
+        if (prop_name, position) in self.__props:
+            return
 
-        # Refresh props to apply changes.
-        self.__refresh_props()
+        self.__push(IdlePropEdit(added = ((prop_name, position),), removed = ()))
 
     def clear(self, position: tuple[int, int]) -> None:
         """
         Deletes any prop in the current map position, regardless of the selected prop.
         """
 
-        # Loop through prop types and delete any in the given position.
-        for prop_set in list(self.__prop_sets[self.__current_props_index].values()):
-            prop_set.discard(position)
+        prop_names: set[str] = self.__positions.get(position, set())
 
-        # Refresh props to apply changes.
-        self.__refresh_props()
+        # Nothing to do if there's no prop there.
+        if len(prop_names) <= 0:
+            return
+
+        self.__push(IdlePropEdit(added = (), removed = tuple((prop_name, position) for prop_name in sorted(prop_names))))
 
     def undo(self) -> None:
         super().undo()
 
-        self.__current_props_index -= 1
-        if self.__current_props_index < 0:
-            self.__current_props_index = 0
-        self.__refresh_props()
+        if self.__history_index <= 0:
+            return
+
+        self.__history_index -= 1
+        edit: IdlePropEdit = self.__history[self.__history_index]
+        self.__apply(added = edit.removed, removed = edit.added)
 
     def redo(self) -> None:
         super().redo()
-        self.__current_props_index += 1
-        if self.__current_props_index > len(self.__prop_sets) - 1:
-            self.__current_props_index = len(self.__prop_sets) - 1
-        self.__refresh_props()
+
+        if self.__history_index >= len(self.__history):
+            return
+
+        edit: IdlePropEdit = self.__history[self.__history_index]
+        self.__history_index += 1
+        self.__apply(added = edit.added, removed = edit.removed)
+
+    def __push(self, edit: IdlePropEdit) -> None:
+        # Drop any undone edit, then apply the new one.
+        del self.__history[self.__history_index:]
+        self.__history.append(edit)
+        self.__history_index += 1
+
+        self.__apply(added = edit.added, removed = edit.removed)
+
+    def __apply(
+        self,
+        added: tuple[tuple[str, tuple[int, int]], ...],
+        removed: tuple[tuple[str, tuple[int, int]], ...]
+    ) -> None:
+        """
+        Applies a diff to the live props, only touching the ones in [added] and [removed], then stores the result.
+        """
+
+        for prop_name, position in removed:
+            self.__remove_prop(prop_name = prop_name, position = position)
+
+        for prop_name, position in added:
+            self.__add_prop(prop_name = prop_name, position = position)
+
+        # Only take a snapshot here, since the file is serialized and written in the background.
+        MapPersistence.submit(
+            dest = f"{pyglet.resource.path[0]}/idlepropmaps/{self.__scene_name}.json",
+            data = IdlePropLoader.to_data(props = list(self.__props.values()))
+        )
+
+    def __add_prop(
+        self,
+        prop_name: str,
+        position: tuple[int, int]
+    ) -> None:
+        if (prop_name, position) in self.__props:
+            return
+
+        self.__props[(prop_name, position)] = IdlePropLoader.map_prop(
+            prop_name,
+            x = position[0],
+            y = position[1],
+            batch = self.__world_batch
+        )
+        self.__positions.setdefault(position, set()).add(prop_name)
+
+    def __remove_prop(
+        self,
+        prop_name: str,
+        position: tuple[int, int]
+    ) -> None:
+        prop: IdlePropNode | None = self.__props.pop((prop_name, position), None)
+
+        if prop is None:
+            return
+
+        prop.delete()
+
+        prop_names: set[str] = self.__positions[position]
+        prop_names.discard(prop_name)
+        if len(prop_names) <= 0:
+            del self.__positions[position]
 
     def __load_prop_names(self, source: str) -> dict[str, list[str]]:
         data: dict[str, list[str]]
@@ -393,23 +458,3 @@ class PlaceIdlePropTool(EditorTool):
             data = json.load(content)
 
         return data
-
-    def __refresh_props(self) -> None:
-        # Delete all existing props.
-        for prop in self.__props:
-            if prop is not None:
-                prop.delete()
-        self.__props.clear()
-
-        # Recreate all of them starting from prop maps.
-        for prop_name in list(self.__prop_sets[self.__current_props_index].keys()):
-            for position in self.__prop_sets[self.__current_props_index][prop_name]:
-                prop = IdlePropLoader.map_prop(
-                    prop_name,
-                    x = position[0],
-                    y = position[1],
-                    batch = self.__world_batch
-                )
-
-                if prop is not None:
-                    self.__props.append(prop)
\ No newline at end of file
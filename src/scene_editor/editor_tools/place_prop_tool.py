@@ -13,6 +13,7 @@ sys.path.append(os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__
 from amonite import controllers
 from amonite.node import Node, PositionNode
 from prop_loader import PropLoader
+from map_persistence import MapPersistence
 from amonite.shapes.rect_node import RectNode
 from amonite.sprite_node import SpriteNode
 from amonite.text_node import TextNode
@@ -333,9 +334,10 @@ class PlacePropTool(EditorTool):
                 )
             )
 
-        PropLoader.store(
+        # Only take a snapshot here, since the file is serialized and written in the background.
+        MapPersistence.submit(
             dest = f"{pyglet.resource.path[0]}/propmaps/{self.__scene_name}.json",
-            props = self.__props
+            data = PropLoader.to_data(props = self.__props)
         )
 
     def place_prop(self, position: tuple[int, int]) -> None:
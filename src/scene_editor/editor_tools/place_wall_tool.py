@@ -1,20 +1,24 @@
 from typing import Callable
 import pyglet
 
-from constants import collision_tags
+from constants import collision_tags, uniques
 from amonite import controllers
 from amonite.node import Node, PositionNode
 from amonite.shapes.rect_node import RectNode
 from editor_tools.editor_tool import EditorTool
 from amonite.text_node import TextNode
-from amonite.utils.utils import point_in_rect
 from amonite.wall_node import WALL_COLOR
 from amonite.wall_node import WallNode
-from amonite.utils.walls_loader import WallsLoader
+from map_persistence import MapPersistence
+from rect_grid import RectGrid
+from walls_loader import WallsLoader
 
 TOOL_COLOR: tuple[int, int, int, int] = WALL_COLOR
 ALT_COLOR: tuple[int, int, int, int] = (0xFF, 0x7F, 0x00, 0x7F)
 
+# Side of the hit test index cells, in tiles.
+INDEX_CELL_TILES: int = 8
+
 class WallEditorMenuNode(Node):
     def __init__(
         self,
@@ -119,6 +123,10 @@ class PlaceWallTool(EditorTool):
 
         # list of all inserted nodes.
         self.__walls: list[WallNode] = []
+
+        # Spatial index of all inserted nodes, used for hit tests.
+        self.__walls_index: RectGrid[WallNode] = RectGrid(cell_size = tile_size[0] * INDEX_CELL_TILES)
+
         self.__load_walls()
 
         # Starting position of the wall currently being placed.
@@ -203,6 +211,7 @@ class PlaceWallTool(EditorTool):
 
                 # Save the newly created wall
                 self.__walls.append(wall)
+                self.__walls_index.insert(wall, (wall.x, wall.y, wall.width, wall.height))
 
                 uniques.ACTIVE_SCENE.add_child(wall)
 
@@ -214,11 +223,8 @@ class PlaceWallTool(EditorTool):
                     self.__current_wall.delete()
                     self.__current_wall = None
 
-        # Store the updated walls.
-        WallsLoader.store(
-            dest = f"{pyglet.resource.path[0]}/wallmaps/{self.__scene_name}.json",
-            walls = self.__walls
-        )
+                # Store the updated walls.
+                self.__save()
 
     def clear(self, map_position: tuple[int, int]) -> None:
         """
@@ -237,30 +243,37 @@ class PlaceWallTool(EditorTool):
                 map_position[1] * self.__tile_size[1] + self.__tile_size[1] / 2
             )
 
-            # Filter overlapping walls.
-            hit_walls: list[WallNode] = filter(
-                lambda wall: point_in_rect(
-                    test = test_position,
-                    rect_position = (wall.x, wall.y),
-                    rect_size = (wall.width, wall.height)
-                ),
-                self.__walls
-            )
-
             # Delete any wall overlapping the current map_position.
+            hit_walls: list[WallNode] = self.__walls_index.query_point(*test_position)
             for wall in hit_walls:
                 self.__walls.remove(wall)
+                self.__walls_index.remove(wall)
                 wall.delete()
 
+            # Only store walls if any was actually deleted.
+            if len(hit_walls) > 0:
+                self.__save()
+
+    def __save(self) -> None:
+        # Only take a snapshot here, since the file is serialized and written in the background.
+        MapPersistence.submit(
+            dest = f"{pyglet.resource.path[0]}/wallmaps/{self.__scene_name}.json",
+            data = WallsLoader.to_data(walls = self.__walls)
+        )
+
     def __load_walls(self) -> None:
         # Delete all existing walls.
         for wall in self.__walls:
             if wall is not None:
                 wall.delete()
         self.__walls.clear()
+        self.__walls_index.clear()
 
         # Recreate all of them from wallmap files.
         self.__walls = WallsLoader.fetch(
             source = f"wallmaps/{self.__scene_name}.json",
             batch = self.__world_batch
-        )
\ No newline at end of file
+        )
+
+        for wall in self.__walls:
+            self.__walls_index.insert(wall, (wall.x, wall.y, wall.width, wall.height))
@@ -11,6 +11,7 @@ from amonite.tilemap_node import TilemapNode
 from amonite.settings import SETTINGS, Keys
 from amonite.map_cursor_node import MapCursorNode
 
+from map_persistence import MapPersistence
 from editor_tools.editor_tool import EditorTool, PlaceDoorTool
 from editor_tools.place_idle_prop_tool import PlaceIdlePropTool
 from editor_tools.place_wall_tool import PlaceWallTool
@@ -144,7 +145,7 @@ class PropPlacementScene(Node):
         self.__current_room: int = 0
 
         # All tools are in this dictionary.
-        self.__tools: list[EditorTool]
+        self.__tools: list[EditorTool] = []
 
         # Editor tool.
         self.__current_tool: int = 0
@@ -211,6 +212,12 @@ class PropPlacementScene(Node):
             uniques.ACTIVE_SCENE.update(dt)
 
     def delete(self) -> None:
+        for tool in self.__tools:
+            tool.delete()
+
+        # Write any pending map change, so that maps are never read back stale nor lost on exit.
+        MapPersistence.flush()
+
         if uniques.ACTIVE_SCENE is not None:
             uniques.ACTIVE_SCENE.delete()
 
@@ -111,5 +111,8 @@ class RugHaiSceneEditor:
         # pyglet.clock.schedule(self.update)
         pyglet.app.run()
 
+        # Make sure all pending edits are saved before quitting.
+        self.__scene.delete()
+
 app = RugHaiSceneEditor()
 app.run()
\ No newline at end of file
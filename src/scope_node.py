@@ -1,5 +1,4 @@
 from enum import Enum
-import os
 import pyglet
 from amonite.animation import Animation
 
@@ -8,6 +7,12 @@ from amonite.settings import SETTINGS, Keys
 from amonite.sprite_node import SpriteNode
 from amonite.state_machine import State, StateMachine
 
+from animation_library import AnimationLibrary
+from shader_library import ShaderLibrary
+
+# Scope transparency, shared by all scopes.
+SCOPE_ALPHA: float = 0.5
+
 class ScopeStates(str, Enum):
     IDLE = "idle"
     LOAD = "load"
@@ -40,12 +45,12 @@ class ScopeNode(PositionNode):
 
         # State sprite.
         self.animations: list[Animation] = [
-            Animation(source = "sprites/scope/scope_load_0.json"),
-            Animation(source = "sprites/scope/scope_load_0.json"),
-            Animation(source = "sprites/scope/scope_load_1.json"),
-            Animation(source = "sprites/scope/scope_load_2.json"),
-            Animation(source = "sprites/scope/scope_load_3.json"),
-            Animation(source = "sprites/scope/scope_load_4.json")
+            AnimationLibrary.get(source = "sprites/scope/scope_load_0.json"),
+            AnimationLibrary.get(source = "sprites/scope/scope_load_0.json"),
+            AnimationLibrary.get(source = "sprites/scope/scope_load_1.json"),
+            AnimationLibrary.get(source = "sprites/scope/scope_load_2.json"),
+            AnimationLibrary.get(source = "sprites/scope/scope_load_3.json"),
+            AnimationLibrary.get(source = "sprites/scope/scope_load_4.json")
         ]
 
         self.animations.reverse()
@@ -53,34 +58,29 @@ class ScopeNode(PositionNode):
         # Distance between each sprite.
         self.sprites_delta: float = 0.0
 
-        # Load fragment source from file.
-        fragment_source: str
-        with open(
-            file = os.path.join(pyglet.resource.path[0], "../shaders/alpha_blend.frag"),
-            mode = "r",
-            encoding = "UTF8"
-        ) as file:
-            fragment_source = file.read()
-
-        # Create shader program from vector and fragment.
-        vert_shader = pyglet.graphics.shader.Shader(pyglet.sprite.vertex_source, "vertex")
-        frag_shader = pyglet.graphics.shader.Shader(fragment_source, "fragment")
-        shader_program = pyglet.graphics.shader.ShaderProgram(vert_shader, frag_shader)
-        shader_program["alpha"] = 0.5
+        # Position, direction and delta the sprites were last placed with.
+        self.__sprites_state: tuple | None = None
+
+        # Fetch the shared alpha blending program and the group applying scope alpha to it.
+        shader_program = ShaderLibrary.get_program(fragment = "alpha_blend.frag")
+        shader_group = ShaderLibrary.get_group(
+            fragment = "alpha_blend.frag",
+            uniforms = {"alpha": SCOPE_ALPHA}
+        )
 
         # Create sprites.
         self.sprites: list[SpriteNode] = []
         for animation in self.animations:
-            self.sprites.append(
-                SpriteNode(
-                    resource = animation.content,
-                    x = x,
-                    y = y,
-                    y_sort = False,
-                    shader = shader_program,
-                    batch = batch
-                )
+            sprite: SpriteNode = SpriteNode(
+                resource = animation.content,
+                x = x,
+                y = y,
+                y_sort = False,
+                shader = shader_program,
+                batch = batch
             )
+            sprite.sprite.group = shader_group
+            self.sprites.append(sprite)
 
         # State machine.
         self.__state_machine = StateMachine(
@@ -102,6 +102,12 @@ class ScopeNode(PositionNode):
     ) -> None:
         super().set_position(position = position, z = z)
 
+        # Avoid rewriting sprites if nothing moved, so that frames can be skipped.
+        sprites_state: tuple = (position[0], position[1], self.direction, self.sprites_delta)
+        if sprites_state == self.__sprites_state:
+            return
+        self.__sprites_state = sprites_state
+
         aim_vec = pyglet.math.Vec2.from_polar(self.sprite_distance, self.direction)
         for index, sprite in enumerate(self.sprites):
             sprite.set_position(
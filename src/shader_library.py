@@ -0,0 +1,119 @@
+import os
+from typing import Any
+import pyglet
+
+class UniformsGroup(pyglet.graphics.ShaderGroup):
+    """
+    Rendering group which sets a fixed set of uniform values on a shared shader program before any of its children are drawn.
+    This allows many sprites to share the same linked program while still using different uniform values.
+    """
+
+    def __init__(
+        self,
+        program: pyglet.graphics.shader.ShaderProgram,
+        uniforms: dict[str, Any],
+        order: int = 0,
+        parent: pyglet.graphics.Group | None = None
+    ) -> None:
+        super().__init__(
+            program = program,
+            order = order,
+            parent = parent
+        )
+
+        self.uniforms: tuple[tuple[str, Any], ...] = tuple(sorted(uniforms.items()))
+
+    def set_state(self) -> None:
+        super().set_state()
+
+        for name, value in self.uniforms:
+            self.program[name] = value
+
+    def __eq__(self, other) -> bool:
+        return super().__eq__(other) and self.uniforms == other.uniforms
+
+    def __hash__(self) -> int:
+        return hash((self.order, self.parent, self.program, self.uniforms))
+
+class ShaderLibrary:
+    """
+    Shader programs, compiled and linked once per (vertex, fragment) pair.
+    Shader files are read from the shaders directory, next to the assets one.
+    """
+
+    __programs: dict[tuple[str | None, str], pyglet.graphics.shader.ShaderProgram] = {}
+    __groups: dict[tuple[str | None, str, tuple[tuple[str, Any], ...]], UniformsGroup] = {}
+
+    @staticmethod
+    def get_program(
+        fragment: str,
+        vertex: str | None = None
+    ) -> pyglet.graphics.shader.ShaderProgram:
+        """
+        Returns the program linked from the [vertex] and [fragment] shader files.
+        If [vertex] is not provided, then pyglet's default sprite vertex shader is used.
+        """
+
+        key: tuple[str | None, str] = (vertex, fragment)
+        program: pyglet.graphics.shader.ShaderProgram | None = ShaderLibrary.__programs.get(key)
+
+        if program is None:
+            # Create shader program from vertex and fragment.
+            vert_shader = pyglet.graphics.shader.Shader(
+                ShaderLibrary.__read_source(vertex) if vertex is not None else pyglet.sprite.vertex_source,
+                "vertex"
+            )
+            frag_shader = pyglet.graphics.shader.Shader(ShaderLibrary.__read_source(fragment), "fragment")
+            program = pyglet.graphics.shader.ShaderProgram(vert_shader, frag_shader)
+
+            ShaderLibrary.__programs[key] = program
+
+        return program
+
+    @staticmethod
+    def get_group(
+        fragment: str,
+        uniforms: dict[str, Any],
+        vertex: str | None = None
+    ) -> UniformsGroup:
+        """
+        Returns a rendering group applying the provided [uniforms] to the shared program linked from [vertex] and [fragment].
+        Sprites should be assigned both the shared program and the returned group.
+        """
+
+        key = (vertex, fragment, tuple(sorted(uniforms.items())))
+        group: UniformsGroup | None = ShaderLibrary.__groups.get(key)
+
+        if group is None:
+            group = UniformsGroup(
+                program = ShaderLibrary.get_program(fragment = fragment, vertex = vertex),
+                uniforms = uniforms
+            )
+
+            ShaderLibrary.__groups[key] = group
+
+        return group
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Deletes all cached programs and groups.
+        """
+
+        for program in ShaderLibrary.__programs.values():
+            program.delete()
+
+        ShaderLibrary.__programs.clear()
+        ShaderLibrary.__groups.clear()
+
+    @staticmethod
+    def __read_source(name: str) -> str:
+        source: str
+        with open(
+            file = os.path.join(pyglet.resource.path[0], "../shaders", name),
+            mode = "r",
+            encoding = "UTF8"
+        ) as file:
+            source = file.read()
+
+        return source
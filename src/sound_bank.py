@@ -0,0 +1,90 @@
+import pyglet
+
+import amonite.controllers as controllers
+from amonite.settings import SETTINGS, Keys
+
+from voice_pool import DEFAULT_VOICES, DEFAULT_VOICES_PER_EFFECT, VoicePool, VoicePoolStats
+
+class SoundBank:
+    """
+    Sound effects and background music.
+    Effects are decoded once, as static sources. Nothing is loaded when the matching sound settings are disabled.
+    Effects are played through a shared voice pool, so that their number and cost stay bounded however many are fired.
+    Background music is streamed, and keeps playing across scenes as long as they ask for the same track.
+    """
+
+    __effects: dict[str, pyglet.media.StaticSource] = {}
+
+    # Voices all effects are played through, created along with the first effect played.
+    __voices: VoicePool | None = None
+
+    # Name of the track currently played as background music.
+    __music: str | None = None
+
+    @staticmethod
+    def effects_enabled() -> bool:
+        return SETTINGS[Keys.SOUND] and SETTINGS[Keys.SFX]
+
+    @staticmethod
+    def music_enabled() -> bool:
+        return SETTINGS[Keys.SOUND] and SETTINGS[Keys.MUSIC]
+
+    @staticmethod
+    def get_effect(name: str) -> pyglet.media.StaticSource | None:
+        """
+        Returns the decoded sound effect [name], relative to the assets directory.
+        Returns None if sound effects are disabled.
+        """
+
+        if not SoundBank.effects_enabled():
+            return None
+
+        effect: pyglet.media.StaticSource | None = SoundBank.__effects.get(name)
+
+        if effect is None:
+            effect = pyglet.resource.media(name = name, streaming = False)
+            SoundBank.__effects[name] = effect
+
+        return effect
+
+    @staticmethod
+    def play_effect(effect: pyglet.media.StaticSource | None) -> None:
+        """
+        Plays the provided sound [effect], if any.
+        """
+
+        if effect is None:
+            return
+
+        if SoundBank.__voices is None:
+            SoundBank.__voices = VoicePool(
+                voices = SETTINGS.get("sfx_voices", DEFAULT_VOICES),
+                voices_per_effect = SETTINGS.get("sfx_voices_per_effect", DEFAULT_VOICES_PER_EFFECT)
+            )
+
+        SoundBank.__voices.play(effect = effect)
+
+    @staticmethod
+    def get_voice_stats() -> VoicePoolStats | None:
+        """
+        Returns the counters of the sound effects voice pool, or None if no effect was played yet.
+        """
+
+        return SoundBank.__voices.stats if SoundBank.__voices is not None else None
+
+    @staticmethod
+    def play_music(name: str) -> None:
+        """
+        Plays track [name] as background music, unless it's already playing.
+        Nothing is loaded if music is disabled.
+        """
+
+        if not SoundBank.music_enabled():
+            return
+
+        if name == SoundBank.__music and controllers.SOUND_CONTROLLER.bg_music.source is not None:
+            return
+
+        controllers.SOUND_CONTROLLER.set_music(pyglet.resource.media(name = name))
+        SoundBank.__music = name
+
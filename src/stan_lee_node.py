@@ -60,6 +60,14 @@ class StanLeeNode(PropNode):
             ui_batch = ui_batch
         )
 
+    def sleep(self) -> None:
+        super().sleep()
+        self.sprite.sprite.paused = True
+
+    def wake(self) -> None:
+        super().wake()
+        self.sprite.sprite.paused = False
+
     def update(self, dt: int) -> None:
         super().update(dt = dt)
         self.dialog.update(dt)
@@ -0,0 +1,104 @@
+import json
+import os
+import pyglet
+
+# Atlases directory, relative to the assets directory.
+ATLASES_DIR: str = "atlases"
+
+# Frame index file name, stored along with atlases.
+ATLAS_INDEX_NAME: str = "atlas_index.json"
+
+ATLAS_INDEX_VERSION: int = 1
+
+class TextureAtlas:
+    """
+    Frames of baked texture atlases.
+    Atlases are built offline by atlas_builder.py, which packs all animation frames into a few large textures and writes a frame index
+    mapping every source image to the atlas regions of its frames.
+    The frame index is structured as follows:
+
+    version[int]: index format version.
+    atlases[array]: atlas file names, relative to the atlases directory.
+    images[object]: baked images by source path (relative to the assets directory). Every element is structured as follows:
+        mtime_ns[int]: modification time of the source image when baked, used to detect stale frames.
+        rows[int|null]: number of rows the image was split into, null for gif animations.
+        columns[int|null]: number of columns the image was split into, null for gif animations.
+        frames[array]: array of all frames, each as [atlas index, x, y, width, height, duration].
+    """
+
+    __images: dict[str, dict] | None = None
+    __atlases: list[str] = []
+    __textures: dict[int, pyglet.image.Texture] = {}
+
+    @staticmethod
+    def get_animation(
+        path: str,
+        rows: int | None = None,
+        columns: int | None = None
+    ) -> pyglet.image.Animation | None:
+        """
+        Returns a new animation built from the baked frames of the image at [path], relative to the assets directory.
+        Non gif images are expected to be baked as a [rows] x [columns] grid.
+        Returns None if the image was not baked, was baked with a different grid or was modified after baking.
+        """
+
+        image: dict | None = TextureAtlas.__get_images().get(path)
+
+        if image is None:
+            return None
+
+        # Grids only apply to spritesheets.
+        if not path.endswith(".gif") and (image["rows"] != (rows or 1) or image["columns"] != (columns or 1)):
+            return None
+
+        # Ignore frames baked from an outdated image.
+        source_path: str = os.path.join(pyglet.resource.path[0], path)
+        if not os.path.exists(source_path) or os.stat(source_path).st_mtime_ns != image["mtime_ns"]:
+            return None
+
+        # Always create new regions, so that anchoring one animation does not affect others built from the same image.
+        return pyglet.image.Animation(frames = [
+            pyglet.image.AnimationFrame(
+                image = TextureAtlas.__get_texture(atlas).get_region(x, y, width, height),
+                duration = duration
+            ) for atlas, x, y, width, height, duration in image["frames"]
+        ])
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Drops the loaded frame index and atlas textures, forcing them to be loaded again on next use.
+        """
+
+        TextureAtlas.__images = None
+        TextureAtlas.__atlases = []
+        TextureAtlas.__textures.clear()
+
+    @staticmethod
+    def __get_images() -> dict[str, dict]:
+        if TextureAtlas.__images is None:
+            TextureAtlas.__images = {}
+
+            index_path: str = os.path.join(pyglet.resource.path[0], ATLASES_DIR, ATLAS_INDEX_NAME)
+            if os.path.exists(index_path):
+                with open(file = index_path, mode = "r", encoding = "UTF8") as index_file:
+                    index: dict = json.load(index_file)
+
+                # Just ignore atlases baked in any other format.
+                if index.get("version") == ATLAS_INDEX_VERSION:
+                    TextureAtlas.__images = index["images"]
+                    TextureAtlas.__atlases = index["atlases"]
+
+        return TextureAtlas.__images
+
+    @staticmethod
+    def __get_texture(atlas: int) -> pyglet.image.Texture:
+        texture: pyglet.image.Texture | None = TextureAtlas.__textures.get(atlas)
+
+        if texture is None:
+            texture = pyglet.image.load(
+                os.path.join(pyglet.resource.path[0], ATLASES_DIR, TextureAtlas.__atlases[atlas])
+            ).get_texture()
+            TextureAtlas.__textures[atlas] = texture
+
+        return texture
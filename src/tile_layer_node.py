@@ -0,0 +1,254 @@
+import math
+from typing import Sequence
+import pyglet
+import pyglet.gl as gl
+
+from amonite.node import PositionNode
+from amonite.scene_node import Bounds
+from amonite.settings import GLOBALS, SETTINGS, Keys
+
+from shader_library import ShaderLibrary
+
+class TileSheet:
+    """
+    Single texture holding all tiles of a tileset, laid out in rows of [columns] tiles starting from the bottom left corner.
+    Tiles are indexed exactly like amonite's Tileset does, so tile layers data can be used as it is.
+    Sheets are built once for every set of sources and shared by all layers using them.
+    """
+
+    __slots__ = (
+        "texture",
+        "columns",
+        "tile_width",
+        "tile_height"
+    )
+
+    __sheets: dict[tuple[tuple[str, ...], int, int], "TileSheet"] = {}
+
+    def __init__(
+        self,
+        sources: Sequence[str],
+        tile_width: int,
+        tile_height: int
+    ) -> None:
+        self.tile_width: int = tile_width
+        self.tile_height: int = tile_height
+
+        # Cut tiles from all sources, top to bottom and left to right.
+        tiles: list[pyglet.image.ImageDataRegion] = []
+        for source in sources:
+            image: pyglet.image.ImageData = pyglet.resource.image(source).get_image_data()
+            for y in range(0, image.height, tile_height):
+                for x in range(0, image.width, tile_width):
+                    tiles.append(image.get_region(x, image.height - y - tile_height, tile_width, tile_height))
+
+        self.columns: int = max(1, math.ceil(math.sqrt(len(tiles))))
+        rows: int = max(1, math.ceil(len(tiles) / self.columns))
+
+        self.texture: pyglet.image.Texture = pyglet.image.Texture.create(
+            width = self.columns * tile_width,
+            height = rows * tile_height,
+            min_filter = gl.GL_NEAREST,
+            mag_filter = gl.GL_NEAREST
+        )
+        for index, tile in enumerate(tiles):
+            self.texture.blit_into(tile, (index % self.columns) * tile_width, (index // self.columns) * tile_height, 0)
+
+    @staticmethod
+    def fetch(
+        sources: Sequence[str],
+        tile_width: int,
+        tile_height: int
+    ) -> "TileSheet":
+        """
+        Returns the tile sheet of the tileset made of all [sources], building it if needed.
+        """
+
+        key: tuple[tuple[str, ...], int, int] = (tuple(sources), tile_width, tile_height)
+        sheet: TileSheet | None = TileSheet.__sheets.get(key)
+
+        if sheet is None:
+            sheet = TileSheet(sources = sources, tile_width = tile_width, tile_height = tile_height)
+            TileSheet.__sheets[key] = sheet
+
+        return sheet
+
+class TileLayerGroup(pyglet.graphics.ShaderGroup):
+    """
+    Rendering group binding the tile sheet and index texture of a single tile layer, along with its uniforms.
+    Blending and depth testing are set up the same way as for tile sprites.
+    """
+
+    def __init__(
+        self,
+        program: pyglet.graphics.shader.ShaderProgram,
+        sheet: TileSheet,
+        indices: pyglet.image.Texture,
+        origin_y: float,
+        z_offset: float,
+        order: int = 0,
+        parent: pyglet.graphics.Group | None = None
+    ) -> None:
+        super().__init__(
+            program = program,
+            order = order,
+            parent = parent
+        )
+
+        self.sheet: TileSheet = sheet
+        self.indices: pyglet.image.Texture = indices
+        self.origin_y: float = origin_y
+        self.z_offset: float = z_offset
+
+    def set_state(self) -> None:
+        super().set_state()
+
+        gl.glActiveTexture(gl.GL_TEXTURE1)
+        gl.glBindTexture(self.indices.target, self.indices.id)
+        gl.glActiveTexture(gl.GL_TEXTURE0)
+        gl.glBindTexture(self.sheet.texture.target, self.sheet.texture.id)
+
+        self.program["tile_sheet"] = 0
+        self.program["tile_indices"] = 1
+        self.program["sheet_columns"] = self.sheet.columns
+        self.program["tile_size"] = (self.sheet.tile_width, self.sheet.tile_height)
+        self.program["origin_y"] = self.origin_y
+        self.program["z_offset"] = self.z_offset
+
+        gl.glEnable(gl.GL_BLEND)
+        gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
+
+        gl.glEnable(gl.GL_DEPTH_TEST)
+        gl.glDepthFunc(gl.GL_LESS)
+
+    def unset_state(self) -> None:
+        gl.glDisable(gl.GL_BLEND)
+        gl.glDisable(gl.GL_DEPTH_TEST)
+
+        super().unset_state()
+
+    # Every layer binds its own index texture, so groups are never merged.
+    def __eq__(self, other) -> bool:
+        return self is other
+
+    def __hash__(self) -> int:
+        return id(self)
+
+class TileLayerNode(PositionNode):
+    """
+    Tile layer drawn as a single quad, in place of a sprite per tile as TilemapNode does.
+    Layer data is uploaded as an integer index texture (one texel per tile), which is looked up by tile.frag
+    along with the tile sheet, so that tiles are still depth sorted one by one just like tile sprites.
+    """
+
+    def __init__(
+        self,
+        sheet: TileSheet,
+        data: Sequence[int],
+        map_width: int,
+        map_height: int,
+        x: float = 0,
+        y: float = 0,
+        z_offset: int = 0,
+        batch: pyglet.graphics.Batch | None = None
+    ) -> None:
+        super().__init__(
+            x = x,
+            y = y
+        )
+
+        self.__sheet: TileSheet = sheet
+        self.map_width: int = map_width
+        self.map_height: int = map_height
+
+        self.__indices: pyglet.image.Texture | None = None
+        self.__vertex_list: pyglet.graphics.vertexdomain.IndexedVertexList | None = None
+
+        # Empty layers are not drawn at all.
+        if any(index >= 0 for index in data):
+            self.__indices = pyglet.image.Texture.create(
+                width = map_width,
+                height = map_height,
+                internalformat = None,
+                min_filter = gl.GL_NEAREST,
+                mag_filter = gl.GL_NEAREST
+            )
+            gl.glTexImage2D(
+                gl.GL_TEXTURE_2D,
+                0,
+                gl.GL_R32I,
+                map_width,
+                map_height,
+                0,
+                gl.GL_RED_INTEGER,
+                gl.GL_INT,
+                (gl.GLint * len(data))(*data)
+            )
+
+            program: pyglet.graphics.shader.ShaderProgram = ShaderLibrary.get_program(fragment = "tile.frag", vertex = "tile.vert")
+
+            # Layer size, in unscaled pixels.
+            width: int = map_width * sheet.tile_width
+            height: int = map_height * sheet.tile_height
+            scaling: float = GLOBALS[Keys.SCALING]
+
+            self.__vertex_list = program.vertex_list_indexed(
+                4,
+                gl.GL_TRIANGLES,
+                [0, 1, 2, 0, 2, 3],
+                batch,
+                TileLayerGroup(
+                    program = program,
+                    sheet = sheet,
+                    indices = self.__indices,
+                    origin_y = y,
+                    z_offset = z_offset
+                ),
+                position = ("f", (
+                    x, y,
+                    x + width * scaling, y,
+                    x + width * scaling, y + height * scaling,
+                    x, y + height * scaling
+                )),
+                map_coords = ("f", (
+                    0, 0,
+                    width, 0,
+                    width, height,
+                    0, height
+                ))
+            )
+
+        # Compute bounds.
+        self.bounds = Bounds(
+            bottom = SETTINGS[Keys.TILEMAP_BUFFER] * sheet.tile_height,
+            right = (map_width - SETTINGS[Keys.TILEMAP_BUFFER]) * sheet.tile_width,
+            left = SETTINGS[Keys.TILEMAP_BUFFER] * sheet.tile_width,
+            top = (map_height - SETTINGS[Keys.TILEMAP_BUFFER]) * sheet.tile_height
+        )
+
+    def delete(self) -> None:
+        if self.__vertex_list is not None:
+            self.__vertex_list.delete()
+            self.__vertex_list = None
+
+        if self.__indices is not None:
+            self.__indices.delete()
+            self.__indices = None
+
+    def get_memory_size(self) -> int:
+        """
+        Returns the size (in bytes) of the layer's index texture.
+        """
+
+        return self.map_width * self.map_height * 4 if self.__indices is not None else 0
+
+    def get_bounding_box(self):
+        return (
+            self.x * GLOBALS[Keys.SCALING],
+            self.y * GLOBALS[Keys.SCALING],
+            self.map_width * self.__sheet.tile_width * GLOBALS[Keys.SCALING],
+            self.map_height * self.__sheet.tile_height * GLOBALS[Keys.SCALING]
+        )
+
+    def get_tile_size(self) -> tuple[int, int]:
+        return (self.__sheet.tile_width, self.__sheet.tile_height)
@@ -0,0 +1,164 @@
+import argparse
+import os.path
+import sys
+import pyglet
+
+# Headless mode needs to be set before any window or GL module is imported.
+if __name__ == "__main__" and "--headless" in sys.argv:
+    pyglet.options["headless"] = True
+
+import pyglet.gl as gl
+
+from amonite.settings import GLOBALS, SETTINGS, Keys, load_settings
+
+# Size (in pixels) of the probe sprites placed all over rooms, which are depth sorted against tiles.
+PROBE_SIZE: tuple[int, int] = (8, 16)
+
+# Distance (in pixels) between probe sprites.
+PROBE_SPACING: int = 37
+
+def render_room(
+    window: pyglet.window.BaseWindow,
+    name: str,
+    index_tile_layers: bool,
+    views: list[tuple[int, int]]
+) -> list[bytes]:
+    """
+    Builds room [name] with tile layers drawn either as index textures or as tile sprites, according to [index_tile_layers],
+    then renders it once for each camera offset in [views].
+    Returns the RGBA framebuffer contents of all views.
+    """
+
+    from amonite.shaded_sprite import ShadedSprite
+    from room_preloader import PreloadedRoom, RoomData
+
+    SETTINGS["index_tile_layers"] = index_tile_layers
+
+    room: PreloadedRoom = PreloadedRoom(data = RoomData(name = name))
+    room.finish()
+
+    # Probe sprites are sorted by their y coordinate, just like props and characters.
+    probe_image: pyglet.image.ImageData = pyglet.image.SolidColorImagePattern((255, 0, 255, 255)).create_image(*PROBE_SIZE)
+    probes: list[ShadedSprite] = []
+    for x in range(0, room.data.map_width * room.data.tile_width, PROBE_SPACING):
+        for y in range(0, room.data.map_height * room.data.tile_height, PROBE_SPACING):
+            probes.append(ShadedSprite(img = probe_image, x = x, y = y, z = -y, batch = room.batch))
+
+    frames: list[bytes] = []
+    width, height = window.get_framebuffer_size()
+    for view in views:
+        window.view = pyglet.math.Mat4.from_translation(pyglet.math.Vec3(-view[0], -view[1], 0))
+        window.clear()
+        room.batch.draw()
+
+        pixels = (gl.GLubyte * (width * height * 4))()
+        gl.glReadPixels(0, 0, width, height, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, pixels)
+        frames.append(bytes(pixels))
+
+    for probe in probes:
+        probe.delete()
+    room.delete()
+
+    return frames
+
+def count_differences(a: bytes, b: bytes) -> int:
+    """
+    Returns the number of RGBA pixels differing between framebuffers [a] and [b].
+    """
+
+    return sum(1 for pixel_a, pixel_b in zip(memoryview(a).cast("I"), memoryview(b).cast("I")) if pixel_a != pixel_b)
+
+def check_rooms(
+    window: pyglet.window.BaseWindow,
+    names: list[str],
+    dest: str | None = None
+) -> int:
+    """
+    Renders all rooms in [names] through both tile layer paths and compares their output.
+    Differing framebuffers are written to the [dest] directory, if any.
+    Returns the number of differing views.
+    """
+
+    from room_preloader import RoomData
+
+    width, height = window.get_framebuffer_size()
+    mismatches: int = 0
+
+    for name in names:
+        data: RoomData = RoomData(name = name)
+        room_width: int = data.map_width * data.tile_width
+        room_height: int = data.map_height * data.tile_height
+
+        # Cover the whole room with views, one window size at a time.
+        views: list[tuple[int, int]] = [
+            (x, y) for x in range(0, room_width, width) for y in range(0, room_height, height)
+        ]
+
+        sprite_frames: list[bytes] = render_room(window = window, name = name, index_tile_layers = False, views = views)
+        index_frames: list[bytes] = render_room(window = window, name = name, index_tile_layers = True, views = views)
+
+        for view, sprite_frame, index_frame in zip(views, sprite_frames, index_frames):
+            differences: int = count_differences(sprite_frame, index_frame)
+            print(f"{name} {view}: {differences} differing pixels")
+
+            if differences <= 0:
+                continue
+
+            mismatches += 1
+            if dest is not None:
+                os.makedirs(dest, exist_ok = True)
+                for label, frame in (("sprites", sprite_frame), ("index", index_frame)):
+                    pyglet.image.ImageData(width, height, "RGBA", frame).save(os.path.join(dest, f"{name}_{view[0]}_{view[1]}_{label}.png"))
+
+    return mismatches
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Renders rooms with tile layers drawn as index textures and as tile sprites, and compares the resulting frames.")
+    parser.add_argument(
+        "rooms",
+        nargs = "*",
+        help = "names of the rooms to check, all tilemaps are checked if none is provided"
+    )
+    parser.add_argument("--headless", action = "store_true", help = "use a headless (EGL) GL context instead of a hidden window, e.g. for software GL")
+    parser.add_argument("--dest", help = "directory to write differing frames to, as png")
+    args = parser.parse_args()
+
+    # Set resources path.
+    pyglet.resource.path = [f"{os.path.dirname(__file__)}/../assets"]
+    pyglet.resource.reindex()
+
+    # Load settings from file.
+    load_settings(f"{pyglet.resource.path[0]}/settings.json")
+
+    # Only room graphics are compared, at pixel-perfect scaling.
+    SETTINGS[Keys.DEBUG] = False
+    GLOBALS[Keys.SCALING] = 1
+
+    window: pyglet.window.BaseWindow = pyglet.window.Window(
+        width = SETTINGS[Keys.VIEW_WIDTH],
+        height = SETTINGS[Keys.VIEW_HEIGHT],
+        visible = False
+    )
+
+    # Same projection used by the game.
+    window.projection = pyglet.math.Mat4.orthogonal_projection(
+        left = 0,
+        right = window.width,
+        bottom = 0,
+        top = window.height,
+        z_near = -3000,
+        z_far = 3000
+    )
+
+    rooms: list[str] = args.rooms or sorted(
+        file_name.split(".")[0] for file_name in os.listdir(f"{pyglet.resource.path[0]}/tilemaps") if file_name.endswith(".tmx")
+    )
+
+    mismatches: int = check_rooms(window = window, names = rooms, dest = args.dest)
+    window.close()
+
+    if mismatches > 0:
+        print(f"{mismatches} views differ")
+        sys.exit(1)
+
+    print("All views match")
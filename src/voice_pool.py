@@ -0,0 +1,135 @@
+import random
+import pyglet
+
+from amonite.utils import utils
+
+# Default number of sound effects that can play at the same time.
+DEFAULT_VOICES: int = 8
+
+# Default number of instances of the same sound effect that can play at the same time.
+DEFAULT_VOICES_PER_EFFECT: int = 3
+
+class VoicePoolStats:
+    """
+    Running counters of a voice pool.
+    """
+
+    __slots__ = (
+        "played",
+        "active",
+        "stolen"
+    )
+
+    def __init__(self) -> None:
+        # Effects played so far.
+        self.played: int = 0
+
+        # Voices playing as of the last effect played.
+        self.active: int = 0
+
+        # Voices cut short in order to play another effect.
+        self.stolen: int = 0
+
+    def __str__(self) -> str:
+        return f"played: {self.played}, active: {self.active}, stolen: {self.stolen}"
+
+class Voice:
+    """
+    Reusable player, along with the effect it's playing.
+    """
+
+    __slots__ = (
+        "player",
+        "effect",
+        "started"
+    )
+
+    def __init__(self) -> None:
+        self.player: pyglet.media.Player = pyglet.media.Player()
+        self.effect: pyglet.media.StaticSource | None = None
+
+        # Play sequence number, used to find the oldest voices.
+        self.started: int = 0
+
+    def is_playing(self) -> bool:
+        # Players drop their source as soon as it's over.
+        return self.player.source is not None
+
+    def stop(self) -> None:
+        if self.is_playing():
+            self.player.next_source()
+
+class VoicePool:
+    """
+    Fixed set of players sound effects are played through, so that no player is created or deleted while playing.
+    At most [voices] effects play at the same time, and at most [voices_per_effect] of them can be the same effect:
+    when either limit is hit, the oldest voice (playing the same effect, if that's the limit hit) is stolen for the new effect.
+    Effects are pitch shifted randomly, just like amonite's sound controller does.
+    """
+
+    def __init__(
+        self,
+        voices: int = DEFAULT_VOICES,
+        voices_per_effect: int = DEFAULT_VOICES_PER_EFFECT
+    ) -> None:
+        self.voices_per_effect: int = max(1, voices_per_effect)
+
+        self.stats: VoicePoolStats = VoicePoolStats()
+
+        self.__voices: list[Voice] = [Voice() for _ in range(max(1, voices))]
+        self.__plays: int = 0
+
+    def play(self, effect: pyglet.media.StaticSource) -> None:
+        """
+        Plays the provided [effect] on a free voice, stealing one if needed.
+        """
+
+        voice: Voice = self.__get_voice(effect = effect)
+
+        if voice.is_playing():
+            voice.stop()
+            self.stats.stolen += 1
+
+        self.__plays += 1
+        voice.effect = effect
+        voice.started = self.__plays
+
+        voice.player.queue(effect)
+        voice.player.pitch = utils.scale(val = random.random(), src = (0.0, 1.0), dst = (0.8, 1.2))
+        voice.player.play()
+
+        self.stats.played += 1
+        self.stats.active = sum(1 for voice in self.__voices if voice.is_playing())
+
+    def stop(self) -> None:
+        """
+        Stops all playing effects.
+        """
+
+        for voice in self.__voices:
+            voice.stop()
+
+        self.stats.active = 0
+
+    def delete(self) -> None:
+        for voice in self.__voices:
+            voice.stop()
+            voice.player.delete()
+
+        self.__voices.clear()
+
+    def __get_voice(self, effect: pyglet.media.StaticSource) -> Voice:
+        playing: list[Voice] = [voice for voice in self.__voices if voice.is_playing()]
+
+        # Replace the oldest instance of the same effect if already playing too many of them.
+        same: list[Voice] = [voice for voice in playing if voice.effect is effect]
+        if len(same) >= self.voices_per_effect:
+            return min(same, key = lambda voice: voice.started)
+
+        # Take any free voice.
+        for voice in self.__voices:
+            if not voice.is_playing():
+                return voice
+
+        # Replace the oldest effect otherwise.
+        return min(playing, key = lambda voice: voice.started)
@@ -0,0 +1,121 @@
+import pyglet
+
+from amonite.utils.walls_loader import WallsLoader as BaseWallsLoader
+from amonite.wall_node import WallNode
+
+from map_persistence import write_map
+from map_utils import merge_rects, read_pair
+
+
+class WallsLoader(BaseWallsLoader):
+    @staticmethod
+    def from_data(
+        data: dict,
+        batch: pyglet.graphics.Batch | None = None
+    ) -> list[WallNode]:
+        """
+        Creates and returns the list of walls defined by the provided wallmap [data].
+        """
+
+        walls_list: list[WallNode] = []
+
+        # Just return if no data is read.
+        if len(data) <= 0:
+            return []
+
+        # Loop through defined wall types.
+        for element in data["elements"]:
+            positions: list[str | tuple[float, float]] = element["positions"]
+            sizes: list[str | tuple[float, float]] = element["sizes"]
+
+            assert len(positions) == len(sizes)
+
+            # Loop through single walls.
+            for i in range(len(positions)):
+                position: tuple[float, float] = read_pair(positions[i])
+                size: tuple[float, float] = read_pair(sizes[i])
+
+                # Create a new wall node and add it to the result.
+                walls_list.append(WallNode(
+                    x = position[0],
+                    y = position[1],
+                    width = size[0],
+                    height = size[1],
+                    tags = element["tags"],
+                    batch = batch
+                ))
+
+        return walls_list
+
+    @staticmethod
+    def bake(data: dict) -> dict:
+        """
+        Returns a copy of the provided wallmap [data] where walls sharing the same tags are merged into as few walls as possible,
+        covering the same area.
+        Baked walls collide the same as the original ones, but leave less colliders to test and no seams to get stuck on.
+        """
+
+        # Just return if no data is read.
+        if len(data) <= 0:
+            return data
+
+        # Group walls by tags.
+        rects_by_tags: dict[tuple[str, ...], list[tuple[float, float, float, float]]] = {}
+        for element in data["elements"]:
+            rects: list[tuple[float, float, float, float]] = rects_by_tags.setdefault(tuple(element["tags"]), [])
+            for position, size in zip(element["positions"], element["sizes"]):
+                rects.append((*read_pair(position), *read_pair(size)))
+
+        result: list[dict] = []
+        for tags, rects in rects_by_tags.items():
+            merged: list[tuple[float, float, float, float]] = merge_rects(rects)
+            result.append({
+                "tags": list(tags),
+                "positions": [(rect[0], rect[1]) for rect in merged],
+                "sizes": [(rect[2], rect[3]) for rect in merged]
+            })
+
+        return {
+            "elements": result
+        }
+
+    @staticmethod
+    def to_data(walls: list[WallNode]) -> dict:
+        """
+        Returns the wallmap data storing all provided [walls], ready to be serialized.
+        Walls are internally sorted by tags.
+        """
+
+        # Group walls by tags.
+        walls_data: dict[str, list[WallNode]] = {}
+        for wall in walls:
+            key: str = ",".join(wall.tags)
+            if not key in walls_data:
+                walls_data[key] = [wall]
+            else:
+                walls_data[key].append(wall)
+
+        # Prepare walls data for storage.
+        result: list[dict[str, list[str]]] = []
+        for key, value in walls_data.items():
+            element: dict[str, list[str]] = {
+                "tags": key.split(","),
+                "positions": list(map(lambda w: f"{w.x},{w.y}", value)),
+                "sizes": list(map(lambda w: f"{w.width},{w.height}", value)),
+            }
+            result.append(element)
+
+        return {
+            "elements": result
+        }
+
+    @staticmethod
+    def store(
+        dest: str,
+        walls: list[WallNode]
+    ) -> None:
+        """
+        Saves a wallmap file to store all provided [walls].
+        """
+
+        write_map(dest = dest, data = WallsLoader.to_data(walls = walls))
@@ -0,0 +1,41 @@
+from bisect import bisect
+import random
+from typing import Generic, Iterable, TypeVar
+
+T = TypeVar("T")
+
+class WeightedSampler(Generic[T]):
+    """
+    Weighted random picker over a fixed set of items.
+    The cumulative weights table is built once, so that every pick only costs a random number and a binary search.
+    Picks match random.choices() with the same weights, given the same generator state.
+    """
+
+    __slots__ = (
+        "items",
+        "__cum_weights",
+        "__total"
+    )
+
+    def __init__(self, weighted_items: Iterable[tuple[T, float]]) -> None:
+        cum_weights: list[float] = []
+        total: float = 0.0
+        items: list[T] = []
+        for item, weight in weighted_items:
+            total += weight
+            items.append(item)
+            cum_weights.append(total)
+
+        self.items: tuple[T, ...] = tuple(items)
+        self.__cum_weights: tuple[float, ...] = tuple(cum_weights)
+        self.__total: float = total
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self, rng: random.Random) -> T:
+        """
+        Picks a random item using the provided [rng], with probability proportional to its weight.
+        """
+
+        return self.items[bisect(self.__cum_weights, rng.random() * self.__total, 0, len(self.items) - 1)]